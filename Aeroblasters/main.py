@@ -3,8 +3,11 @@
 # Author : Prajjwal Pathak (pyguru)
 # Date : Thursday, 30 September, 2021
 
+import os
+import sys
 import random
 import pygame
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # gamebox_engine, for `python main.py`
 from objects import Background, Player, Enemy, Bullet, Explosion, Fuel, \
 					Powerup, Button, Message, BlinkingText
 
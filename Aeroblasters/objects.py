@@ -1,5 +1,7 @@
 import pygame
 
+from gamebox_engine import animation, assets
+
 SCREEN = WIDTH, HEIGHT = 288, 512
 
 pygame.mixer.init()
@@ -93,19 +95,19 @@ class Enemy(pygame.sprite.Sprite):
 		self.image_list = []
 		for i in range(2):
 			if type_ == 1:
-				img = pygame.image.load(f'Assets/Enemies/enemy1-{i+1}.png')
+				path = f'Assets/Enemies/enemy1-{i+1}.png'
 			if type_ == 2:
-				img = pygame.image.load(f'Assets/Enemies/enemy2-{i+1}.png')
+				path = f'Assets/Enemies/enemy2-{i+1}.png'
 			if type_ == 3:
-				img = pygame.image.load(f'Assets/Enemies/enemy3-{i+1}.png')
+				path = f'Assets/Enemies/enemy3-{i+1}.png'
 			if type_ == 4:
-				img = pygame.image.load(f'Assets/Choppers/chopper1-{i+1}.png')
+				path = f'Assets/Choppers/chopper1-{i+1}.png'
 			if type_ == 5:
-				img = pygame.image.load(f'Assets/Choppers/chopper2-{i+1}.png')
+				path = f'Assets/Choppers/chopper2-{i+1}.png'
 
-			w, h = img.get_width(), img.get_height()
+			w, h = assets.load_image(path).get_size()
 			height = (100 * h) // w
-			img = pygame.transform.scale(img, (100, height))
+			img = assets.load_image(path, scale=(100, height))
 
 			self.image_list.append(img)
 
@@ -181,20 +183,15 @@ class Bullet(pygame.sprite.Sprite):
 			powerup_bullet = True
 
 		if type_ == 1:
-			self.image = pygame.image.load('Assets/Bullets/1.png')
-			self.image = pygame.transform.scale(self.image, (20, 40))
+			self.image = assets.load_image('Assets/Bullets/1.png', scale=(20, 40))
 		if type_ == 2:
-			self.image = pygame.image.load('Assets/Bullets/2.png')
-			self.image = pygame.transform.scale(self.image, (15, 30))
+			self.image = assets.load_image('Assets/Bullets/2.png', scale=(15, 30))
 		if type_ == 3:
-			self.image = pygame.image.load('Assets/Bullets/3.png')
-			self.image = pygame.transform.scale(self.image, (20, 40))
+			self.image = assets.load_image('Assets/Bullets/3.png', scale=(20, 40))
 		if type_ in (4, 5):
-			self.image = pygame.image.load('Assets/Bullets/4.png')
-			self.image = pygame.transform.scale(self.image, (20, 20))
+			self.image = assets.load_image('Assets/Bullets/4.png', scale=(20, 20))
 		if type_ == 6:
-			self.image = pygame.image.load('Assets/Bullets/red_fire.png')
-			self.image = pygame.transform.scale(self.image, (15, 30))
+			self.image = assets.load_image('Assets/Bullets/red_fire.png', scale=(15, 30))
 
 		self.rect = self.image.get_rect(center=(x, y))
 		if type_ == 6 or powerup_bullet:
@@ -223,40 +220,35 @@ class Bullet(pygame.sprite.Sprite):
 		win.blit(self.image, self.rect)
 
 
-class Explosion(pygame.sprite.Sprite):
-	def __init__(self, x, y, type_):
-		super(Explosion, self).__init__()
-
+explosion_clips = {} # type_ -> AnimationClip shared by every explosion of that type
 
-		self.img_list = []
-		if type_ == 1:
-			self.length = 3
-		elif type_ == 2:
-			self.length = 8
-
-		for i in range(self.length):
-			img = pygame.image.load(f'Assets/Explosion{type_}/{i+1}.png')
-			w, h = img.get_size()
+def explosion_clip(type_):
+	if type_ not in explosion_clips:
+		length = 3 if type_ == 1 else 8
+		frames = []
+		for i in range(length):
+			path = f'Assets/Explosion{type_}/{i+1}.png'
+			w, h = assets.load_image(path).get_size()
 			width = int(w * 0.40)
 			height = int(w * 0.40)
-			img = pygame.transform.scale(img, (width, height))
-			self.img_list.append(img)
+			frames.append(assets.load_image(path, scale=(width, height)))
+		explosion_clips[type_] = animation.AnimationClip(frames, frame_ticks=7, loop=False)
+	return explosion_clips[type_]
 
-		self.index = 0
-		self.image = self.img_list[self.index]
-		self.rect = self.image.get_rect(center=(x, y))
+class Explosion(pygame.sprite.Sprite):
+	def __init__(self, x, y, type_):
+		super(Explosion, self).__init__()
 
-		self.counter = 0
+		self.animation = animation.Playhead(explosion_clip(type_))
+		self.image = self.animation.image
+		self.rect = self.image.get_rect(center=(x, y))
 
 	def update(self):
-		self.counter += 1
-		if self.counter >= 7:
-			self.index += 1
-			if self.index >= self.length:
-				self.kill()
-			else:
-				self.image = self.img_list[self.index]
-				self.counter = 0
+		self.animation.update()
+		if self.animation.finished:
+			self.kill()
+		else:
+			self.image = self.animation.image
 
 		
 	def draw(win):
@@ -267,7 +259,7 @@ class Fuel(pygame.sprite.Sprite):
 	def __init__(self, x, y):
 		super(Fuel, self).__init__()
 
-		self.image = pygame.image.load('Assets/fuel.png')
+		self.image = assets.load_image('Assets/fuel.png')
 		self.rect = self.image.get_rect(center=(x, y))
 
 	def update(self):
@@ -282,7 +274,7 @@ class Powerup(pygame.sprite.Sprite):
 	def __init__(self, x, y):
 		super(Powerup, self).__init__()
 
-		self.image = pygame.image.load('Assets/powerup.png')
+		self.image = assets.load_image('Assets/powerup.png')
 		self.rect = self.image.get_rect(center=(x, y))
 
 	def update(self):
@@ -1,7 +1,10 @@
+import os
+import sys
 import random
 import pygame
 from pygame.locals import KEYDOWN, QUIT, K_ESCAPE, K_SPACE, K_q, K_e
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # gamebox_engine, for `python main.py`
 from objects import Rocket, Asteroid, Bullet, Explosion
 
 
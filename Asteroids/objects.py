@@ -3,6 +3,8 @@ import pygame
 from pygame.locals import (RLEACCEL, K_UP, K_DOWN, K_LEFT, K_RIGHT, 
 									 K_w, K_s, K_a, K_d)
 
+from gamebox_engine import assets
+
 class Rocket(pygame.sprite.Sprite):
 	def __init__(self, winsize):
 		super(Rocket, self).__init__()
@@ -68,8 +70,7 @@ class Bullet(pygame.sprite.Sprite):
 		imglist = [f'assets/bullets/b{i}.png' for i in range(1,11)]
 		bullet = random.choice(imglist)
 
-		self.surf = pygame.image.load(bullet).convert()
-		self.surf.set_colorkey((0,0,0), RLEACCEL)
+		self.surf = assets.load_image(bullet, alpha=False, colorkey=(0,0,0))
 
 		position = self.get_bullet_pos(self.pos)
 		self.rect = self.surf.get_rect(center=position)
@@ -116,8 +117,7 @@ class Asteroid(pygame.sprite.Sprite):
 		self.dirlist = ['top', 'bottom', 'left', 'right']
 		self.dir = random.choice(self.dirlist)
 		
-		self.surf = pygame.image.load(img).convert()
-		self.surf.set_colorkey((0,0,0), RLEACCEL)
+		self.surf = assets.load_image(img, alpha=False, colorkey=(0,0,0))
 
 		pos = self.initial_pos()
 		if self.dir in ('top', 'bottom'):
@@ -182,7 +182,7 @@ class Explosion(pygame.sprite.Sprite):
 		self.images = []
 		for i in range(17):
 			file = f'assets/explosion/Explosion{i}.png'
-			image = pygame.image.load(file)
+			image = assets.load_image(file)
 			self.images.append(image)
 
 		self.index = 0
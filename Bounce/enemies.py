@@ -1,5 +1,7 @@
 import pygame
 
+from gamebox_engine import assets
+
 class Enemy(pygame.sprite.Sprite):
 	def __init__(self, x, y, type_, wall_list):
 		super(Enemy, self).__init__()
@@ -7,7 +9,7 @@ class Enemy(pygame.sprite.Sprite):
 		self.wall_list = wall_list
 		self.size = 16
 
-		self.image = pygame.image.load('Assets/enemy.png')
+		self.image = assets.load_image('Assets/enemy.png')
 		self.rect = self.image.get_rect()
 		self.rect.x = x
 		self.rect.y = y
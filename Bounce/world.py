@@ -3,6 +3,8 @@ import pickle
 
 from enemies import Enemy
 
+from gamebox_engine import animation
+
 NUM_TILES = 28
 TILE_SIZE = 16
 
@@ -156,22 +158,23 @@ class Exit(pygame.sprite.Sprite):
 	def __init__(self, x, y):
 		super(Exit, self).__init__()
 
-		self.image = pygame.image.load('Assets/Exit/tile0.png')
+		self.animation = animation.Playhead(animation.load_clip(
+			[f'Assets/Exit/tile{i}.png' for i in range(12)], frame_ticks=5, loop=False))
+		self.image = self.animation.image
 		self.rect = self.image.get_rect()
 		self.rect.x = x
 		self.rect.y = y
 
-		self.index = 0
 		self.open = False
-		self.counter = 0
+
+	@property
+	def index(self):
+		return self.animation.index # 11 once the door is fully open
 
 	def update(self, screen_scroll):
 		if self.open:
-			self.counter += 1
-			if self.counter % 5 == 0:
-				if self.index < 11:
-					self.index += 1
-					self.image = pygame.image.load(f'Assets/Exit/tile{self.index}.png')
+			self.animation.update()
+			self.image = self.animation.image
 
 		self.rect.x += screen_scroll
 
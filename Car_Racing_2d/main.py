@@ -1,5 +1,8 @@
+import os
+import sys
 import pygame
 import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # gamebox_engine, for `python main.py`
 from objects import Road, Player, Nitro, Tree, Button, \
 					Obstacle, Coins, Fuel
 
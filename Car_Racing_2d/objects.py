@@ -2,6 +2,8 @@ import math
 import pygame
 import random
 
+from gamebox_engine import assets
+
 SCREEN = WIDTH, HEIGHT = 288, 512
 
 BLUE = (53, 81, 92)
@@ -87,18 +89,14 @@ class Obstacle(pygame.sprite.Sprite):
 
 		if type == 1: # Other cars
 			ctype = random.randint(1, 8)
-			self.image = pygame.image.load(f'Assets/cars/{ctype}.png')
-			self.image = pygame.transform.flip(self.image, False, True)
-			self.image = pygame.transform.scale(self.image, (48, 82))
+			self.image = assets.load_image(f'Assets/cars/{ctype}.png', scale=(48, 82), flip_y=True)
 			self.original_x = random.choice(lane_pos) + dx # Store original x for wobble
 		if type == 2: # Barrel
-			self.image = pygame.image.load('Assets/barrel.png')
-			self.image = pygame.transform.scale(self.image, (24, 36))
+			self.image = assets.load_image('Assets/barrel.png', scale=(24, 36))
 			dx = 10
 			self.original_x = random.choice(lane_pos) + dx
 		elif type == 3: # Roadblock
-			self.image = pygame.image.load('Assets/roadblock.png')
-			self.image = pygame.transform.scale(self.image, (50, 25))
+			self.image = assets.load_image('Assets/roadblock.png', scale=(50, 25))
 			self.original_x = random.choice(lane_pos) + dx
 
 		self.rect = self.image.get_rect()
@@ -159,7 +157,7 @@ class Tree(pygame.sprite.Sprite):
 		super(Tree, self).__init__()
 
 		type = random.randint(1, 4)
-		self.image = pygame.image.load(f'Assets/trees/{type}.png')
+		self.image = assets.load_image(f'Assets/trees/{type}.png')
 		self.rect = self.image.get_rect()
 		self.rect.x = x
 		self.rect.y = y
@@ -176,7 +174,7 @@ class Fuel(pygame.sprite.Sprite):
 	def __init__(self, x, y):
 		super(Fuel, self).__init__()
 
-		self.image = pygame.image.load('Assets/fuel.png')
+		self.image = assets.load_image('Assets/fuel.png')
 		self.rect = self.image.get_rect()
 		self.rect.x = x
 		self.rect.y = y
@@ -195,7 +193,7 @@ class Coins(pygame.sprite.Sprite):
 
 		self.images = []
 		for i in range(1, 7):
-			img = pygame.image.load(f'Assets/Coins/{i}.png')
+			img = assets.load_image(f'Assets/Coins/{i}.png')
 			self.images.append(img)
 
 		self.counter = 0
@@ -1,6 +1,9 @@
+import os
+import sys
 import pygame
 import random
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # gamebox_engine, for `python main.py`
 from objects import Egg, Basket, Splash, Button, ScoreText, getEggPos, display_score
 
 # Display ***************************************
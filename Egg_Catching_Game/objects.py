@@ -1,6 +1,8 @@
 import pygame
 import random
 
+from gamebox_engine import assets
+
 # Setup *****************************************
 
 SCREEN = WIDTH, HEIGHT = 600, 960 # This SCREEN variable is likely not used directly for display setup in objects.py
@@ -18,8 +20,7 @@ class Egg(pygame.sprite.Sprite):
 		super(Egg, self).__init__()
 		
 		self.win = win
-		self.image = pygame.image.load('Assets/egg.png')
-		self.image = pygame.transform.scale(self.image, (60,80)) # Adjust if eggs are too big/small
+		self.image = assets.load_image('Assets/egg.png', scale=(60,80)) # Adjust if eggs are too big/small
 		self.rect = self.image.get_rect()
 		self.rect.x = x
 		self.rect.y = y
@@ -47,8 +48,7 @@ class Splash(pygame.sprite.Sprite):
 		def __init__(self, x, y, win):
 			super(Splash, self).__init__()
 			self.win = win
-			self.image = pygame.image.load('Assets/splash.png')
-			self.image = pygame.transform.scale(self.image, (80,60)) # Adjust if splash is too big/small
+			self.image = assets.load_image('Assets/splash.png', scale=(80,60)) # Adjust if splash is too big/small
 			self.rect = self.image.get_rect()
 			self.rect.x = x
 			self.rect.y = y
@@ -2,6 +2,8 @@ import random
 import pygame
 from projectiles import Bullet
 
+from gamebox_engine import animation
+
 TILE_SIZE = 16
 
 pygame.mixer.init()
@@ -18,29 +20,17 @@ class Ghost(pygame.sprite.Sprite):
 
 		self.size = 32
 
-		self.walk_left = []
-		self.walk_right = []
-		self.hit_list = []
-		self.death_list = []
-
-		for i in range(1,6):
-			image = pygame.image.load(f'Assets/Ghost/Enemywalk{i}.png')
-			right = right = pygame.transform.scale(image, (self.size, self.size))
-			left = pygame.transform.flip(right, True, False)
-			self.walk_right.append(right)
-			self.walk_left.append(left)
-		for i in range(1, 3):
-			image = pygame.image.load(f'Assets/Ghost/Enemyhit{i}.png')
-			image = pygame.transform.scale(image, (self.size, self.size))
-			self.hit_list.append(image)
-		for i in range(1,9):
-			image = pygame.image.load(f'Assets/Ghost/Enemydead{i}.png')
-			image = pygame.transform.scale(image, (self.size, self.size))
-			self.death_list.append(image)
+		# Clips are loaded by the first ghost and shared by all of them
+		walk = [f'Assets/Ghost/Enemywalk{i}.png' for i in range(1, 6)]
+		size = (self.size, self.size)
+		self.walk_right = animation.load_clip(walk, scale=size)
+		self.walk_left = animation.load_clip(walk, scale=size, flip_x=True)
+		hit_clip = animation.load_clip([f'Assets/Ghost/Enemyhit{i}.png' for i in range(1, 3)], loop=False, scale=size)
+		death_clip = animation.load_clip([f'Assets/Ghost/Enemydead{i}.png' for i in range(1, 9)], loop=False, scale=size)
 
-		self.walk_index = 0
-		self.death_index = 0
-		self.hit_index = 0
+		self.walk = animation.Playhead(self.walk_right)
+		self.hit_animation = animation.Playhead(hit_clip)
+		self.death = animation.Playhead(death_clip)
 		self.counter = 0
 
 		self.dx = random.choice([-1, 1])
@@ -49,7 +39,7 @@ class Ghost(pygame.sprite.Sprite):
 		self.hit = False
 		self.on_death_bed = False
 
-		self.image = self.walk_right[self.walk_index]
+		self.image = self.walk.image
 		self.rect = self.image.get_rect(center=(self.x, self.y))
 
 	def update(self, screen_scroll, bullet_group, p):
@@ -65,17 +55,17 @@ class Ghost(pygame.sprite.Sprite):
 		self.counter += 1
 		if self.counter % 5 == 0:
 			if self.on_death_bed:
-				self.death_index += 1
-				if self.death_index >= len(self.death_list):
+				self.death.step()
+				if self.death.finished:
 					self.kill()
 					self.alive = False
 			if self.hit:
-				self.hit_index += 1
-				if self.hit_index >= len(self.hit_list):
-					self.hit_index = 0
+				self.hit_animation.step()
+				if self.hit_animation.finished:
+					self.hit_animation.play(self.hit_animation.clip)
 					self.hit = False
 			else:
-				self.walk_index  = (self.walk_index + 1) % len(self.walk_left)
+				self.walk.step()
 				
 		if self.counter % 50 == 0:
 			if self.health > 0 and (abs(p.rect.x - self.rect.x) <= 200):
@@ -87,14 +77,16 @@ class Ghost(pygame.sprite.Sprite):
 
 		if self.alive:
 			if self.on_death_bed:
-				self.image = self.death_list[self.death_index]
+				self.image = self.death.image
 			elif self.hit:
-				self.image = self.hit_list[self.hit_index]
+				self.image = self.hit_animation.image
 			else:
 				if self.dx == -1:
-					self.image = self.walk_left[self.walk_index]
+					self.walk.play(self.walk_left, restart=False)
+					self.image = self.walk.image
 				elif self.dx == 1:
-					self.image = self.walk_right[self.walk_index]
+					self.walk.play(self.walk_right, restart=False)
+					self.image = self.walk.image
 
 	def draw(self, win):
 		win.blit(self.image, self.rect)
\ No newline at end of file
@@ -1,5 +1,8 @@
+import os
+import sys
 import pygame
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # gamebox_engine, for `python main.py`
 from world import World, load_level
 from player import Player
 from enemies import Ghost
@@ -0,0 +1,93 @@
+"""
+Compares how long the UI thread stalls on catalog saves during a burst of
+favorite clicks: the old synchronous atomic save per click versus the
+debounced background writer used by CPGames.
+
+Run from the repository root:
+    python benchmarks/bench_config_saves.py [--clicks 50]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+import launch
+
+
+def report(label, stalls, writes):
+    """Prints per-click stall statistics in milliseconds."""
+    stalls_ms = [s * 1000 for s in stalls]
+    print(f"{label:<28} mean {statistics.mean(stalls_ms):8.3f} ms   "
+          f"max {max(stalls_ms):8.3f} ms   total {sum(stalls_ms):9.3f} ms   "
+          f"file writes {writes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--clicks', type=int, default=50, help="number of favorite toggles in the burst")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+
+    work_dir = tempfile.mkdtemp(prefix='gamebox-bench-')
+    shutil.copy(os.path.join(REPO_DIR, launch.CPGames.CONFIG_FILE), work_dir)
+    os.chdir(work_dir)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cp_games = launch.CPGames()
+        game_names = [game['name'] for game in cp_games.get_all_games()]
+
+        writes = 0
+        write_config_file = cp_games._write_config_file
+
+        def counting_write(data):
+            nonlocal writes
+            writes += 1
+            write_config_file(data)
+
+        # Before: every click did a full dump + fsync + replace on the UI thread
+        stalls = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(args.clicks):
+                game = cp_games.get_game_by_name(game_names[i % len(game_names)])
+                start = time.perf_counter()
+                game['isFavorite'] = not game['isFavorite']
+                counting_write(cp_games._snapshot())
+                stalls.append(time.perf_counter() - start)
+        report("synchronous save per click", stalls, writes)
+
+        # After: clicks only mark the catalog dirty; the writer coalesces them
+        writes = 0
+        cp_games.config_writer._write_func = counting_write
+        stalls = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(args.clicks):
+                start = time.perf_counter()
+                cp_games.toggle_game_favorite(game_names[i % len(game_names)])
+                stalls.append(time.perf_counter() - start)
+            # Let the debounce window pass so the background write lands
+            time.sleep(cp_games.SAVE_DEBOUNCE_SECONDS * 2)
+            start = time.perf_counter()
+            cp_games.close()
+            exit_flush = time.perf_counter() - start
+        report("debounced background save", stalls, writes)
+        print(f"{'exit flush':<28} {exit_flush * 1000:8.3f} ms")
+    finally:
+        os.chdir(REPO_DIR)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
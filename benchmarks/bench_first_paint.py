@@ -0,0 +1,147 @@
+"""
+Measures the launcher's time-to-first-paint: from constructing GameLauncherWindow
+to the first Paint event of its main window, with icons decoded synchronously on
+the GUI thread (the old path) versus on the worker pool with placeholders, and
+versus sliced from the icon atlases icons.py packs (one decode per card size).
+
+Each mode runs in a fresh interpreter so neither benefits from the other's
+decoded images or warm Qt state. With --games N the launcher is pointed at a
+synthetic catalog of N games, each with its own icon file.
+
+Run from the repository root:
+    python benchmarks/bench_first_paint.py [--runs 5] [--games 150]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def build_catalog(work_dir, count):
+    """Writes a catalog of `count` games to `work_dir`, cycling through the repository's icons."""
+    with open(os.path.join(REPO_DIR, 'games_config.json'), 'r', encoding='utf-8') as f:
+        template = json.load(f)[0]
+    icons_dir = os.path.join(work_dir, 'icons')
+    os.makedirs(icons_dir)
+    icon_files = sorted(name for name in os.listdir(os.path.join(REPO_DIR, 'icons')) if name.endswith('.png'))
+    games = []
+    for i in range(count):
+        game = dict(template, name=f"Bench Game {i}", last_played=None, isFavorite=False)
+        games.append(game)
+        shutil.copy(os.path.join(REPO_DIR, 'icons', icon_files[i % len(icon_files)]),
+                    os.path.join(icons_dir, f"bench_game_{i}.png"))
+    with open(os.path.join(work_dir, 'games_config.json'), 'w', encoding='utf-8') as f:
+        json.dump(games, f)
+
+
+def build_atlas(work_dir):
+    """Packs the icons of `work_dir` into atlases, as running icons.py there would."""
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        sys.path.insert(0, REPO_DIR)
+        import icons
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not icons.atlas_is_current():
+                icons.build_icon_atlas()
+    finally:
+        os.chdir(cwd)
+
+
+def measure(mode, work_dir):
+    """Builds and shows the launcher once and prints the first-paint and all-icons times in ms."""
+    sys.path.insert(0, REPO_DIR)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.chdir(work_dir)
+    os.environ['GAMEBOX_WARM_POOL'] = '0' # No idle game runner, it would only add noise here
+
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    import launch
+
+    app = QApplication(sys.argv)
+    launch.IconPixmapCache.ASYNC_DECODE = mode != 'sync'
+    launch.IconPixmapCache.USE_ATLAS = mode == 'atlas'
+    # Never touch the real catalog file from a benchmark
+    launch.CPGames.mark_dirty = lambda self: None
+
+    timings = {}
+
+    class FirstPaintFilter(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and 'first_paint' not in timings:
+                timings['first_paint'] = time.perf_counter() - start
+            return False
+
+    def wait_for_icons():
+        loader = launch.ICON_CACHE._loader
+        if 'first_paint' in timings and (loader is None or loader.is_idle()):
+            timings['icons_ready'] = time.perf_counter() - start
+            app.quit()
+        else:
+            QTimer.singleShot(1, wait_for_icons)
+
+    paint_filter = FirstPaintFilter()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        window = launch.GameLauncherWindow()
+        window.installEventFilter(paint_filter)
+        window.show()
+        QTimer.singleShot(0, wait_for_icons)
+        app.exec_()
+        window.cp_games.close()
+    print(f"{timings['first_paint'] * 1000:.3f} {timings['icons_ready'] * 1000:.3f} {launch.ICON_CACHE.decodes}")
+
+
+def run_mode(mode, runs, work_dir):
+    """Runs one mode `runs` times, each in a separate process."""
+    first_paint, icons_ready = [], []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--measure', mode, '--work-dir', work_dir],
+                                capture_output=True, text=True, check=True).stdout.split()
+        first_paint.append(float(output[-3]))
+        icons_ready.append(float(output[-2]))
+        decodes = int(output[-1])
+    return first_paint, icons_ready, decodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="launcher start-ups per mode")
+    parser.add_argument('--games', type=int, default=0, help="use a synthetic catalog of this many games")
+    parser.add_argument('--measure', choices=['sync', 'async', 'atlas'], help=argparse.SUPPRESS)
+    parser.add_argument('--work-dir', default=REPO_DIR, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.work_dir)
+        return
+
+    work_dir = REPO_DIR
+    if args.games:
+        work_dir = tempfile.mkdtemp(prefix='gamebox-bench-')
+        build_catalog(work_dir, args.games)
+    try:
+        build_atlas(work_dir)
+        for mode, label in (('sync', "synchronous icon decode"), ('async', "worker-pool icon decode"),
+                            ('atlas', "worker-pool atlas decode")):
+            first_paint, icons_ready, decodes = run_mode(mode, args.runs, work_dir)
+            print(f"{label:<26} first paint {statistics.median(first_paint):8.2f} ms   "
+                  f"all icons {statistics.median(icons_ready):8.2f} ms   {decodes:3d} decodes   (median of {args.runs})")
+    finally:
+        if work_dir != REPO_DIR:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
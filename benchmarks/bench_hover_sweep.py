@@ -0,0 +1,91 @@
+"""
+Measures frame times while the pointer sweeps across the game grid: every card in
+turn receives a hover enter (and the previous one a leave), and the window is
+repainted a few times per card while its hover transition runs.
+
+Compares GameCard's cheap rendering mode (shared pre-rendered backgrounds, state
+through dynamic properties) with the old per-card QGraphicsDropShadowEffect and
+hover animations (GAMEBOX_RENDERING=effects). Each mode runs in a fresh
+interpreter. The offscreen platform renders in software, like an X session
+without GPU acceleration.
+
+Run from the repository root:
+    python benchmarks/bench_hover_sweep.py [--sweeps 3] [--frames 4]
+"""
+import argparse
+import contextlib
+import io
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(sweeps, frames):
+    """Runs the hover sweeps in this process and prints one frame time (ms) per line."""
+    sys.path.insert(0, REPO_DIR)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    os.environ['GAMEBOX_WARM_POOL'] = '0' # No idle game runner, it would only add noise here
+    os.chdir(REPO_DIR)
+
+    from PyQt5.QtCore import QEvent
+    from PyQt5.QtWidgets import QApplication
+
+    import launch
+
+    app = QApplication(sys.argv)
+    # Never touch the real catalog file from a benchmark
+    launch.CPGames.mark_dirty = lambda self: None
+    with contextlib.redirect_stdout(io.StringIO()):
+        window = launch.GameLauncherWindow()
+        window.resize(950, 700)
+        window.show()
+        app.processEvents()
+    cards = list(window.grid_cards.values()) + list(window.recent_cards.values())
+
+    frame_times = []
+    previous = None
+    for _ in range(sweeps):
+        for card in cards:
+            if previous is not None:
+                app.sendEvent(previous, QEvent(QEvent.Leave))
+            app.sendEvent(card, QEvent(QEvent.Enter))
+            previous = card
+            for _ in range(frames):
+                time.sleep(0.016) # Let hover animations advance, as between real frames
+                app.processEvents()
+                start = time.perf_counter()
+                window.repaint()
+                frame_times.append(time.perf_counter() - start)
+    window.cp_games.close()
+    for frame_time in frame_times:
+        print(f"{frame_time * 1000:.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sweeps', type=int, default=3, help="passes over all cards")
+    parser.add_argument('--frames', type=int, default=4, help="frames painted per hovered card")
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.sweeps, args.frames)
+        return
+
+    for mode, label in (('effects', "drop-shadow effects"), ('cheap', "cached backgrounds")):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--measure',
+                                 '--sweeps', str(args.sweeps), '--frames', str(args.frames)],
+                                env=dict(os.environ, GAMEBOX_RENDERING=mode),
+                                capture_output=True, text=True, check=True).stdout.split()
+        frame_times = sorted(float(value) for value in output)
+        p95 = frame_times[int(len(frame_times) * 0.95) - 1]
+        print(f"{label:<20} median {statistics.median(frame_times):7.2f} ms   p95 {p95:7.2f} ms   "
+              f"max {frame_times[-1]:7.2f} ms   ({len(frame_times)} frames)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Measures the per-icon time of icons.py's game icons at several icon sizes, with
+the background gradient drawn one filled ellipse per radius step (the old path)
+versus as one NumPy distance-field array (paint_disc_stack).
+
+Every game theme is rendered with both backends, once for the background alone
+and once as a whole icon written as PNG, exactly as generate_game_icon() does;
+the script also reports how far the two backgrounds differ (largest channel
+difference and share of differing pixels).
+
+Run from the repository root:
+    python benchmarks/bench_icon_gradients.py [--runs 3] [--size 128 --size 256 ...]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np # noqa: E402
+from PIL import Image, ImageDraw # noqa: E402
+
+import icons # noqa: E402
+
+VECTORIZED_GRADIENT = icons.draw_radial_gradient
+
+
+def ellipse_gradient(img, draw, center, radius, start_color, end_color):
+    """The old draw_radial_gradient: one filled ellipse per radius step."""
+    width, height = img.size
+    max_radius = max(width, height) / 2
+    steps = int(max_radius)
+    for i in range(steps):
+        r = int(start_color[0] + (end_color[0] - start_color[0]) * i / (steps - 1))
+        g = int(start_color[1] + (end_color[1] - start_color[1]) * i / (steps - 1))
+        b = int(start_color[2] + (end_color[2] - start_color[2]) * i / (steps - 1))
+        current_radius = int(max_radius * (i + 1) / steps)
+        draw.ellipse((center[0] - current_radius, center[1] - current_radius,
+                      center[0] + current_radius, center[1] + current_radius),
+                     fill=(r, g, b))
+
+
+def background(gradient, size, theme):
+    img = Image.new('RGB', (size, size))
+    gradient(img, ImageDraw.Draw(img), (size // 2, size // 2), size // 2, theme['colors'][0], theme['colors'][1])
+    return img
+
+
+def time_backgrounds(gradient, size):
+    """Draws every theme's background gradient at `size` and returns the seconds per icon."""
+    start = time.perf_counter()
+    for theme in icons.GAME_THEMES.values():
+        background(gradient, size, theme)
+    return (time.perf_counter() - start) / len(icons.GAME_THEMES)
+
+
+def time_icons(gradient, size, out_dir):
+    """Generates every themed icon at `size` and returns the seconds per icon."""
+    icons.draw_radial_gradient = gradient
+    icons.ICON_SIZE = (size, size)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for game in icons.GAME_THEMES:
+            icons.generate_game_icon(game, os.path.join(out_dir, f"{size}_{game}.png"))
+    return (time.perf_counter() - start) / len(icons.GAME_THEMES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help="passes over every theme per size and backend")
+    parser.add_argument('--size', type=int, action='append', help="icon size in pixels (default: 128, 256, 512)")
+    args = parser.parse_args()
+
+    out_dir = tempfile.mkdtemp(prefix='gamebox-icons-')
+    try:
+        for size in args.size or [128, 256, 512]:
+            max_diff, differing = 0, 0
+            for theme in icons.GAME_THEMES.values():
+                diff = np.abs(np.asarray(background(ellipse_gradient, size, theme), dtype=np.int16)
+                              - np.asarray(background(VECTORIZED_GRADIENT, size, theme), dtype=np.int16))
+                max_diff = max(max_diff, int(diff.max()))
+                differing += int(diff.any(axis=2).sum())
+            share = differing / (size * size * len(icons.GAME_THEMES))
+
+            print(f"{size} px (median of {args.runs}; background differs by at most {max_diff} "
+                  f"in {share:.2%} of pixels)")
+            whole_icon = lambda gradient, size: time_icons(gradient, size, out_dir)
+            for label, measure in (("background", time_backgrounds), ("whole icon", whole_icon)):
+                ellipses = [measure(ellipse_gradient, size) for _ in range(args.runs)]
+                vectorized = [measure(VECTORIZED_GRADIENT, size) for _ in range(args.runs)]
+                print(f"    {label}   ellipse per step {statistics.median(ellipses) * 1000:7.2f} ms/icon   "
+                      f"distance field {statistics.median(vectorized) * 1000:7.2f} ms/icon")
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures cold-launch time to first frame of games whose files are not in the OS
+page cache, with and without the launcher's asset prefetch (AssetPrefetchTask)
+having warmed them first.
+
+Before every launch the game's files are evicted from the page cache with
+posix_fadvise(DONTNEED), which needs no privileges but only works for files that
+have no dirty pages. Each launch is a cold game_runner.py start, exactly as the
+process supervisor runs it, and is killed after its first frame. Needs Linux
+(posix_fadvise) and pygame; games run on SDL's dummy video and audio drivers.
+
+Run from the repository root:
+    python benchmarks/bench_prefetch.py [--runs 5] [--game "Jungle Dash" ...]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from launch import AssetPrefetchTask, GameProcessSupervisor # noqa: E402
+
+
+class PrefetchSink:
+    """Stands in for AssetPrefetcher: the task only needs somewhere to report to."""
+    class Signal:
+        def emit(self, *args):
+            pass
+
+    game_prefetched = Signal()
+
+
+def evict(game_path):
+    for path, size in AssetPrefetchTask.asset_files(game_path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def prefetch(game_name, game_path):
+    AssetPrefetchTask(PrefetchSink(), [(game_name, game_path)], 1 << 40, threading.Event()).run()
+
+
+def time_to_read(game_path):
+    """Returns the seconds it takes to read every file of the game once."""
+    start = time.perf_counter()
+    for path, _ in AssetPrefetchTask.asset_files(game_path):
+        with open(path, 'rb') as f:
+            while f.read(AssetPrefetchTask.CHUNK_SIZE):
+                pass
+    return time.perf_counter() - start
+
+
+def warm_up(game_name, game_path):
+    prefetch(game_name, game_path)
+    time.sleep(0.5) # Let the kernel finish the readahead, as during the launcher's idle time
+
+
+def time_to_first_frame(game_path):
+    """Starts the game cold and returns the seconds until its first frame."""
+    read_fd, write_fd = os.pipe()
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    start = time.monotonic()
+    process = subprocess.Popen([sys.executable, GameProcessSupervisor.RUNNER_SCRIPT, '--report-fd', str(write_fd), game_path],
+                               cwd=game_path, pass_fds=(write_fd,), env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    try:
+        with os.fdopen(read_fd, 'r') as reports:
+            for line in reports:
+                if line.strip() == 'first_frame':
+                    return time.monotonic() - start
+        raise RuntimeError(f"{game_path} exited before its first frame")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help="launches per game and mode")
+    parser.add_argument('--game', action='append', help="game to launch (default: Jungle Dash, Asteroids)")
+    args = parser.parse_args()
+
+    for game_name in args.game or ["Jungle Dash", "Asteroids"]:
+        game_path = os.path.join(REPO_DIR, game_name.replace(' ', '_'))
+        size = sum(size for _, size in AssetPrefetchTask.asset_files(game_path))
+        cold, prefetched, cold_read, prefetched_read = [], [], [], []
+        for _ in range(args.runs):
+            evict(game_path)
+            cold.append(time_to_first_frame(game_path))
+            evict(game_path)
+            warm_up(game_name, game_path)
+            prefetched.append(time_to_first_frame(game_path))
+            evict(game_path)
+            cold_read.append(time_to_read(game_path))
+            evict(game_path)
+            warm_up(game_name, game_path)
+            prefetched_read.append(time_to_read(game_path))
+        print(f"{game_name} ({size / 1024 / 1024:.1f} MiB, median of {args.runs})")
+        print(f"    first frame   cold {statistics.median(cold) * 1000:7.1f} ms   "
+              f"prefetched {statistics.median(prefetched) * 1000:7.1f} ms")
+        print(f"    read assets   cold {statistics.median(cold_read) * 1000:7.1f} ms   "
+              f"prefetched {statistics.median(prefetched_read) * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,750 @@
+"""
+The game catalog and its persistence, independent of the Qt UI.
+
+CPGames loads games_config.json (or the optional SQLite store) into memory and
+saves changes through a debounced background writer. Games whose folders are
+found by the discovery scan (game_discovery.py) but are not in the catalog yet
+are shown alongside it, and only saved once the user plays or favorites one.
+Nothing here imports PyQt5,
+so the headless command line (game_cli.py) can use the same persistence layer as
+the launcher window without paying for the Qt bootstrap.
+"""
+import os
+import sys
+import threading
+import time
+import json
+import re
+import difflib
+import sqlite3
+import urllib.request
+from datetime import datetime
+import tempfile # Import for temporary file operations
+
+from game_discovery import GameDiscovery
+
+
+class DebouncedConfigWriter:
+    """
+    Coalesces catalog saves and performs them on a background thread.
+
+    Each call to schedule() replaces the pending snapshot and restarts a short
+    debounce window; once the window passes without new changes, the latest
+    snapshot is handed to `write_func` on the worker thread. A burst of changes
+    therefore costs a single write, and the UI thread never waits on disk I/O.
+    flush() performs any pending write synchronously, e.g. on application exit.
+    """
+    def __init__(self, write_func, delay=0.5):
+        self._write_func = write_func
+        self._delay = delay
+        self._condition = threading.Condition()
+        self._pending = None # Latest snapshot waiting to be written
+        self._deadline = None # Monotonic time at which the pending snapshot is due
+        self._writing = False # True while a snapshot is being written
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ConfigWriter", daemon=True)
+        self._thread.start()
+
+    def schedule(self, snapshot):
+        """Marks the catalog dirty with `snapshot` and (re)starts the debounce window."""
+        with self._condition:
+            self._pending = snapshot
+            self._deadline = time.monotonic() + self._delay
+            self._condition.notify_all()
+
+    def is_dirty(self):
+        """Returns True if a write is pending or in progress."""
+        with self._condition:
+            return self._pending is not None or self._writing
+
+    def flush(self):
+        """
+        Writes the pending snapshot (if any) synchronously on the calling thread,
+        after waiting for an in-flight background write to finish.
+        Exceptions raised by `write_func` propagate to the caller.
+        """
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+            snapshot, self._pending, self._deadline = self._pending, None, None
+            if snapshot is None:
+                return
+            self._writing = True
+        try:
+            self._write_func(snapshot)
+        finally:
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def close(self):
+        """Flushes pending changes and stops the worker thread."""
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+
+    def _run(self):
+        """Worker loop: waits for a due snapshot and writes it."""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending is None or self._deadline is None or self._writing:
+                        self._condition.wait()
+                        continue
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+                snapshot, self._pending, self._deadline = self._pending, None, None
+                self._writing = True
+            try:
+                self._write_func(snapshot)
+            except Exception as e:
+                print(f"Background save failed, will retry on the next flush: {e}")
+                with self._condition:
+                    if self._pending is None:
+                        # Keep the data dirty without rescheduling, so the failing write
+                        # is retried by the next change or by the final flush.
+                        self._pending = snapshot
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+
+class SQLiteGameStore:
+    """
+    Optional SQLite storage for the game catalog, used by CPGames instead of
+    rewriting games_config.json on every change.
+
+    The database runs in WAL mode and keeps the frequently queried fields in their
+    own indexed columns (last_played, isFavorite, category), so recently played,
+    favorites and category lookups stay fast when the catalog grows to thousands
+    of entries. The full game dictionary is kept as JSON in the `data` column so
+    that any extra fields round-trip unchanged.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS games (
+            name TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            category TEXT NOT NULL DEFAULT '',
+            last_played TEXT,
+            isFavorite INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_games_last_played ON games (last_played);
+        CREATE INDEX IF NOT EXISTS idx_games_favorite ON games (isFavorite);
+        CREATE INDEX IF NOT EXISTS idx_games_category ON games (category);
+    """
+
+    def __init__(self, db_path, read_only=False):
+        self.db_path = db_path
+        if read_only:
+            # Opened as a reader only: no schema setup, and any write attempt fails
+            self.connection = sqlite3.connect(f"file:{urllib.request.pathname2url(db_path)}?mode=ro", uri=True)
+            return
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL") # Durable on commit in WAL mode, without an fsync per write
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
+
+    def is_empty(self):
+        """Returns True if no games have been stored yet."""
+        try:
+            return self.connection.execute("SELECT 1 FROM games LIMIT 1").fetchone() is None
+        except sqlite3.OperationalError:
+            return True # A read-only connection to a database whose schema was never created
+
+    def data_version(self):
+        """Returns a counter that changes whenever another connection commits to the database."""
+        return self.connection.execute("PRAGMA data_version").fetchone()[0]
+
+    def import_games(self, games, first_position=0):
+        """Imports (or replaces) a list of game dictionaries, e.g. from games_config.json."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO games (name, position, category, last_played, isFavorite, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(game['name'], position, game.get('category') or '', game.get('last_played'),
+                  int(bool(game.get('isFavorite', False))), json.dumps(game))
+                 for position, game in enumerate(games, first_position)]
+            )
+
+    def load_games(self):
+        """Returns all games as dictionaries, in catalog order."""
+        games = []
+        for data, last_played, is_favorite in self.connection.execute(
+                "SELECT data, last_played, isFavorite FROM games ORDER BY position"):
+            game = json.loads(data)
+            # The indexed columns are authoritative for the fields updated in place
+            game['last_played'] = last_played
+            game['isFavorite'] = bool(is_favorite)
+            games.append(game)
+        return games
+
+    def set_last_played(self, game_name, last_played):
+        """Updates the last_played timestamp of one game."""
+        with self.connection:
+            self.connection.execute("UPDATE games SET last_played = ? WHERE name = ?", (last_played, game_name))
+
+    def set_favorite(self, game_name, is_favorite):
+        """Updates the favorite flag of one game."""
+        with self.connection:
+            self.connection.execute("UPDATE games SET isFavorite = ? WHERE name = ?", (int(bool(is_favorite)), game_name))
+
+    def update_game_data(self, game):
+        """Rewrites the stored JSON of one game, for fields without their own column."""
+        with self.connection:
+            self.connection.execute("UPDATE games SET data = ? WHERE name = ?", (json.dumps(game), game['name']))
+
+    def clear_last_played(self):
+        """Clears the last_played timestamp of every game."""
+        with self.connection:
+            self.connection.execute("UPDATE games SET last_played = NULL WHERE last_played IS NOT NULL")
+
+    def recently_played_names(self, count):
+        """Returns the names of the `count` most recently played games, newest first."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT name FROM games WHERE last_played IS NOT NULL ORDER BY last_played DESC LIMIT ?", (count,))]
+
+    def favorite_names(self):
+        """Returns the names of all favorite games, in catalog order."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT name FROM games WHERE isFavorite = 1 ORDER BY position")]
+
+    def category_names(self, category):
+        """Returns the names of all games in a category, in catalog order."""
+        return [row[0] for row in self.connection.execute(
+            "SELECT name FROM games WHERE category = ? ORDER BY position", (category,))]
+
+
+class GameSearchIndex:
+    """
+    Search index over the game catalog, built once per catalog load.
+
+    Names, categories and descriptions are normalized and tokenized up front.
+    Each token has a posting list of the games it appears in (with the weight of
+    the best field it appears in), and each trigram maps to the tokens containing
+    it, so substring lookups only verify a handful of candidate tokens instead of
+    re-lowercasing every field of every game on each keystroke. Query tokens
+    without any match can fall back to fuzzy (close spelling) matches.
+    """
+    FIELD_WEIGHTS = {'name': 3.0, 'category': 2.0, 'description': 1.0}
+    FUZZY_CUTOFF = 0.75
+
+    def __init__(self, games):
+        self.names = [game['name'] for game in games]
+        self._postings = {} # token -> {game position: best field weight}
+        self._trigrams = {} # trigram -> set of tokens containing it
+        for position, game in enumerate(games):
+            for field, weight in self.FIELD_WEIGHTS.items():
+                for token in self.tokenize(game.get(field) or ''):
+                    postings = self._postings.setdefault(token, {})
+                    if postings.get(position, 0) < weight:
+                        postings[position] = weight
+        for token in self._postings:
+            for trigram in self._token_trigrams(token):
+                self._trigrams.setdefault(trigram, set()).add(token)
+
+    @staticmethod
+    def tokenize(text):
+        """Lowercases text and splits it into alphanumeric tokens."""
+        return re.findall(r'[a-z0-9]+', text.lower())
+
+    @staticmethod
+    def _token_trigrams(token):
+        return {token[i:i + 3] for i in range(len(token) - 2)}
+
+    def _matching_tokens(self, query_token, fuzzy):
+        """Returns {index token: match quality} for one query token."""
+        if len(query_token) >= 3:
+            candidates = None
+            for trigram in self._token_trigrams(query_token):
+                tokens = self._trigrams.get(trigram, set())
+                candidates = tokens if candidates is None else candidates & tokens
+                if not candidates:
+                    break
+        else:
+            candidates = self._postings.keys() # Too short for trigrams; the vocabulary is small
+
+        matches = {}
+        for token in candidates or ():
+            if token == query_token:
+                matches[token] = 1.0
+            elif token.startswith(query_token):
+                matches[token] = 0.8
+            elif query_token in token:
+                matches[token] = 0.6
+        if not matches and fuzzy and len(query_token) >= 3:
+            for token in difflib.get_close_matches(query_token, self._postings.keys(), n=5, cutoff=self.FUZZY_CUTOFF):
+                matches[token] = 0.4
+        return matches
+
+    def search(self, query, fuzzy=True):
+        """
+        Returns the names of the games matching every token of `query`, best match
+        first (ties keep catalog order), or None if the query has no tokens.
+        """
+        query_tokens = self.tokenize(query)
+        if not query_tokens:
+            return None
+
+        scores = None
+        for query_token in query_tokens:
+            token_scores = {}
+            for token, quality in self._matching_tokens(query_token, fuzzy).items():
+                for position, weight in self._postings[token].items():
+                    score = weight * quality
+                    if token_scores.get(position, 0) < score:
+                        token_scores[position] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {position: score + token_scores[position] for position, score in scores.items() if position in token_scores}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        return [self.names[position] for position in ranked]
+
+
+class CPGames:
+    """
+    Manages the collection of supported games, now loaded from JSON.
+    The parsed catalog is kept in memory as the single source of truth shared by
+    every view; the file is only re-read when it has actually changed on disk.
+
+    With the optional SQLite backend (enabled when DATABASE_FILE exists, or with
+    GAMEBOX_STORAGE=sqlite), the database is the source of truth and serves the
+    recently played / favorite / category queries from its indexes, while
+    games_config.json is still exported in the background so it stays usable.
+
+    A `read_only` catalog (used by `launch.py --list/--recent`) never writes: it
+    does not merge discovered games, create a missing config file, or save on
+    close, so it cannot race the launcher window that owns the catalog.
+    """
+    CONFIG_FILE = 'games_config.json'
+    DATABASE_FILE = 'games.db'
+    SAVE_DEBOUNCE_SECONDS = 0.5 # Changes within this window are coalesced into one write
+
+    def __init__(self, use_sqlite=None, read_only=False):
+        # Display the full path of the config file being used
+        self.full_config_path = os.path.abspath(self.CONFIG_FILE)
+        print(f"CPGames initialized. Config file path: {self.full_config_path}")
+        self.read_only = read_only
+
+        if use_sqlite is None:
+            use_sqlite = os.environ.get('GAMEBOX_STORAGE') == 'sqlite' or os.path.exists(self.DATABASE_FILE)
+        if read_only and not os.path.exists(self.DATABASE_FILE):
+            use_sqlite = False # Creating the database would be a write
+
+        # Playable folders next to the config file, cached in a manifest between runs
+        self.discovery = GameDiscovery(os.path.dirname(self.full_config_path))
+
+        # (mtime, inode, size) of the config file as last loaded or saved by us
+        self._config_signature = None
+        self.store = None
+        if use_sqlite:
+            self.store = SQLiteGameStore(os.path.abspath(self.DATABASE_FILE), read_only=read_only)
+            if self.store.is_empty() and read_only:
+                # Not imported yet, and importing is a write; read the JSON catalog instead
+                self.store.close()
+                self.store = None
+            elif self.store.is_empty():
+                # One-time import of the existing JSON catalog
+                print(f"Importing '{self.CONFIG_FILE}' into '{self.DATABASE_FILE}'...")
+                self.store.import_games(self.load_games_config())
+        if self.store is not None:
+            self.games_data = self.store.load_games()
+            self._store_version = self.store.data_version()
+        else:
+            signature = self._read_config_signature()
+            self.games_data = self.load_games_config()
+            self._config_signature = signature or self._read_config_signature()
+        # Map game names to their data for quick lookup
+        self.games_by_name = {game['name']: game for game in self.games_data}
+
+        self._search_index = None # Built on first use, see get_search_index()
+        self._discovered_names = set() # Found by the discovery scan, not saved in the catalog yet
+
+        # Saves triggered by user actions are coalesced and written off the UI thread
+        self.config_writer = DebouncedConfigWriter(self._write_config_file, self.SAVE_DEBOUNCE_SECONDS)
+        if not read_only:
+            self.add_discovered_games() # Folders dropped in since the catalog was last saved
+
+    def _read_config_signature(self):
+        """
+        Returns a (mtime, inode, size) tuple identifying the current version of the
+        config file, or None if it does not exist. An atomic replace changes the inode
+        even when the mtime resolution is too coarse to notice the write.
+        """
+        try:
+            stat = os.stat(self.full_config_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+    def has_config_changed(self):
+        """Returns True if the catalog on disk differs from the in-memory copy."""
+        if self.store is not None:
+            return self.store.data_version() != self._store_version
+        return self._read_config_signature() != self._config_signature
+
+    def watched_paths(self):
+        """Returns the files whose modification may indicate an external catalog change."""
+        if self.store is not None:
+            return [self.store.db_path, self.store.db_path + '-wal']
+        return [self.full_config_path]
+
+    def load_games_config(self):
+        """
+        Loads game data from the JSON configuration file.
+        Raises an exception if the file is not found or is invalid.
+        Ensures 'isFavorite' and 'category' fields exist.
+        """
+        if not os.path.exists(self.CONFIG_FILE):
+            # If config file doesn't exist, create one from the game folders that are present
+            print(f"Config file '{self.CONFIG_FILE}' not found. Creating a new one from the game folders.")
+            default_games_data = [self.new_game_entry(found) for found in self.discovery.scan()]
+            if not self.read_only:
+                self._atomic_save(default_games_data)
+            return default_games_data
+
+        try:
+            with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                if not isinstance(data, list):
+                    raise ValueError("JSON content is not a list. Expected a list of game objects.")
+                
+                # Ensure all games have 'isFavorite' and 'category' fields
+                for game in data:
+                    if 'isFavorite' not in game:
+                        game['isFavorite'] = False
+                    if 'category' not in game:
+                        game['category'] = "" # Default to empty string
+                return data
+        except json.JSONDecodeError as e:
+            self.report_error("Configuration Error", f"Error decoding JSON from '{self.CONFIG_FILE}': {e}. "
+                              "Please check the file for syntax errors or delete it to generate a new one.")
+            return [] # Return empty list on error
+        except Exception as e:
+            self.report_error("Configuration Error", f"An unexpected error occurred while loading '{self.CONFIG_FILE}': {e}")
+            return [] # Return empty list on error
+
+    def _write_config_file(self, data_to_save):
+        """
+        Saves data to the JSON configuration file using an atomic write.
+        This writes to a temporary file and then renames it to prevent data corruption
+        in case of write errors or crashes. Errors are raised to the caller; this method
+        does not touch the UI, so it is safe to call from the background writer.
+        """
+        temp_file_path = None
+        try:
+            # Create a temporary file in the same directory as the config file
+            temp_fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(self.full_config_path), suffix='.tmp')
+            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                json.dump(data_to_save, f, indent=4)
+                f.flush()
+                os.fsync(f.fileno()) # Ensure data is written to disk
+
+            # Atomically replace the old config file with the new one
+            os.replace(temp_file_path, self.full_config_path)
+            # Remember our own write so it is not mistaken for an external change
+            self._config_signature = self._read_config_signature()
+            print(f"Games config saved successfully to {self.full_config_path} using atomic write!")
+        finally:
+            # Clean up the temporary file if it still exists (e.g., if an error occurred before rename)
+            if temp_file_path and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
+                print(f"Cleaned up temporary file: {temp_file_path}")
+
+    def report_error(self, title, message):
+        """Reports a load or save error. The launcher window overrides this to show a message box."""
+        print(f"{title}: {message}", file=sys.stderr)
+
+    def _report_save_error(self, error):
+        """Shows a save error to the user."""
+        if isinstance(error, IOError):
+            self.report_error("File Save Error", f"Could not save '{self.CONFIG_FILE}'. Please check file permissions. Error: {error}")
+            print(f"IOError during atomic save: {error}")
+        else:
+            self.report_error("File Save Error", f"An unexpected error occurred while saving '{self.CONFIG_FILE}': {error}")
+            print(f"General error during atomic save: {error}")
+
+    def _atomic_save(self, data_to_save):
+        """Synchronously saves data with an atomic write, reporting errors to the user."""
+        try:
+            self._write_config_file(data_to_save)
+        except Exception as e:
+            self._report_save_error(e)
+
+    def _snapshot(self):
+        """
+        Returns a copy of the catalog that the background writer can serialize while
+        the UI keeps modifying the live game dictionaries.
+        """
+        return [dict(game) for game in self.games_data if game['name'] not in self._discovered_names]
+
+    def mark_dirty(self):
+        """Schedules a coalesced background save of the current in-memory data."""
+        if self.read_only:
+            return
+        self.config_writer.schedule(self._snapshot())
+
+    def flush(self):
+        """Writes any pending changes synchronously, reporting errors to the user."""
+        try:
+            self.config_writer.flush()
+        except Exception as e:
+            self._report_save_error(e)
+
+    def close(self):
+        """Flushes pending changes and stops the background writer. Call on application exit."""
+        try:
+            self.config_writer.close()
+        except Exception as e:
+            self._report_save_error(e)
+        if self.store is not None:
+            self.store.close()
+
+    def export_games_config(self, path=None):
+        """Exports the current catalog as JSON, to games_config.json unless `path` is given."""
+        self.flush()
+        if path is None:
+            self._atomic_save(self._snapshot())
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self._snapshot(), f, indent=4)
+
+
+    def save_games_config(self):
+        """Saves current in-memory game data back to the JSON configuration file right away."""
+        self.mark_dirty()
+        self.flush()
+
+
+    def reload_games_config(self, force=False):
+        """
+        Reloads game data from the catalog storage into memory, but only if it
+        changed since it was last loaded or saved (or if `force` is set).
+        Existing game dictionaries are updated in place so that views holding a
+        reference to them stay current. Returns True if the data was reloaded.
+        """
+        if not force and not self.has_config_changed():
+            return False
+
+        if self.store is not None:
+            self._store_version = self.store.data_version()
+            loaded_games = self.store.load_games()
+        else:
+            if not force and self.config_writer.is_dirty():
+                # Our pending save supersedes the file on disk; reloading now would drop it
+                return False
+            signature = self._read_config_signature()
+            loaded_games = self.load_games_config()
+            if not loaded_games and self.games_data:
+                # The file could not be parsed (e.g. it was caught mid-write by an external
+                # editor); keep the current catalog rather than wiping it and saving that later
+                return False
+            self._config_signature = signature or self._read_config_signature()
+
+        print("Reloading games config from disk...")
+        games_data = []
+        for loaded_game in loaded_games:
+            game = self.games_by_name.get(loaded_game['name'])
+            if game is not None:
+                game.clear()
+                game.update(loaded_game)
+            else:
+                game = loaded_game
+            games_data.append(game)
+        self.games_data = games_data
+        self.games_by_name = {game['name']: game for game in self.games_data}
+        self._search_index = None # Rebuilt from the new data on next use
+        # Discovered games are not in the stored catalog; keep showing the unsaved ones
+        self._discovered_names = set()
+        self._merge_discovered_games(self.discovery.games())
+        print("Games config reloaded.")
+        return True
+
+
+    def new_game_entry(self, found):
+        """Returns a catalog entry with default metadata for a game found by the discovery scan."""
+        default_folder = found['name'].replace(' ', '_')
+        return {
+            "name": found['name'], "description": "", "type": "non_gui", "last_played": None,
+            "isFavorite": False, "category": "", "developer": "Unknown", "publisher": "Unknown",
+            "release_date": "N/A", "genre_tags": [], "screenshots": [],
+            "path": None if found['path'] == default_folder else found['path'],
+        }
+
+    def add_discovered_games(self):
+        """
+        Rescans the game folders (only the directories that changed, see GameDiscovery)
+        and appends games the catalog doesn't know yet. They are kept in memory only
+        (see _keep_discovered_game), so a scan never rewrites the catalog by itself.
+        Returns the added names.
+        """
+        added = self._merge_discovered_games(self.discovery.scan())
+        if added:
+            print(f"Discovered new games: {', '.join(added)}")
+        return added
+
+    def _merge_discovered_games(self, found_games):
+        """Appends the found games whose name and folder the catalog doesn't know yet. Returns their names."""
+        root_dir = os.path.dirname(self.full_config_path)
+        known_paths = {os.path.normcase(os.path.normpath(self.get_game_path(game['name']))) for game in self.games_data}
+        added = []
+        for found in found_games:
+            found_path = os.path.normcase(os.path.normpath(os.path.join(root_dir, found['path'])))
+            if found['name'] in self.games_by_name or found_path in known_paths:
+                continue
+            game = self.new_game_entry(found)
+            self.games_data.append(game)
+            self.games_by_name[game['name']] = game
+            self._discovered_names.add(game['name'])
+            added.append(game['name'])
+        if added:
+            self._search_index = None # Rebuilt with the new games on next use
+        return added
+
+    def _keep_discovered_game(self, game):
+        """Makes a discovered game part of the saved catalog, once the user has played or favorited it."""
+        if game['name'] not in self._discovered_names:
+            return
+        self._discovered_names.discard(game['name'])
+        if self.store is not None:
+            self.store.import_games([game], first_position=self.games_data.index(game))
+
+    def get_all_games(self):
+        """Returns a list of all game data dictionaries."""
+        return self.games_data
+
+    def get_search_index(self):
+        """Returns the search index for the current catalog, building it once per load."""
+        if self._search_index is None:
+            self._search_index = GameSearchIndex(self.games_data)
+        return self._search_index
+
+    def get_game_path(self, game_name):
+        """
+        Returns the absolute folder of a game: its 'path' entry if set, otherwise the
+        game name with spaces replaced by underscores, next to the config file.
+        """
+        game = self.games_by_name.get(game_name) or {}
+        game_folder = game.get('path') or game_name.replace(' ', '_')
+        return os.path.join(os.path.dirname(self.full_config_path), game_folder)
+
+    def get_game_by_name(self, game_name):
+        """Returns the data dictionary for a specific game name."""
+        return self.games_by_name.get(game_name)
+
+    def update_game_last_played(self, game_name):
+        """Updates the 'last_played' timestamp for a game."""
+        game = self.games_by_name.get(game_name)
+        if game:
+            game['last_played'] = datetime.now().isoformat()
+            self._keep_discovered_game(game)
+            if self.store is not None:
+                self.store.set_last_played(game_name, game['last_played'])
+            self.mark_dirty() # Written in the background after a short debounce
+
+    def toggle_game_favorite(self, game_name):
+        """Toggles the 'isFavorite' status for a game."""
+        game = self.games_by_name.get(game_name)
+        if game:
+            game['isFavorite'] = not game.get('isFavorite', False) # Toggle, default to False
+            self._keep_discovered_game(game)
+            if self.store is not None:
+                self.store.set_favorite(game_name, game['isFavorite'])
+            self.mark_dirty() # Written in the background after a short debounce
+
+    def record_first_frame_latency(self, game_name, seconds, warm=False):
+        """Stores the latest spawn-to-first-frame latency of a game, separately for cold and pre-warmed launches."""
+        game = self.games_by_name.get(game_name)
+        if game:
+            latencies = dict(game.get('first_frame_latency') or {})
+            latencies['warm' if warm else 'cold'] = round(seconds, 3)
+            game['first_frame_latency'] = latencies
+            self._keep_discovered_game(game)
+            if self.store is not None:
+                self.store.update_game_data(game)
+            self.mark_dirty()
+
+    def _games_from_store(self, names):
+        """
+        Returns the loaded games for names queried from the database. Rows that
+        another process added since the last load trigger a reload; names still
+        unknown after it are skipped.
+        """
+        if any(name not in self.games_by_name for name in names):
+            self.reload_games_config()
+        return [self.games_by_name[name] for name in names if name in self.games_by_name]
+
+    def get_recently_played_games(self, count=3):
+        """Returns a list of recently played games, sorted by last_played."""
+        if self.store is not None:
+            return self._games_from_store(self.store.recently_played_names(count))
+        played_games = [g for g in self.games_data if g.get('last_played')]
+        # Sort in descending order of last_played timestamp
+        played_games.sort(key=lambda x: x['last_played'], reverse=True)
+        return played_games[:count]
+
+    def get_likely_next_games(self, count=3):
+        """
+        Ranks the games most likely to be launched next: recently played games first,
+        favorites weighted up. Games never played nor marked favorite are left out.
+        """
+        now = datetime.now()
+        ranked = []
+        for game in self.games_data:
+            score = 1.0 if game.get('isFavorite', False) else 0.0
+            if game.get('last_played'):
+                try:
+                    days_ago = (now - datetime.fromisoformat(game['last_played'])).total_seconds() / 86400
+                except ValueError:
+                    days_ago = None
+                if days_ago is not None:
+                    score += 2.0 / (1.0 + max(days_ago, 0.0)) # Played today outweighs a favorite
+            if score > 0:
+                ranked.append((score, game))
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        return [game for _, game in ranked[:count]]
+
+    def get_favorite_games(self):
+        """Returns a list of games marked as favorites."""
+        if self.store is not None:
+            return self._games_from_store(self.store.favorite_names())
+        return [g for g in self.games_data if g.get('isFavorite', False)]
+
+    def get_games_by_category(self, category):
+        """Returns a list of games in the given category."""
+        if self.store is not None:
+            return self._games_from_store(self.store.category_names(category))
+        return [g for g in self.games_data if g.get('category', '') == category]
+
+    def clear_recently_played_data(self):
+        """
+        Clears the 'last_played' timestamp for all games by modifying the in-memory
+        data directly and then saving it using an atomic write.
+        """
+        print("Clearing recently played data by modifying in-memory data and saving atomically...")
+        # Iterate directly over self.games_data and set last_played to None
+        for game in self.games_data:
+            if 'last_played' in game:
+                game['last_played'] = None
+        if self.store is not None:
+            self.store.clear_last_played()
+
+        # Save this modified data to the config file using the atomic save method
+        self.save_games_config()
+        print("Recently played data cleared and config file saved atomically.")
@@ -0,0 +1,204 @@
+"""
+Headless command line for the game launcher.
+
+    python launch.py --launch "Game Name"     start a game without the launcher window
+    python launch.py --list [--json]          list the catalog
+    python launch.py --recent [COUNT] [--json] list recently played games
+
+launch.py hands these arguments over before it imports PyQt5, so starting a game
+from a script or kiosk shortcut only costs the catalog load. Games are resolved
+and last_played is updated through the same catalog (game_catalog.CPGames) the
+launcher window uses.
+
+When a launcher window is already running for this catalog, launch.py forwards
+its request there instead (see send_instance_request): `--launch` starts the game
+in the running launcher and a plain invocation brings its window to the front.
+`--list` and `--recent` open the catalog read-only, so only one process ever
+writes games_config.json.
+"""
+import argparse
+import contextlib
+import difflib
+import hashlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+
+CLI_FLAGS = ('--launch', '--list', '--recent', '--help', '-h') # The window itself takes no help flag
+LOCAL_FLAGS = ('--list', '--recent', '--help', '-h') # Answered by this process from a read-only catalog
+RUNNER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_runner.py')
+INSTANCE_TIMEOUT_SECONDS = 0.5
+
+
+def wants_cli(argv):
+    """Returns True if the arguments ask for the headless command line instead of the window."""
+    return any(arg.split('=', 1)[0] in CLI_FLAGS for arg in argv)
+
+
+def instance_address():
+    """
+    Address the running launcher listens on, one per catalog directory and user: a
+    Unix domain socket path on POSIX, a local (named pipe) server name elsewhere.
+    """
+    digest = hashlib.sha1(os.path.abspath(os.getcwd()).encode('utf-8')).hexdigest()[:12]
+    user = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    name = f"gamebox-launcher-{user}-{digest}"
+    if os.name == 'posix':
+        return os.path.join(tempfile.gettempdir(), f"{name}.sock")
+    return name
+
+
+def send_instance_request(argv, timeout=INSTANCE_TIMEOUT_SECONDS):
+    """
+    Forwards `argv` to a running launcher. Returns its reply ({"ok": ..., "error": ...}),
+    or None if no launcher is listening.
+    """
+    if any(arg.split('=', 1)[0] in LOCAL_FLAGS for arg in argv):
+        return None
+    request = (json.dumps({'argv': list(argv)}) + '\n').encode('utf-8')
+    address = instance_address()
+    if os.name != 'posix':
+        return _send_request_qt(address, request, timeout)
+    if not os.path.exists(address):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.sendall(request)
+            reply = b''
+            while not reply.endswith(b'\n'):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                reply += chunk
+    except OSError:
+        return None # Nobody listening (e.g. a stale socket file from a crashed launcher)
+    try:
+        return json.loads(reply)
+    except ValueError:
+        return None
+
+
+def _send_request_qt(address, request, timeout):
+    """send_instance_request() for platforms where the server is a named pipe."""
+    from PyQt5.QtNetwork import QLocalSocket
+    sock = QLocalSocket()
+    sock.connectToServer(address)
+    if not sock.waitForConnected(int(timeout * 1000)):
+        return None
+    sock.write(request)
+    sock.waitForBytesWritten(int(timeout * 1000))
+    reply = b''
+    while not reply.endswith(b'\n') and sock.waitForReadyRead(int(timeout * 1000)):
+        reply += bytes(sock.readAll())
+    sock.disconnectFromServer()
+    try:
+        return json.loads(reply)
+    except ValueError:
+        return None
+
+
+def forward_to_running_instance(argv):
+    """
+    Hands this invocation to a running launcher if there is one. Returns an exit
+    status when the request was forwarded, or None to carry on in this process.
+    """
+    reply = send_instance_request(argv)
+    if reply is None:
+        return None
+    if not reply.get('ok'):
+        print(reply.get('error') or "The running launcher rejected the request.", file=sys.stderr)
+        return 2
+    print("Handed over to the running launcher.", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='launch.py', description="Launch or list games without the launcher window.")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument('--launch', metavar='GAME', help="start a game by name")
+    action.add_argument('--list', action='store_true', help="list every game in the catalog")
+    action.add_argument('--recent', nargs='?', const=3, type=int, metavar='COUNT',
+                        help="list the most recently played games (default 3)")
+    parser.add_argument('--json', action='store_true', help="print machine-readable JSON")
+    return parser
+
+
+def find_game(cp_games, name):
+    """Resolves a game name exactly, then ignoring case, spaces and underscores."""
+    game = cp_games.get_game_by_name(name)
+    if game:
+        return game
+    wanted = name.replace('_', ' ').casefold()
+    for game in cp_games.get_all_games():
+        if game['name'].replace('_', ' ').casefold() == wanted:
+            return game
+    return None
+
+
+def print_games(games, as_json):
+    if as_json:
+        json.dump(games, sys.stdout, indent=4)
+        print()
+        return
+    for game in games:
+        last_played = game.get('last_played') or 'never'
+        favorite = " *" if game.get('isFavorite') else ""
+        print(f"{game['name']}{favorite}\t{game.get('category') or '-'}\tlast played: {last_played}")
+
+
+def launch(cp_games, name, as_json):
+    """Starts a game through game_runner.py and records it as played. Returns the exit status."""
+    game = find_game(cp_games, name)
+    if game is None:
+        suggestions = difflib.get_close_matches(name, [g['name'] for g in cp_games.get_all_games()], n=3)
+        hint = f" Did you mean: {', '.join(suggestions)}?" if suggestions else ""
+        print(f"Unknown game '{name}'.{hint}", file=sys.stderr)
+        return 2
+    if game.get('type') == 'gui':
+        print(f"'{game['name']}' is a GUI game and can only be started from the launcher window.", file=sys.stderr)
+        return 2
+    game_path = cp_games.get_game_path(game['name'])
+    if not os.path.exists(os.path.join(game_path, 'main.py')):
+        print(f"'main.py' not found in '{game_path}'.", file=sys.stderr)
+        return 1
+    try:
+        process = subprocess.Popen([sys.executable, RUNNER_SCRIPT, game_path], cwd=game_path)
+    except OSError as e:
+        print(f"Could not launch '{game['name']}': {e}", file=sys.stderr)
+        return 1
+    with contextlib.redirect_stdout(sys.stderr):
+        cp_games.update_game_last_played(game['name'])
+    if as_json:
+        print(json.dumps({'name': game['name'], 'pid': process.pid}))
+    else:
+        print(f"Launched {game['name']} (pid {process.pid}).")
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from game_catalog import CPGames
+
+    # The catalog logs to stdout; keep stdout clean for the listing/JSON output
+    with contextlib.redirect_stdout(sys.stderr):
+        cp_games = CPGames(read_only=args.launch is None)
+    try:
+        if args.launch is not None:
+            return launch(cp_games, args.launch, args.json)
+        if args.list:
+            print_games(cp_games.get_all_games(), args.json)
+        else:
+            print_games(cp_games.get_recently_played_games(args.recent), args.json)
+        return 0
+    finally:
+        with contextlib.redirect_stdout(sys.stderr):
+            cp_games.close() # Writes the last_played update of --launch before exiting
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Discovery of playable game folders.
+
+A game is a folder holding a main.py next to games_config.json
+(<Name_With_Underscores>/main.py), or in an extra game directory passed as
+`search_dirs` (e.g. games/<folder>/main.py). Python packages (folders with an
+__init__.py, such as gamebox_engine) are never games. GameDiscovery keeps a manifest of what it found in
+.games_manifest.json, together with the mtime of every directory it looked at.
+A later scan lists only the search directories whose mtime changed and re-checks
+only the game folders whose own mtime changed, so an unchanged library costs one
+stat() per folder instead of a directory walk. Nothing here imports PyQt5.
+"""
+import os
+import json
+
+
+class GameDiscovery:
+    """
+    Finds playable game folders under `root_dir` and caches the result.
+
+    The manifest maps every search directory to its mtime and child folders, and
+    every child folder to its own mtime and whether it holds a main.py:
+        {"version": 2, "dirs": {".": {"mtime_ns": ..., "folders":
+            {"Snake": {"mtime_ns": ..., "playable": true}}}}}
+    Adding or removing a folder changes its search directory's mtime; adding or
+    removing main.py changes the folder's mtime.
+    """
+    MANIFEST_FILE = '.games_manifest.json'
+    MANIFEST_VERSION = 2
+    SEARCH_DIRS = ('.',) # Relative to root_dir
+    ENTRY_POINT = 'main.py'
+    # Launcher folders that never hold a game; games/ only has the non-working console stubs
+    IGNORED_FOLDERS = ('__pycache__', 'icons', 'benchmarks', 'logs', 'games')
+    PACKAGE_MARKER = '__init__.py'
+
+    def __init__(self, root_dir, search_dirs=None):
+        self.root_dir = os.path.abspath(root_dir)
+        self.search_dirs = tuple(search_dirs or self.SEARCH_DIRS)
+        self.manifest_path = os.path.join(self.root_dir, self.MANIFEST_FILE)
+        self._dirs = self._load_manifest()
+        self.stats = {'dirs_listed': 0, 'folders_checked': 0}
+
+    @staticmethod
+    def game_name(folder):
+        """The catalog name of a game folder: its name with underscores as spaces."""
+        return folder.replace('_', ' ')
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {} # No manifest yet (or an unreadable one): everything is scanned
+        if not isinstance(manifest, dict) or manifest.get('version') != self.MANIFEST_VERSION:
+            return {}
+        return manifest.get('dirs') or {}
+
+    def _save_manifest(self):
+        """
+        Writes the manifest. It is rewritten in place rather than replaced, because
+        creating a file in root_dir would change the mtime of the '.' search directory
+        and force a relisting on the next start; a torn write only costs a full scan.
+        """
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.MANIFEST_VERSION, 'dirs': self._dirs}, f)
+        except OSError as e:
+            print(f"Could not save the game manifest '{self.manifest_path}': {e}")
+
+    def _list_folders(self, search_dir, path):
+        """Lists the candidate game folders of one search directory."""
+        self.stats['dirs_listed'] += 1
+        folders = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if (entry.name.startswith('.') or entry.name in self.IGNORED_FOLDERS
+                        or (search_dir == '.' and entry.name in self.search_dirs)):
+                    continue
+                if not entry.is_dir():
+                    continue
+                if search_dir == '.' and os.path.isfile(os.path.join(entry.path, self.PACKAGE_MARKER)):
+                    continue # Shared code such as gamebox_engine
+                folders.append(entry.name)
+        return folders
+
+    def _scan_dir(self, search_dir, cached):
+        """
+        Brings one search directory's manifest entry up to date. Returns the new
+        entry (None if the directory doesn't exist) and whether anything changed.
+        """
+        path = os.path.join(self.root_dir, search_dir)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return None, cached is not None
+        cached_folders = cached['folders'] if cached else {}
+        changed = cached is None or cached['mtime_ns'] != mtime_ns
+        names = self._list_folders(search_dir, path) if changed else list(cached_folders)
+
+        folders = {}
+        for name in names:
+            folder_path = os.path.join(path, name)
+            try:
+                folder_mtime_ns = os.stat(folder_path).st_mtime_ns
+            except OSError:
+                changed = True # Removed since the directory was listed
+                continue
+            cached_folder = cached_folders.get(name)
+            if cached_folder and cached_folder['mtime_ns'] == folder_mtime_ns:
+                folders[name] = cached_folder
+                continue
+            self.stats['folders_checked'] += 1
+            folders[name] = {'mtime_ns': folder_mtime_ns,
+                             'playable': os.path.isfile(os.path.join(folder_path, self.ENTRY_POINT))}
+            changed = True
+        return {'mtime_ns': mtime_ns, 'folders': folders}, changed
+
+    def scan(self):
+        """
+        Updates the manifest from the changed directories and returns the playable
+        games (see games()).
+        """
+        dirs = {}
+        changed = bool(set(self._dirs) - set(self.search_dirs)) # Search directories were dropped
+        for search_dir in self.search_dirs:
+            entry, entry_changed = self._scan_dir(search_dir, self._dirs.get(search_dir))
+            if entry is not None:
+                dirs[search_dir] = entry
+            changed = changed or entry_changed
+        self._dirs = dirs
+        if changed:
+            self._save_manifest()
+        return self.games()
+
+    def games(self):
+        """
+        Returns the playable games of the last scan as {'name', 'path'} dictionaries,
+        sorted by name. `path` is relative to root_dir, with forward slashes.
+        """
+        games = []
+        for search_dir, entry in self._dirs.items():
+            for folder, info in entry['folders'].items():
+                if info['playable']:
+                    path = folder if search_dir == '.' else f"{search_dir}/{folder}"
+                    games.append({'name': self.game_name(folder), 'path': path})
+        games.sort(key=lambda game: game['name'].lower())
+        return games
+
+    def watch_paths(self):
+        """
+        Directories to watch for new games: the search directories, plus folders
+        without a main.py yet (a game copied in folder first, files second).
+        """
+        paths = []
+        for search_dir, entry in self._dirs.items():
+            path = os.path.normpath(os.path.join(self.root_dir, search_dir))
+            paths.append(path)
+            paths.extend(os.path.join(path, folder) for folder, info in entry['folders'].items()
+                         if not info['playable'])
+        return paths
@@ -0,0 +1,152 @@
+"""
+Bootstrap used by the launcher to start a game's main.py.
+
+Cold start:
+    python game_runner.py [--report-fd N] <game_folder>
+
+Warm start (fork-server mode): the interpreter imports pygame and the common
+standard library modules up front, then waits for a single JSON line on stdin,
+{"path": "<game_folder>"}, and runs that game with stdin switched to the null
+device, so the game never reads the launcher's command pipe. The launcher keeps
+one such pre-warmed child idle and hands it the next launch.
+
+In both modes the runner reports progress to the launcher as text lines on the
+inherited file descriptor given by --report-fd:
+    window          the game created its window (pygame.display.set_mode)
+    first_frame     the game flipped its first frame (pygame.display.flip/update)
+
+The launcher captures the game's stdout and stderr through a pipe. If the
+launcher exits while the game keeps running, later output is dropped instead
+of failing the game with BrokenPipeError.
+"""
+import os
+import sys
+import json
+import runpy
+
+# Modules most games import anyway; a warm child has them loaded before a launch
+WARM_IMPORTS = ('pygame', 'random', 'math', 'json', 'time', 'os', 'sys', 'collections', 'itertools',
+                'gamebox_engine.assets')
+REPO_DIR = os.path.dirname(os.path.abspath(__file__)) # Holds the shared gamebox_engine package
+
+
+class DetachableStream:
+    """Wraps sys.stdout/sys.stderr so output to a closed pipe is silently discarded."""
+    def __init__(self, stream):
+        self._stream = stream
+
+    def _detach(self):
+        self._stream = open(os.devnull, 'w')
+
+    def write(self, text):
+        try:
+            return self._stream.write(text)
+        except OSError:
+            self._detach()
+            return len(text)
+
+    def flush(self):
+        try:
+            self._stream.flush()
+        except OSError:
+            self._detach()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class LaunchReporter:
+    """Writes launch events to the launcher's report pipe (no-op without one)."""
+    def __init__(self, report_fd=None):
+        self.report_fd = report_fd
+        if report_fd is not None:
+            os.set_inheritable(report_fd, False) # Don't leak the pipe into processes the game starts
+
+    def send(self, event):
+        if self.report_fd is None:
+            return
+        try:
+            os.write(self.report_fd, f"{event}\n".encode('utf-8'))
+        except OSError:
+            self.report_fd = None # The launcher went away; the game keeps running
+
+    def install_pygame_hooks(self):
+        """Reports the game's first display.set_mode() and first display.flip()/display.update()."""
+        if self.report_fd is None:
+            return
+        try:
+            import pygame
+        except ImportError:
+            return
+        self._hook_first_call(pygame.display, ('set_mode',), 'window')
+        self._hook_first_call(pygame.display, ('flip', 'update'), 'first_frame')
+
+    def _hook_first_call(self, module, names, event):
+        """Wraps `names` in `module` so the first call to any of them sends `event`, then unwraps them."""
+        originals = {name: getattr(module, name) for name in names}
+
+        def restore():
+            for name, func in originals.items():
+                setattr(module, name, func)
+
+        def wrap(name):
+            def first_call(*args, **kwargs):
+                result = originals[name](*args, **kwargs)
+                restore()
+                self.send(event)
+                return result
+            return first_call
+
+        for name in names:
+            setattr(module, name, wrap(name))
+
+
+def run_game(game_folder, reporter):
+    """Runs `game_folder`/main.py as __main__, the same way `python main.py` would from that folder."""
+    game_folder = os.path.abspath(game_folder)
+    os.chdir(game_folder)
+    sys.argv = ['main.py']
+    sys.path[0] = game_folder # Games import their sibling modules (objects.py, ...)
+    if REPO_DIR not in sys.path:
+        sys.path.append(REPO_DIR) # ... and gamebox_engine, after everything else so it shadows nothing
+    reporter.install_pygame_hooks()
+    runpy.run_path('main.py', run_name='__main__')
+
+
+def wait_for_launch():
+    """Pre-warms the interpreter, then blocks until the launcher names the game to run."""
+    for module in WARM_IMPORTS:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+    line = sys.stdin.readline()
+    if not line:
+        sys.exit(0) # The launcher closed the pipe without launching anything
+    # Detach the command pipe from fd 0, for the game and any process it starts
+    null_fd = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null_fd, sys.stdin.fileno())
+    os.close(null_fd)
+    return json.loads(line)['path']
+
+
+def main():
+    sys.stdout = DetachableStream(sys.stdout)
+    sys.stderr = DetachableStream(sys.stderr)
+    args = sys.argv[1:]
+    report_fd = None
+    if args[:1] == ['--report-fd']:
+        report_fd = int(args[1])
+        args = args[2:]
+    reporter = LaunchReporter(report_fd)
+    if args == ['--warm']:
+        game_folder = wait_for_launch()
+    elif len(args) == 1:
+        game_folder = args[0]
+    else:
+        sys.exit("usage: game_runner.py [--report-fd N] (--warm | <game_folder>)")
+    run_game(game_folder, reporter)
+
+
+if __name__ == '__main__':
+    main()
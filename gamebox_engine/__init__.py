@@ -0,0 +1,10 @@
+"""
+Code shared by the pygame games in this repository.
+
+    gamebox_engine.assets      decode-once cache of image surfaces
+    gamebox_engine.animation   animation clips shared between sprites, per-sprite playheads
+
+The launcher's game runner puts the repository root on sys.path, so a game can
+import this package when started from the launcher; games started on their own
+with `python main.py` add the root themselves (see their imports).
+"""
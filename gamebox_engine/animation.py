@@ -0,0 +1,103 @@
+"""
+Shared animation clips for the pygame games.
+
+An AnimationClip is an immutable sequence of frames plus how long each frame is
+shown (in update ticks). load_clip() builds a clip from image files through the
+assets cache and keeps it for the rest of the process, so every sprite playing
+the same animation shares one clip, and no file is read once the first sprite
+has loaded it. What a sprite owns is a Playhead, its position in a clip:
+
+    from gamebox_engine import animation
+    self.animation = animation.Playhead(animation.load_clip(
+        [f'Assets/Explosion1/{i}.png' for i in range(1, 4)], frame_ticks=7, loop=False))
+    ...
+    self.animation.update()
+    if self.animation.finished:
+        self.kill()
+    else:
+        self.image = self.animation.image
+"""
+from gamebox_engine import assets
+
+
+class AnimationClip:
+    """Immutable frames of an animation and the number of ticks each one is shown."""
+    __slots__ = ('frames', 'frame_ticks', 'loop')
+
+    def __init__(self, frames, frame_ticks=1, loop=True):
+        object.__setattr__(self, 'frames', tuple(frames))
+        object.__setattr__(self, 'frame_ticks', max(1, int(frame_ticks)))
+        object.__setattr__(self, 'loop', bool(loop))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AnimationClip is immutable; it is shared by every sprite playing it")
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, index):
+        return self.frames[index]
+
+
+_CLIPS = {} # (paths, frame_ticks, loop, image options) -> AnimationClip
+
+
+def load_clip(paths, frame_ticks=1, loop=True, **image_options):
+    """
+    Returns the shared clip of the given image files, loading it on first use.
+    `image_options` are passed to assets.load_image (scale, flip_x, alpha, ...).
+    """
+    key = (tuple(paths), frame_ticks, loop, tuple(sorted(image_options.items())))
+    clip = _CLIPS.get(key)
+    if clip is None:
+        clip = AnimationClip([assets.load_image(path, **image_options) for path in paths], frame_ticks, loop)
+        _CLIPS[key] = clip
+    return clip
+
+
+class Playhead:
+    """
+    One sprite's position in a clip: the frame shown, the ticks spent on it, and
+    whether a non-looping clip has played out. A non-looping clip stays on its
+    last frame once finished.
+    """
+    __slots__ = ('clip', 'index', 'ticks', 'finished')
+
+    def __init__(self, clip):
+        self.clip = clip
+        self.index = 0
+        self.ticks = 0
+        self.finished = False
+
+    @property
+    def image(self):
+        return self.clip.frames[self.index]
+
+    def play(self, clip, restart=True):
+        """
+        Switches to `clip`. Without `restart` the position is kept, e.g. to turn
+        a walk cycle around with its mirrored clip of the same length.
+        """
+        self.clip = clip
+        if restart:
+            self.index = 0
+            self.ticks = 0
+            self.finished = False
+
+    def step(self):
+        """Moves to the next frame now, for sprites that keep their own timing."""
+        if self.index + 1 < len(self.clip.frames):
+            self.index += 1
+        elif self.clip.loop:
+            self.index = 0
+        else:
+            self.finished = True
+        self.ticks = 0
+
+    def update(self):
+        """Advances one tick, moving to the next frame after the clip's frame_ticks."""
+        if self.finished:
+            return
+        self.ticks += 1
+        if self.ticks >= self.clip.frame_ticks:
+            self.step()
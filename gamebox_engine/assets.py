@@ -0,0 +1,107 @@
+"""
+Decode-once image cache for the pygame games.
+
+Sprites are created many times during play (every bullet, egg, explosion), and
+loading their image in the constructor meant reading and decoding a PNG from
+disk mid-frame, once per spawn. load_image() decodes each file once per process
+and keeps every variant a game asks for (scaled, flipped, converted to the
+display's pixel format, with a color key) keyed by exactly those parameters, so
+all sprites of one kind share a single surface:
+
+    from gamebox_engine import assets
+    self.image = assets.load_image('Assets/Bullets/1.png', scale=(20, 40))
+
+Surfaces returned by the cache are shared: blit them, never draw onto them or
+change their alpha or color key in place (ask for a different variant instead).
+"""
+import os
+
+import pygame
+
+
+class SurfaceCache:
+    """
+    Surfaces keyed by (path, scale, flip, alpha mode, color key). Each file is
+    decoded once; a variant is derived from the decoded file the first time it
+    is asked for. Hit/miss counters and the bytes held are kept for stats().
+    """
+
+    def __init__(self):
+        self._files = {} # absolute path -> decoded surface, converted to the display format
+        self._surfaces = {} # full key -> derived surface
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.bytes = 0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    def _decode(self, path, alpha):
+        """Decodes a file once, converted to the display format when a window exists."""
+        key = (path, alpha)
+        if key not in self._files:
+            surface = pygame.image.load(path)
+            if pygame.display.get_surface() is not None:
+                # Without a window there is no display format yet; blitting still works, just slower
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            self._files[key] = surface
+            self.decodes += 1
+            self.bytes += self._surface_bytes(surface)
+        return self._files[key]
+
+    def load(self, path, scale=None, flip_x=False, flip_y=False, alpha=True, colorkey=None):
+        """
+        Returns the shared surface of an image file.
+
+        `scale` is a (width, height) to scale to, applied after flipping; `alpha`
+        keeps per-pixel transparency (convert_alpha) or drops it (convert), and
+        `colorkey` sets a transparent color on the result (RLE accelerated).
+        """
+        path = os.path.abspath(path)
+        scale = tuple(scale) if scale is not None else None
+        key = (path, scale, bool(flip_x), bool(flip_y), bool(alpha), tuple(colorkey) if colorkey is not None else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+
+        surface = self._decode(path, key[4])
+        if flip_x or flip_y:
+            surface = pygame.transform.flip(surface, flip_x, flip_y)
+        if scale is not None and scale != surface.get_size():
+            surface = pygame.transform.scale(surface, scale)
+        if colorkey is not None:
+            if surface is self._files[(path, key[4])]:
+                surface = surface.copy() # The color key must not leak into the other variants
+            surface.set_colorkey(colorkey, pygame.RLEACCEL)
+        if surface is not self._files[(path, key[4])]:
+            self.bytes += self._surface_bytes(surface)
+        self._surfaces[key] = surface
+        return surface
+
+    def stats(self):
+        """Returns the cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses, 'decodes': self.decodes, 'bytes': self.bytes,
+                'entries': len(self._surfaces)}
+
+    def clear(self):
+        """Drops every cached surface, e.g. after the window (and its pixel format) changed."""
+        self._files.clear()
+        self._surfaces.clear()
+        self.bytes = 0
+
+
+SURFACE_CACHE = SurfaceCache()
+
+
+def load_image(path, scale=None, flip_x=False, flip_y=False, alpha=True, colorkey=None):
+    """Returns the shared surface of an image file from the process-wide cache (see SurfaceCache.load)."""
+    return SURFACE_CACHE.load(path, scale, flip_x, flip_y, alpha, colorkey)
+
+
+def stats():
+    """Hit, miss, decode and byte counters of the process-wide cache."""
+    return SURFACE_CACHE.stats()
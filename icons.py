@@ -1,8 +1,14 @@
 import os
+import argparse
+import hashlib
+import json
+import linecache
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 import random
 import colorsys
 import math
+import numpy as np
 
 # List of your 30 game names (from CPGames in your launcher)
 GAME_NAMES = [
@@ -17,6 +23,9 @@ GAME_NAMES = [
 # Output directory for icons
 ICONS_DIR = 'icons'
 LAUNCHER_ICON_NAME = 'game.ico' # Name for the main launcher icon
+ICONS_MANIFEST = '.icons_manifest.json' # Next to ICONS_DIR: build hash of every generated file
+ATLAS_MANIFEST = os.path.join(ICONS_DIR, 'atlas.json') # Where each icon sits in the atlases
+ATLAS_SIZES = (72, 96, 144, 192) # Strip and grid card icons in launch.py, at 1x and 2x device pixel ratio
 
 # Icon dimensions
 ICON_SIZE = (128, 128) # Standard size for game icons
@@ -66,6 +75,7 @@ GAME_THEMES = {
     'Tetris': {'shape': 'tetromino_block', 'colors': [(50, 0, 100), (100, 50, 200)], 'shape_color': (180, 100, 255)}, # Deep indigo, falling blocks
     'Tic Tac Toe': {'shape': 'x_o_grid', 'colors': [(100, 20, 0), (200, 70, 30)], 'shape_color': (255, 120, 80)}, # Burnt orange, classic grid
 }
+DEFAULT_THEME = {'shape': 'default', 'colors': [(50,50,50), (100,100,100)], 'shape_color': (150,150,150)} # Games without a theme
 
 
 def get_font_path(is_emoji=False):
@@ -92,24 +102,51 @@ def get_font_path(is_emoji=False):
             return path
     return None
 
+def gradient_array(t, start_color, end_color):
+    """
+    Colors between start_color (t=0) and end_color (t=1) for an array of positions,
+    truncated to integers like the per-step drawing code. Returns a uint8 RGB array.
+    """
+    start = np.array(start_color[:3], dtype=np.float64)
+    end = np.array(end_color[:3], dtype=np.float64)
+    return np.trunc(start + (end - start) * np.asarray(t)[..., None]).astype(np.uint8)
+
+
+def paint_disc_stack(img, center, radii, colors):
+    """
+    Paints filled discs around `center`, in order, as one array operation: every
+    pixel gets the color of the last disc that covers it, as drawing them one
+    ellipse at a time would leave it, without overdrawing the image per disc.
+    """
+    width, height = img.size
+    y, x = np.ogrid[0:height, 0:width]
+    dist_sq = (x - center[0]) ** 2.0 + (y - center[1]) ** 2.0
+    # The last disc covering a pixel is the last one whose suffix maximum radius
+    # still reaches it (+0.5, as Pillow rasterises an integer bounding box)
+    radii = np.asarray(radii, dtype=np.float64)
+    reach_sq = (np.maximum.accumulate(radii[::-1])[::-1] + 0.5) ** 2
+    index = np.searchsorted(-reach_sq, -dist_sq, side='right') - 1
+    rgb = np.take(np.asarray(colors, dtype=np.uint8)[:, :3], np.clip(index, 0, len(radii) - 1), axis=0)
+
+    # Together the discs cover exactly the largest one; one real ellipse gives
+    # the mask Pillow's own edge, so only the boundaries between discs are estimated
+    outer = radii.max()
+    mask = Image.new('L', img.size, 0)
+    ImageDraw.Draw(mask).ellipse((center[0] - outer, center[1] - outer, center[0] + outer, center[1] + outer), fill=255)
+    img.paste(Image.fromarray(rgb, 'RGB'), (0, 0), mask)
+
+
 def draw_radial_gradient(img, draw, center, radius, start_color, end_color):
     """Draws a radial gradient on the image."""
     width, height = img.size
     max_radius = max(width, height) / 2
     
-    # Generate gradient colors
+    # Generate gradient colors, one disc per step
     steps = int(max_radius)
-    for i in range(steps):
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * i / (steps - 1))
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * i / (steps - 1))
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * i / (steps - 1))
-        color = (r, g, b)
-        
-        current_radius = int(max_radius * (i + 1) / steps)
-        # Draw a filled circle for each step
-        draw.ellipse((center[0] - current_radius, center[1] - current_radius,
-                      center[0] + current_radius, center[1] + current_radius),
-                     fill=color)
+    t = np.arange(steps) / (steps - 1)
+    colors = gradient_array(t, start_color, end_color)
+    radii = (max_radius * (np.arange(steps) + 1) / steps).astype(int)
+    paint_disc_stack(img, center, radii, colors)
 
 
 # --- Shape Drawing Functions (Enhanced for thematic icons with 3D illusion) ---
@@ -852,7 +889,7 @@ def generate_game_icon(game_name, icon_path):
     Generates a more beautiful and thematic icon for a game.
     """
     try:
-        theme = GAME_THEMES.get(game_name, {'shape': 'default', 'colors': [(50,50,50), (100,100,100)], 'shape_color': (150,150,150)})
+        theme = GAME_THEMES.get(game_name, DEFAULT_THEME)
         start_color = theme['colors'][0]
         end_color = theme['colors'][1]
         shape_type = theme['shape']
@@ -879,8 +916,10 @@ def generate_game_icon(game_name, icon_path):
 
         img.save(icon_path, "PNG")
         print(f"Generated icon: {icon_path}")
+        return True
     except Exception as e:
         print(f"Error generating icon for {game_name}: {e}")
+        return False
 
 def generate_launcher_icon(output_path):
     """Generates a simple launcher icon with a game controller emoji."""
@@ -908,8 +947,10 @@ def generate_launcher_icon(output_path):
         # Save as ICO with multiple sizes for best display across Windows
         img.save(output_path, "ICO", sizes=[(s,s) for s in [16, 24, 32, 48, 64, 128, 256]])
         print(f"Generated launcher icon: {output_path}")
+        return True
     except Exception as e:
         print(f"Error generating launcher icon: {e}")
+        return False
 
 def generate_generic_game_icon():
     """Generates a generic fallback icon (a question mark on grey)."""
@@ -935,23 +976,219 @@ def generate_generic_game_icon():
 
         img.save(os.path.join(ICONS_DIR, "generic_game.png"), "PNG")
         print(f"Generated generic icon: {os.path.join(ICONS_DIR, 'generic_game.png')}")
+        return True
     except Exception as e:
         print(f"Error generating generic icon: {e}")
+        return False
 
-if __name__ == "__main__":
-    # Generate individual game icons
+
+# --- Icon Atlas ---
+# Every icon in ICONS_DIR is also packed, at each of ATLAS_SIZES, into one image
+# (atlas_<size>.png) so the launcher opens and decodes one file per card size
+# instead of one per game. ATLAS_MANIFEST records each icon's rectangle in every
+# atlas and the size and mtime of the file it was made from; the launcher uses an
+# atlas entry only while that file is unchanged, and the file itself otherwise.
+
+def atlas_filename(size):
+    return f"atlas_{size}.png"
+
+
+def atlas_sources():
+    """The icon files packed into the atlases, with their (size in bytes, mtime_ns)."""
+    sources = {}
+    for name in sorted(os.listdir(ICONS_DIR)):
+        if name.endswith('.png') and not name.startswith('atlas_'):
+            stat = os.stat(os.path.join(ICONS_DIR, name))
+            sources[name] = (stat.st_size, stat.st_mtime_ns)
+    return sources
+
+
+def atlas_is_current():
+    """True if the atlases exist for ATLAS_SIZES and were made from the icon files as they are now."""
+    try:
+        with open(ATLAS_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        packed = {name: (entry['bytes'], entry['mtime_ns']) for name, entry in manifest['icons'].items()}
+        sizes = manifest['sizes']
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    if sorted(sizes, key=int) != [str(size) for size in ATLAS_SIZES]:
+        return False
+    if not all(os.path.exists(os.path.join(ICONS_DIR, file_name)) for file_name in sizes.values()):
+        return False
+    return packed == atlas_sources()
+
+
+def build_icon_atlas():
+    """
+    Packs every icon of ICONS_DIR into one atlas per size in ATLAS_SIZES, on a
+    square grid of size x size cells, and writes ATLAS_MANIFEST. Returns True on success.
+    """
+    try:
+        sources = atlas_sources()
+        if not sources:
+            return False
+        images = {name: Image.open(os.path.join(ICONS_DIR, name)).convert('RGBA') for name in sources}
+        columns = math.ceil(math.sqrt(len(images)))
+        rows = math.ceil(len(images) / columns)
+        entries = {name: {'bytes': stat[0], 'mtime_ns': stat[1], 'rects': {}} for name, stat in sources.items()}
+
+        # An old manifest must not describe the new atlases while they are written
+        if os.path.exists(ATLAS_MANIFEST):
+            os.remove(ATLAS_MANIFEST)
+        for size in ATLAS_SIZES:
+            atlas = Image.new('RGBA', (columns * size, rows * size), (0, 0, 0, 0))
+            for index, (name, image) in enumerate(images.items()):
+                # Fitted into the cell keeping the aspect ratio, as the launcher scales single icons
+                scale = size / max(image.size)
+                width, height = max(1, round(image.width * scale)), max(1, round(image.height * scale))
+                x, y = index % columns * size, index // columns * size
+                atlas.paste(image.resize((width, height), Image.LANCZOS), (x, y))
+                entries[name]['rects'][str(size)] = [x, y, width, height]
+            atlas.save(os.path.join(ICONS_DIR, atlas_filename(size)), "PNG")
+
+        with open(ATLAS_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({'sizes': {str(size): atlas_filename(size) for size in ATLAS_SIZES}, 'icons': entries}, f)
+        print(f"Generated icon atlases: {len(images)} icons at {', '.join(f'{size}px' for size in ATLAS_SIZES)}")
+        return True
+    except Exception as e:
+        print(f"Error generating icon atlas: {e}")
+        return False
+
+
+# --- Incremental Icon Build ---
+# Every generated file is recorded in ICONS_MANIFEST with a hash of everything its
+# pixels depend on. A build re-renders only the files whose hash changed (or that
+# are missing), spreading them over worker processes.
+
+# Drawing code shared by every icon; a change to any of it rebuilds them all
+SHARED_ICON_FUNCTIONS = (generate_game_icon, draw_radial_gradient, paint_disc_stack, gradient_array,
+                         apply_bevel_effect, draw_radial_gradient_sphere, get_font_path)
+
+
+def icon_filename(game_name):
+    """The icon file of a game (lowercase, spaces as underscores, '&' as 'and'), as launch.py looks it up."""
+    return f"{game_name.lower().replace(' ', '_').replace('&', 'and')}.png"
+
+
+def function_source(function):
+    """
+    The source lines of a function, located from its code objects' line table;
+    inspect.getsource() at a fraction of the cost per function. The range ends at
+    the last line with bytecode, so trailing lines without any (such as the lone
+    closing bracket of a multi-line call) are not included; they cannot change
+    what the function does without also changing a line that is.
+    """
+    code = function.__code__
+    codes, last_line = [code], code.co_firstlineno
+    while codes:
+        current = codes.pop()
+        last_line = max([last_line] + [line for _, _, line in current.co_lines() if line is not None])
+        codes.extend(const for const in current.co_consts if hasattr(const, 'co_lines')) # Nested functions and lambdas
+    return ''.join(linecache.getlines(code.co_filename)[code.co_firstlineno - 1:last_line])
+
+
+def build_hash(*parts):
+    """Hashes the sources and values a generated file depends on."""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode('utf-8') if isinstance(part, str) else repr(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def icon_build_targets():
+    """
+    Every file the icon build writes, as (path, hash, function, args): calling
+    function(*args) renders the file and returns True on success.
+    """
+    shared_source = ''.join(function_source(function) for function in SHARED_ICON_FUNCTIONS)
+    shared_style = (BORDER_COLOR, BORDER_WIDTH)
+    fonts = (get_font_path(False), get_font_path(True)) # Installing or removing a font changes the icons too
+    targets = []
     for game in GAME_NAMES:
-        # Normalize game name for filename (lowercase, replace spaces with underscores, handle '&')
-        filename_game_name = game.lower().replace(' ', '_').replace('&', 'and')
-        icon_filename = f"{filename_game_name}.png"
-        icon_path = os.path.join(ICONS_DIR, icon_filename)
-        generate_game_icon(game, icon_path)
+        theme = GAME_THEMES.get(game, DEFAULT_THEME)
+        shape_function = shape_draw_functions.get(theme['shape'], shape_draw_functions['default'])
+        icon_path = os.path.join(ICONS_DIR, icon_filename(game))
+        digest = build_hash(game, sorted(theme.items()), function_source(shape_function), ICON_SIZE,
+                            shared_source, shared_style, fonts)
+        targets.append((icon_path, digest, generate_game_icon, (game, icon_path)))
+    targets.append((LAUNCHER_ICON_NAME,
+                    build_hash(function_source(generate_launcher_icon), LAUNCHER_ICON_SIZE,
+                               shared_source, shared_style, fonts),
+                    generate_launcher_icon, (LAUNCHER_ICON_NAME,)))
+    targets.append((os.path.join(ICONS_DIR, "generic_game.png"),
+                    build_hash(function_source(generate_generic_game_icon), ICON_SIZE,
+                               shared_source, shared_style, fonts),
+                    generate_generic_game_icon, ()))
+    return targets
+
+
+def load_icon_manifest():
+    """Returns the hashes of the files built, and of those that failed, by the last build."""
+    try:
+        with open(ICONS_MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return dict(manifest['built']), dict(manifest['failed'])
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}, {} # No manifest yet (or an unreadable one): everything is rebuilt
+
+
+def save_icon_manifest(built, failed):
+    try:
+        with open(ICONS_MANIFEST, 'w', encoding='utf-8') as f:
+            json.dump({'built': built, 'failed': failed}, f, indent=4, sort_keys=True)
+    except OSError as e:
+        print(f"Could not save the icon manifest '{ICONS_MANIFEST}': {e}")
 
-    # Generate the main launcher icon
-    generate_launcher_icon(LAUNCHER_ICON_NAME)
 
-    # Generate the generic fallback game icon
-    generate_generic_game_icon()
+def build_icons(force=False, jobs=None):
+    """
+    Renders the icons whose build hash changed since the last build (all of them
+    with `force`), `jobs` at a time. An icon that failed is only retried once its
+    hash changes, since the same code would fail the same way. Returns the number
+    of files rendered.
+    """
+    built, failed = load_icon_manifest()
+    targets = icon_build_targets()
+
+    def is_current(path, digest):
+        if built.get(path) == digest:
+            return os.path.exists(path)
+        return failed.get(path) == digest
+
+    stale = [target for target in targets if force or not is_current(target[0], target[1])]
+    if len(stale) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(function, *args) for _, _, function, args in stale]
+            results = [future.result() for future in futures]
+    else:
+        results = [function(*args) for _, _, function, args in stale] # A worker pool would cost more than it saves
+
+    stale_paths = {target[0] for target in stale}
+    new_built = {path: digest for path, digest, _, _ in targets if path not in stale_paths and built.get(path) == digest}
+    new_failed = {path: digest for path, digest, _, _ in targets if path not in stale_paths and failed.get(path) == digest}
+    for (path, digest, _, _), ok in zip(stale, results):
+        (new_built if ok else new_failed)[path] = digest
+    if (new_built, new_failed) != (built, failed):
+        save_icon_manifest(new_built, new_failed)
+
+    print(f"{len(stale)} of {len(targets)} icons rebuilt, {len(targets) - len(stale)} up to date.")
+    if new_failed:
+        print(f"Failing (not retried until their code changes, or with --force): {', '.join(sorted(new_failed))}")
+
+    if force or not atlas_is_current():
+        build_icon_atlas()
+    return len(stale)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the launcher and game icons, rebuilding only what changed.")
+    parser.add_argument('--force', action='store_true', help="rebuild every icon, even unchanged ones")
+    parser.add_argument('--jobs', type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    build_icons(force=args.force, jobs=args.jobs)
 
     print("\nIcon generation complete.")
     print(f"Please ensure '{LAUNCHER_ICON_NAME}' is in the same directory as 'launch.py'.")
@@ -1,18 +1,87 @@
 import os
 import sys
 import subprocess
-import threading
+import signal
+import socket
+import time
 import json
+import hashlib
+import threading
 from datetime import datetime
-import tempfile # Import for temporary file operations
+
+_PROCESS_START = time.perf_counter() # Reference point for --profile-startup
+
+import game_cli
+
+if __name__ == '__main__':
+    # A launcher is already running for this catalog: hand it the request (launch a game
+    # or come to the front) and exit, before paying for any imports
+    forwarded = game_cli.forward_to_running_instance(sys.argv[1:])
+    if forwarded is not None:
+        sys.exit(forwarded)
+    if game_cli.wants_cli(sys.argv[1:]):
+        # Headless fast path (--launch / --list / --recent): never imports PyQt5
+        sys.exit(game_cli.main(sys.argv[1:]))
+
+import game_catalog
+from play_telemetry import PlaySessionStore
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox,
     QGridLayout, QScrollArea, QGraphicsDropShadowEffect, QHBoxLayout, QDialog, QLineEdit,
-    QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy, QListView, QStyledItemDelegate, QStyle, QPlainTextEdit
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize, QRect, QRectF, QPoint, QTimer, QFileSystemWatcher,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel, QEvent, QObject, QRunnable, QThreadPool,
+    QSocketNotifier
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QSize, QRect, QPoint, QTimer
-from PyQt5.QtGui import QIcon, QColor, QFont, QPixmap, QImage
+from PyQt5.QtGui import QIcon, QColor, QFont, QPixmap, QImage, QPainter, QPen, QImageWriter
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+# --- Startup Profiling ---
+class StartupProfiler:
+    """
+    Records when each launcher startup phase finished (imports, config load, card
+    build, first paint, ...), relative to the start of launch.py. Marks are always
+    cheap to record; the report is only written with --profile-startup.
+    """
+    REPORT_FILE = 'startup_profile.json'
+
+    def __init__(self, start):
+        self.start = start
+        self.enabled = False
+        self.phases = [] # (phase name, seconds since start)
+
+    def mark(self, phase):
+        """Records that `phase` has just finished."""
+        self.phases.append((phase, time.perf_counter() - self.start))
+
+    def report(self):
+        """Returns the recorded phases with per-phase durations, in milliseconds."""
+        rows, previous = [], 0.0
+        for phase, elapsed in self.phases:
+            rows.append({'phase': phase, 'at_ms': round(elapsed * 1000, 3), 'duration_ms': round((elapsed - previous) * 1000, 3)})
+            previous = elapsed
+        return {'phases': rows, 'total_ms': round(previous * 1000, 3)}
+
+    def write_report(self, path=None):
+        """Writes the report as JSON and prints a summary table."""
+        path = path or self.REPORT_FILE
+        report = self.report()
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=4)
+        except OSError as e:
+            print(f"Could not write startup profile to '{path}': {e}")
+        print("--- Startup profile ---")
+        for row in report['phases']:
+            print(f"{row['phase']:<16} {row['duration_ms']:9.1f} ms   (at {row['at_ms']:9.1f} ms)")
+        print(f"Startup profile written to {os.path.abspath(path)}")
+
+
+STARTUP_PROFILER = StartupProfiler(_PROCESS_START)
+STARTUP_PROFILER.mark('imports')
 
 # --- Placeholder Game Classes ---
 # These are placeholders. In a real application, you'd import your actual game classes.
@@ -56,216 +125,1150 @@ class QtGameWindow(QMainWindow):
         layout.addWidget(label)
         print(f"--- Launched {name} (GUI) ---")
 
-# --- Game Class Mapping (from JSON) ---
-# This dictionary will map game names from JSON to their actual Python classes.
-# You will need to manually map your game classes here.
+# --- In-process GUI Games ---
+# Games are discovered from their folders (see game_discovery.py) and run as separate
+# processes. Only games of type 'gui' that are Qt windows living in the launcher's own
+# process need their class mapped here.
 GAME_CLASS_MAP = {
-    'Aeroblasters': BaseGame,
-    'Angry Walls': BaseGame,
-    'Arc Dash': BaseGame,
-    'Asteroids': BaseGame,
-    'Bounce': BaseGame,
-    'Car Racing 2d': BaseGame,
-    'Cave Story': BaseGame,
-    'Connected': BaseGame,
-    'Dodgy Walls': BaseGame,
-    'Dots & Boxes': BaseGame,
-    'Egg Catching Game': BaseGame,
-    'Flappy Bird': BaseGame,
-    'GhostBusters': BaseGame,
-    'Hangman': BaseGame,
-    'Hex Dash': BaseGame,
-    'HyperTile Dash': BaseGame,
-    'Jungle Dash': BaseGame,
-    'Level Designer': BaseGame,
-    'Memory Puzzle': BaseGame,
-    'MineSweeper': BaseGame,
-    'Piano Tiles': BaseGame,
-    'Picture Sliding Puzzle': BaseGame,
-    'Pong': BaseGame,
-    'Qircle Rush': BaseGame,
-    'Rock Paper Scissor': BaseGame,
-    'Rotate Dash': BaseGame,
-    'Snake': BaseGame,
-    'SpriteSheet Cutter': BaseGame,
-    'Tetris': BaseGame,
-    'Tic Tac Toe': BaseGame,
-    # Example for a GUI game, if you have one:
     # 'MyQtGame': QtGameWindow,
 }
 
 
-class CPGames:
-    """Manages the collection of supported games, now loaded from JSON."""
-    CONFIG_FILE = 'games_config.json'
+class CPGames(game_catalog.CPGames):
+    """The shared game catalog (see game_catalog.py), reporting load and save errors in message boxes."""
+    def report_error(self, title, message):
+        QMessageBox.critical(None, title, message)
 
-    def __init__(self):
-        # Display the full path of the config file being used
-        self.full_config_path = os.path.abspath(self.CONFIG_FILE)
-        QMessageBox.information(None, "Config File Path", f"Attempting to load/save config from: {self.full_config_path}")
-        print(f"CPGames initialized. Config file path: {self.full_config_path}")
 
-        self.games_data = self.load_games_config()
-        # Map game names to their data for quick lookup
-        self.games_by_name = {game['name']: game for game in self.games_data}
+# --- Game Process Supervisor ---
+class GameOutputLog:
+    """
+    Captured stdout/stderr of one game, shared by all its launches: the most recent
+    RING_BYTES in memory, and everything in a rotating log file,
+    <log_dir>/<Game_Name>.log, with BACKUP_COUNT older files kept as .1, .2, ...
+    """
+    RING_BYTES = 64 * 1024
+    MAX_FILE_BYTES = 1024 * 1024
+    BACKUP_COUNT = 3
+    LOG_DIR = 'logs'
+
+    def __init__(self, game_name, log_dir):
+        self.game_name = game_name
+        file_name = "".join(c if c.isalnum() or c in '-_.' else '_' for c in game_name)
+        self.path = os.path.join(log_dir, f"{file_name}.log")
+        self._ring = bytearray()
+        self._file = None
+        self._file_size = 0
+        self._file_failed = False
+
+    def open_session(self, pid, warm=False):
+        """Writes a header line for a new launch of the game."""
+        started = datetime.now().isoformat(sep=' ', timespec='seconds')
+        self.write(f"=== {started}: {self.game_name} started (pid {pid}{', pre-warmed' if warm else ''}) ===\n".encode('utf-8'))
+
+    def close_session(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, data):
+        self._ring += data
+        if len(self._ring) > self.RING_BYTES:
+            del self._ring[:len(self._ring) - self.RING_BYTES]
+        if self._file_failed:
+            return
+        try:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._file = open(self.path, 'ab', buffering=0)
+                self._file_size = self._file.tell()
+            if self._file_size and self._file_size + len(data) > self.MAX_FILE_BYTES:
+                self._rotate()
+            self._file.write(data)
+            self._file_size += len(data)
+        except OSError as e:
+            print(f"Could not write the output log '{self.path}': {e}")
+            self._file_failed = True # Keep capturing into memory only
+            self.close_session()
+
+    def _rotate(self):
+        self.close_session()
+        for index in range(self.BACKUP_COUNT - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self._file = open(self.path, 'ab', buffering=0)
+        self._file_size = 0
+
+    def text(self):
+        """The captured output of this run, or the tail of the log file from earlier runs."""
+        data = bytes(self._ring)
+        if not data:
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(max(0, os.path.getsize(self.path) - self.RING_BYTES))
+                    data = f.read()
+            except OSError:
+                pass
+        return data.decode('utf-8', 'replace')
+
+
+class GameSession:
+    """A launched game process and its lifetime bookkeeping."""
+    def __init__(self, game_name, process, warm=False):
+        self.game_name = game_name
+        self.process = process
+        self.pid = process.pid
+        self.warm = warm # Started from a pre-warmed interpreter (fork-server mode)
+        self.start_time = time.time() # Wall-clock start, for display/persistence
+        self._start_monotonic = time.monotonic()
+        self.exit_code = None
+        self.runtime = None # Wall-clock seconds, set once the process has exited
+        self.window_latency = None # Seconds from launch to the game's window being created, if reported
+        self.first_frame_latency = None # Seconds from launch to the game's first frame, if reported
+        self._report_fd = None
+        self._report_notifier = None
+        self.output_log = None # GameOutputLog receiving the game's stdout/stderr, if captured
+        self._output_notifier = None
+        self.peak_rss_kb = None # Highest resident set size seen, in KiB
+        self.cpu_time = None # User + system CPU seconds, as last measured
+
+    @property
+    def running(self):
+        return self.exit_code is None
+
+    @property
+    def reports_readiness(self):
+        """True if the game reports window creation and its first frame to the launcher."""
+        return self._report_fd is not None or self.first_frame_latency is not None
+
+    def elapsed(self):
+        """Seconds since launch (the final runtime once the process has exited)."""
+        return self.runtime if self.runtime is not None else time.monotonic() - self._start_monotonic
+
+    def record_usage(self, peak_rss_kb, cpu_time):
+        """Merges a resource measurement: peaks only grow, CPU time is cumulative."""
+        if peak_rss_kb is not None:
+            self.peak_rss_kb = max(self.peak_rss_kb or 0, peak_rss_kb)
+        if cpu_time is not None:
+            self.cpu_time = max(self.cpu_time or 0.0, cpu_time)
+
+
+class ResourceSampler(QObject):
+    """
+    Samples the peak RSS and CPU time of every running game from /proc/<pid> on
+    one timer shared by all sessions: two small reads per game per interval, no
+    thread per game. The kernel keeps the RSS high-water mark (VmHWM), so peaks
+    between samples are not missed. Without /proc the sampler stays idle and only
+    the final figures from wait4() are recorded.
+    """
+    INTERVAL_MS = 2000
+    PROC_DIR = '/proc'
+
+    def __init__(self, supervisor):
+        super().__init__(supervisor)
+        self.supervisor = supervisor
+        self.available = os.path.isdir(os.path.join(self.PROC_DIR, 'self'))
+        self.clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.INTERVAL_MS)
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        if self.available and not self.timer.isActive():
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def sample(self):
+        for session in self.supervisor.running_sessions():
+            session.record_usage(*self.read_usage(session.pid))
+
+    def read_usage(self, pid):
+        """Returns (peak RSS in KiB, CPU seconds) of a live process; None for what can't be read."""
+        peak_rss_kb = cpu_time = None
+        try:
+            with open(os.path.join(self.PROC_DIR, str(pid), 'status'), 'rb') as f:
+                for line in f:
+                    if line.startswith(b'VmHWM:'):
+                        peak_rss_kb = int(line.split()[1])
+                        break
+            with open(os.path.join(self.PROC_DIR, str(pid), 'stat'), 'rb') as f:
+                # Fields after the parenthesized command name; utime and stime are the 12th and 13th
+                fields = f.read().rsplit(b')', 1)[1].split()
+                cpu_time = (int(fields[11]) + int(fields[12])) / self.clock_ticks
+        except (OSError, IndexError, ValueError):
+            pass # Exited between samples
+        return peak_rss_kb, cpu_time
+
 
-    def load_games_config(self):
+class GameProcessSupervisor(QObject):
+    """
+    Launches game processes and tracks them until they exit.
+
+    Each game is started with `cwd=` set to its folder, so the launcher's own working
+    directory never changes. Exited children are reaped without a polling thread: on
+    POSIX a SIGCHLD handler writes to a wakeup socket watched by a QSocketNotifier, so
+    the GUI thread only wakes when a child actually exits (platforms without SIGCHLD
+    fall back to checking on a GUI-thread timer). At most `max_concurrent` games run at
+    once; further launches are queued and started as running games exit.
+
+    On POSIX each game's stdout and stderr go to one pipe, read without blocking when
+    its QSocketNotifier fires, into the game's GameOutputLog (a bounded in-memory tail
+    plus a rotating log file), so no thread is needed per running game.
+
+    Games are started through game_runner.py, which reports window creation and the
+    first frame back over an inherited pipe (the readiness handshake), so the launcher
+    knows when a game is actually up and how long it took. In fork-server mode
+    (WARM_POOL, on unless GAMEBOX_WARM_POOL=0) one idle runner that has already
+    imported pygame is kept ready; a launch hands it the game, and the next idle
+    runner is pre-warmed once that game has shown its first frame.
+    """
+    game_started = pyqtSignal(str, int) # game name, pid
+    game_exited = pyqtSignal(str, int, float) # game name, exit code, runtime in seconds
+    game_window_created = pyqtSignal(str, float) # game name, seconds from launch to window creation
+    game_first_frame = pyqtSignal(str, float, bool) # game name, seconds from launch to first frame, pre-warmed
+    launch_failed = pyqtSignal(str, str) # game name, error message
+    launch_queued = pyqtSignal(str) # game name, waiting for a free slot
+    game_output = pyqtSignal(str) # game name, new output was captured
+    session_finished = pyqtSignal(object) # GameSession, after its process was reaped
+
+    MAX_CONCURRENT = 3
+    FALLBACK_POLL_MS = 1000 # Only used where SIGCHLD is unavailable
+    RUNNER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'game_runner.py')
+    WARM_POOL = os.environ.get('GAMEBOX_WARM_POOL', '1') != '0'
+
+    def __init__(self, max_concurrent=None, warm_pool=None, log_dir=None, parent=None):
+        super().__init__(parent)
+        self.max_concurrent = max_concurrent or self.MAX_CONCURRENT
+        self.warm_pool = self.WARM_POOL if warm_pool is None else warm_pool
+        self.log_dir = log_dir or os.path.abspath(GameOutputLog.LOG_DIR)
+        self.output_logs = {} # game name -> GameOutputLog
+        self.sampler = ResourceSampler(self) # Peak RSS and CPU time of all running games
+        self.sessions = [] # All sessions of this run, oldest first
+        self._running = {} # pid -> running GameSession
+        self._queue = [] # (game name, game path, command) waiting for a free slot
+        self._warm_child = None # (Popen, report fd) of the idle pre-warmed runner
+        self._closed = False
+        self._wakeup_sockets = None
+        self._previous_sigchld = None
+        self._poll_timer = None
+        if hasattr(signal, 'SIGCHLD'):
+            self._install_sigchld_notifier()
+        else:
+            self._poll_timer = QTimer(self)
+            self._poll_timer.setInterval(self.FALLBACK_POLL_MS)
+            self._poll_timer.timeout.connect(self.reap)
+
+    def _install_sigchld_notifier(self):
+        """Routes SIGCHLD into the Qt event loop through a non-blocking wakeup socket."""
+        read_sock, write_sock = socket.socketpair()
+        read_sock.setblocking(False)
+        write_sock.setblocking(False)
+        self._wakeup_sockets = (read_sock, write_sock)
+        signal.set_wakeup_fd(write_sock.fileno())
+        # The Python-level handler is a no-op: the C-level handler writes the wakeup byte
+        self._previous_sigchld = signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        signal.siginterrupt(signal.SIGCHLD, False) # Restart interrupted system calls in Qt
+        self._notifier = QSocketNotifier(read_sock.fileno(), QSocketNotifier.Read, self)
+        self._notifier.activated.connect(self._on_wakeup)
+
+    def _on_wakeup(self):
+        try:
+            while self._wakeup_sockets[0].recv(512):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        self.reap()
+
+    @staticmethod
+    def _open_report_pipe():
+        """Returns (read fd, write fd) for a runner's report channel, or (None, None) where fds can't be inherited."""
+        if os.name != 'posix':
+            return None, None
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        return read_fd, write_fd
+
+    @staticmethod
+    def _output_options():
+        """Popen arguments that capture a child's stdout and stderr, where pipes can be watched."""
+        if os.name != 'posix':
+            return {}
+        # Unbuffered, so output shows up as it is printed rather than when a buffer fills
+        return {'stdout': subprocess.PIPE, 'stderr': subprocess.STDOUT,
+                'env': dict(os.environ, PYTHONUNBUFFERED='1')}
+
+    def output_log(self, game_name):
+        """Returns the GameOutputLog of a game (it may not have captured anything yet)."""
+        if game_name not in self.output_logs:
+            self.output_logs[game_name] = GameOutputLog(game_name, self.log_dir)
+        return self.output_logs[game_name]
+
+    def _runner_command(self, write_fd, *args):
+        command = [sys.executable, self.RUNNER_SCRIPT]
+        if write_fd is not None:
+            command += ['--report-fd', str(write_fd)]
+        return command + list(args)
+
+    def session(self, pid):
+        """Returns the running session with the given pid, or None."""
+        return self._running.get(pid)
+
+    def running_sessions(self):
+        """Returns the sessions whose process is still alive."""
+        return list(self._running.values())
+
+    def is_running(self, game_name):
+        return any(session.game_name == game_name for session in self._running.values())
+
+    def launch(self, game_name, game_path, command=None):
         """
-        Loads game data from the JSON configuration file.
-        Raises an exception if the file is not found or is invalid.
-        Ensures 'isFavorite' and 'category' fields exist.
+        Starts the game in `game_path` (through game_runner.py unless `command` is given).
+        Returns the new GameSession, or None if the launch was queued or failed (see the
+        signals).
         """
-        if not os.path.exists(self.CONFIG_FILE):
-            # If config file doesn't exist, create a default one
-            print(f"Config file '{self.CONFIG_FILE}' not found. Creating a new one with default data.")
-            default_games_data = [
-                {"name": "Aeroblasters", "description": "A high-flying arcade shooter.", "type": "non_gui", "category": "Shooter", "last_played": None, "isFavorite": False},
-                {"name": "Angry Walls", "description": "A challenging puzzle game.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Arc Dash", "description": "A fast-paced reflex game.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "Asteroids", "description": "Classic arcade action!", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "Bounce", "description": "A physics-based platformer.", "type": "non_gui", "category": "Platformer", "last_played": None, "isFavorite": False},
-                {"name": "Car Racing 2d", "description": "Top-down 2D racing.", "type": "non_gui", "category": "Racing", "last_played": None, "isFavorite": False},
-                {"name": "Cave Story", "description": "Classic indie adventure.", "type": "non_gui", "category": "Adventure", "last_played": None, "isFavorite": False},
-                {"name": "Connected", "description": "Minimalist puzzle game.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Dodgy Walls", "description": "Navigate a treacherous maze.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Dots & Boxes", "description": "Classic pen-and-paper game.", "type": "non_gui", "category": "Board Game", "last_played": None, "isFavorite": False},
-                {"name": "Egg Catching Game", "description": "Catch falling eggs!", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "Flappy Bird", "description": "Infamous mobile game.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "GhostBusters", "description": "Bust ghosts and save the city.", "type": "non_gui", "category": "Action", "last_played": None, "isFavorite": False},
-                {"name": "Hangman", "description": "Guess the word letter by letter.", "type": "non_gui", "category": "Word Game", "last_played": None, "isFavorite": False},
-                {"name": "Hex Dash", "description": "Navigate a hexagonal maze.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "HyperTile Dash", "description": "Tap tiles in sequence.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Jungle Dash", "description": "Run, jump, and slide.", "type": "non_gui", "category": "Runner", "last_played": None, "isFavorite": False},
-                {"name": "Level Designer", "description": "Design your own game levels.", "type": "non_gui", "category": "Utility", "last_played": None, "isFavorite": False},
-                {"name": "Memory Puzzle", "description": "Test your memory skills.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "MineSweeper", "description": "Clear the minefield.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Piano Tiles", "description": "Test your finger speed and rhythm.", "type": "non_gui", "category": "Rhythm", "last_played": None, "isFavorite": False},
-                {"name": "Picture Sliding Puzzle", "description": "Rearrange scrambled tiles.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Pong", "description": "Original arcade classic.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "Qircle Rush", "description": "Guide your circle through obstacles.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "Rock Paper Scissor", "description": "Ultimate decision-making game.", "type": "non_gui", "category": "Casual", "last_played": None, "isFavorite": False},
-                {"name": "Rotate Dash", "description": "Rotate the world to guide your character.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Snake", "description": "Retro arcade hit.", "type": "non_gui", "category": "Arcade", "last_played": None, "isFavorite": False},
-                {"name": "SpriteSheet Cutter", "description": "Utility tool for sprite sheets.", "type": "non_gui", "category": "Utility", "last_played": None, "isFavorite": False},
-                {"name": "Tetris", "description": "Iconic puzzle game.", "type": "non_gui", "category": "Puzzle", "last_played": None, "isFavorite": False},
-                {"name": "Tic Tac Toe", "description": "Timeless game of X's and O's.", "type": "non_gui", "category": "Board Game", "last_played": None, "isFavorite": False},
-            ]
-            self._atomic_save(default_games_data)
-            return default_games_data
+        if len(self._running) >= self.max_concurrent:
+            self._queue.append((game_name, game_path, command))
+            print(f"--- {game_name} queued: {len(self._running)} games already running. ---")
+            self.launch_queued.emit(game_name)
+            return None
+        return self._start(game_name, game_path, command)
+
+    def _start(self, game_name, game_path, command):
+        if command is None:
+            session = self._start_warm(game_name, game_path)
+            if session is not None:
+                return session
+            read_fd, write_fd = self._open_report_pipe()
+            command = self._runner_command(write_fd, os.path.abspath(game_path))
+        else:
+            read_fd = write_fd = None
+        try:
+            process = subprocess.Popen(command, cwd=game_path, pass_fds=() if write_fd is None else (write_fd,),
+                                       **self._output_options())
+        except OSError as e:
+            if read_fd is not None:
+                os.close(read_fd)
+            print(f"Error launching game '{game_name}': {e}")
+            self.launch_failed.emit(game_name, str(e))
+            return None
+        finally:
+            if write_fd is not None:
+                os.close(write_fd) # Only the child writes to the report pipe
+        return self._track(GameSession(game_name, process), read_fd)
+
+    def _start_warm(self, game_name, game_path):
+        """Hands the launch to the idle pre-warmed runner, if there is a live one."""
+        if self._warm_child is None:
+            return None
+        process, read_fd = self._warm_child
+        self._warm_child = None
+        try:
+            if process.poll() is not None:
+                raise OSError(f"pre-warmed runner exited with code {process.returncode}")
+            process.stdin.write((json.dumps({'path': os.path.abspath(game_path)}) + '\n').encode('utf-8'))
+            process.stdin.close()
+        except OSError as e:
+            print(f"Pre-warmed runner unavailable, starting {game_name} cold: {e}")
+            if read_fd is not None:
+                os.close(read_fd)
+            return None
+        return self._track(GameSession(game_name, process, warm=True), read_fd)
+
+    def _track(self, session, read_fd):
+        self.sessions.append(session)
+        self._running[session.pid] = session
+        if self._poll_timer is not None and not self._poll_timer.isActive():
+            self._poll_timer.start()
+        self.sampler.start()
+        print(f"--- Launched {session.game_name} (pid {session.pid}{', pre-warmed' if session.warm else ''}). ---")
+        if session.process.stdout is not None:
+            session.output_log = self.output_log(session.game_name)
+            session.output_log.open_session(session.pid, session.warm)
+            output_fd = session.process.stdout.fileno()
+            os.set_blocking(output_fd, False)
+            session._output_notifier = QSocketNotifier(output_fd, QSocketNotifier.Read, self)
+            session._output_notifier.activated.connect(lambda fd, session=session: self._read_output(session))
+        if read_fd is not None:
+            session._report_fd = read_fd
+            session._report_notifier = QSocketNotifier(read_fd, QSocketNotifier.Read, self)
+            session._report_notifier.activated.connect(lambda fd, session=session: self._read_reports(session))
+        else:
+            QTimer.singleShot(0, self.start_warm_pool) # No first-frame report will come
+        self.game_started.emit(session.game_name, session.pid)
+        return session
 
+    def _read_reports(self, session):
+        """Handles the event lines a runner writes to its report pipe."""
+        if session._report_fd is None:
+            return
         try:
-            with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    raise ValueError("JSON content is not a list. Expected a list of game objects.")
-                
-                # Ensure all games have 'isFavorite' and 'category' fields
-                for game in data:
-                    if 'isFavorite' not in game:
-                        game['isFavorite'] = False
-                    if 'category' not in game:
-                        game['category'] = "" # Default to empty string
-                return data
-        except json.JSONDecodeError as e:
-            QMessageBox.critical(None, "Configuration Error", f"Error decoding JSON from '{self.CONFIG_FILE}': {e}. "
-                                 "Please check the file for syntax errors or delete it to generate a new one.")
-            return [] # Return empty list on error
-        except Exception as e:
-            QMessageBox.critical(None, "Configuration Error", f"An unexpected error occurred while loading '{self.CONFIG_FILE}': {e}")
-            return [] # Return empty list on error
-
-    def _atomic_save(self, data_to_save):
+            data = os.read(session._report_fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b''
+        if not data:
+            # The game exited (or crashed) before reporting; warm the next runner anyway
+            self._close_reports(session)
+            self.start_warm_pool()
+            return
+        for event in data.decode('utf-8', 'replace').split():
+            if event == 'window' and session.window_latency is None:
+                session.window_latency = time.monotonic() - session._start_monotonic
+                self.game_window_created.emit(session.game_name, session.window_latency)
+            elif event == 'first_frame' and session.first_frame_latency is None:
+                session.first_frame_latency = time.monotonic() - session._start_monotonic
+                mode = 'warm' if session.warm else 'cold'
+                print(f"--- {session.game_name} first frame after {session.first_frame_latency:.3f}s ({mode}). ---")
+                self.game_first_frame.emit(session.game_name, session.first_frame_latency, session.warm)
+                # Pre-warm the next runner only now, so it doesn't compete with this game's startup
+                self.start_warm_pool()
+
+    def _read_output(self, session):
+        """Moves what the game printed into its output log. Returns False once nothing is left to read."""
+        if session._output_notifier is None:
+            return False
+        try:
+            data = os.read(session.process.stdout.fileno(), 65536)
+        except BlockingIOError:
+            return False
+        except OSError:
+            data = b''
+        if not data:
+            self._close_output(session) # The game (and anything it started) closed its output
+            return False
+        session.output_log.write(data)
+        self.game_output.emit(session.game_name)
+        return True
+
+    def _close_output(self, session):
+        if session._output_notifier is not None:
+            session._output_notifier.setEnabled(False)
+            session._output_notifier.deleteLater()
+            session._output_notifier = None
+            session.process.stdout.close()
+            session.output_log.close_session()
+
+    def _close_reports(self, session):
+        if session._report_notifier is not None:
+            session._report_notifier.setEnabled(False)
+            session._report_notifier.deleteLater()
+            session._report_notifier = None
+        if session._report_fd is not None:
+            os.close(session._report_fd)
+            session._report_fd = None
+
+    def start_warm_pool(self):
+        """Starts an idle pre-warmed runner if fork-server mode is on and none is waiting."""
+        if not self.warm_pool or self._closed or self._warm_child is not None:
+            return
+        read_fd, write_fd = self._open_report_pipe()
+        try:
+            process = subprocess.Popen(self._runner_command(write_fd, '--warm'), stdin=subprocess.PIPE,
+                                       cwd=os.path.dirname(self.RUNNER_SCRIPT),
+                                       pass_fds=() if write_fd is None else (write_fd,),
+                                       **self._output_options())
+        except OSError as e:
+            print(f"Could not start a pre-warmed game runner: {e}")
+            if read_fd is not None:
+                os.close(read_fd)
+            return
+        finally:
+            if write_fd is not None:
+                os.close(write_fd)
+        self._warm_child = (process, read_fd)
+
+    @staticmethod
+    def _wait(session):
         """
-        Saves data to the JSON configuration file using an atomic write.
-        This writes to a temporary file and then renames it to prevent data corruption
-        in case of write errors or crashes.
+        waitpid(WNOHANG) on one child. Where wait4() exists it also returns the child's
+        final resource usage, which is recorded on the session.
         """
-        temp_file_path = None
+        if not hasattr(os, 'wait4') or session.process.returncode is not None:
+            return session.process.poll()
         try:
-            # Create a temporary file in the same directory as the config file
-            temp_fd, temp_file_path = tempfile.mkstemp(dir=os.path.dirname(self.full_config_path), suffix='.tmp')
-            with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=4)
-                f.flush()
-                os.fsync(f.fileno()) # Ensure data is written to disk
-
-            # Atomically replace the old config file with the new one
-            os.replace(temp_file_path, self.full_config_path)
-            print(f"Games config saved successfully to {self.full_config_path} using atomic write!")
-
-        except IOError as e:
-            QMessageBox.critical(None, "File Save Error", f"Could not save '{self.CONFIG_FILE}'. Please check file permissions. Error: {e}")
-            print(f"IOError during atomic save: {e}")
-        except Exception as e:
-            QMessageBox.critical(None, "File Save Error", f"An unexpected error occurred while saving '{self.CONFIG_FILE}': {e}")
-            print(f"General error during atomic save: {e}")
-        finally:
-            # Clean up the temporary file if it still exists (e.g., if an error occurred before rename)
-            if temp_file_path and os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
-                print(f"Cleaned up temporary file: {temp_file_path}")
-
-
-    def save_games_config(self):
-        """Saves current in-memory game data back to the JSON configuration file."""
-        self._atomic_save(self.games_data)
-
-
-    def reload_games_config(self):
-        """Reloads game data from the JSON configuration file into memory."""
-        print("Reloading games config from disk...")
-        self.games_data = self.load_games_config()
-        self.games_by_name = {game['name']: game for game in self.games_data}
-        print("Games config reloaded.")
-
-
-    def get_all_games(self):
-        """Returns a list of all game data dictionaries."""
-        return self.games_data
-
-    def get_game_by_name(self, game_name):
-        """Returns the data dictionary for a specific game name."""
-        return self.games_by_name.get(game_name)
-
-    def update_game_last_played(self, game_name):
-        """Updates the 'last_played' timestamp for a game."""
-        game = self.games_by_name.get(game_name)
-        if game:
-            game['last_played'] = datetime.now().isoformat()
-            self.save_games_config() # Save changes immediately
-
-    def toggle_game_favorite(self, game_name):
-        """Toggles the 'isFavorite' status for a game."""
-        game = self.games_by_name.get(game_name)
-        if game:
-            game['isFavorite'] = not game.get('isFavorite', False) # Toggle, default to False
-            self.save_games_config() # Save changes immediately
-
-    def get_recently_played_games(self, count=3):
-        """Returns a list of recently played games, sorted by last_played."""
-        played_games = [g for g in self.games_data if g.get('last_played')]
-        # Sort in descending order of last_played timestamp
-        played_games.sort(key=lambda x: x['last_played'], reverse=True)
-        return played_games[:count]
-
-    def get_favorite_games(self):
-        """Returns a list of games marked as favorites."""
-        return [g for g in self.games_data if g.get('isFavorite', False)]
-
-    def clear_recently_played_data(self):
+            pid, status, usage = os.wait4(session.pid, os.WNOHANG)
+        except ChildProcessError:
+            return session.process.poll() # Already collected elsewhere
+        if pid == 0:
+            return None
+        session.process.returncode = os.waitstatus_to_exitcode(status)
+        # ru_maxrss is in KiB on Linux (bytes on macOS, where /proc sampling is unavailable anyway)
+        peak_rss_kb = usage.ru_maxrss if sys.platform != 'darwin' else usage.ru_maxrss // 1024
+        session.record_usage(peak_rss_kb, usage.ru_utime + usage.ru_stime)
+        return session.process.returncode
+
+    def reap(self):
+        """Collects every tracked child that has exited, without blocking."""
+        for pid, session in list(self._running.items()):
+            exit_code = self._wait(session)
+            if exit_code is None:
+                continue
+            del self._running[pid]
+            session.exit_code = exit_code
+            session.runtime = time.monotonic() - session._start_monotonic
+            self._read_reports(session) # Pick up anything written just before exiting
+            self._close_reports(session)
+            while self._read_output(session): # The last lines usually explain a non-zero exit code
+                pass
+            self._close_output(session)
+            print(f"--- {session.game_name} (pid {pid}) exited with code {exit_code} after {session.runtime:.1f}s. ---")
+            self.session_finished.emit(session)
+            self.game_exited.emit(session.game_name, exit_code, session.runtime)
+        if self._warm_child is not None and self._warm_child[0].poll() is not None:
+            # An idle runner died (e.g. a broken pygame install); the next launch starts cold
+            process, read_fd = self._warm_child
+            self._warm_child = None
+            if read_fd is not None:
+                os.close(read_fd)
+            print(f"Pre-warmed game runner exited unexpectedly with code {process.returncode}.")
+        while self._queue and len(self._running) < self.max_concurrent:
+            self._start(*self._queue.pop(0))
+        if self._poll_timer is not None and not self._running:
+            self._poll_timer.stop()
+        if not self._running:
+            self.sampler.stop()
+
+    def close(self):
+        """Stops watching children and retires the idle runner. Running games are left running."""
+        self._closed = True
+        self._queue.clear()
+        self.sampler.stop()
+        if self._warm_child is not None:
+            process, read_fd = self._warm_child
+            self._warm_child = None
+            process.stdin.close() # The idle runner exits when its command pipe closes
+            if read_fd is not None:
+                os.close(read_fd)
+        for session in self._running.values():
+            self._close_reports(session)
+            if session._output_notifier is not None:
+                # game_runner.py drops further output once nobody reads the pipe
+                session._output_notifier.setEnabled(False)
+                session.output_log.close_session()
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+        if self._wakeup_sockets is not None:
+            self._notifier.setEnabled(False)
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, self._previous_sigchld or signal.SIG_DFL)
+            for sock in self._wakeup_sockets:
+                sock.close()
+            self._wakeup_sockets = None
+
+
+# --- Asynchronous Image Loading ---
+class ImageDecodeTask(QRunnable):
+    """
+    Decodes a batch of images on a worker thread. Each job is (key, paths, max_size)
+    and is turned into a QImage by the loader's decode function. QImage (unlike
+    QPixmap) is safe to use off the GUI thread; results are handed back through the
+    loader's queued signal.
+    """
+    def __init__(self, loader, jobs):
+        super().__init__()
+        self.loader = loader
+        self.jobs = jobs
+
+    def run(self):
+        for key, paths, max_size in self.jobs:
+            self.loader.image_decoded.emit(key, self.loader.decode(paths, max_size))
+
+
+class AsyncImageLoader(QObject):
+    """
+    Decodes image files on a QThreadPool and delivers the resulting QImages to
+    callbacks on the GUI thread. Concurrent requests for the same key share one
+    decode. Requests are collected and dispatched in batches once control returns
+    to the event loop, so the workers do not compete with the GUI thread while it
+    is still building widgets.
+    """
+    image_decoded = pyqtSignal(str, QImage) # Emitted from worker threads, delivered queued
+
+    def __init__(self, decode=None, parent=None):
+        super().__init__(parent)
+        self.decode = decode or self.decode_file # Called on worker threads
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max(2, QThreadPool.globalInstance().maxThreadCount() // 2))
+        self._callbacks = {} # key -> callbacks waiting for that image
+        self._pending_jobs = [] # Jobs not yet handed to the pool
+        self.image_decoded.connect(self._on_image_decoded, Qt.QueuedConnection)
+
+    @staticmethod
+    def decode_file(paths, max_size=None):
+        """Decodes the first readable file of `paths`, downscaled to fit `max_size` if given."""
+        image = QImage()
+        for path in paths:
+            if os.path.exists(path):
+                image = QImage(path)
+                if not image.isNull():
+                    break
+        if not image.isNull() and max_size and (image.width() > max_size or image.height() > max_size):
+            image = image.scaled(max_size, max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def load(self, key, paths, callback, max_size=None):
+        """Decodes the first readable file of `paths` off-thread and calls `callback(QImage)`."""
+        if key in self._callbacks:
+            self._callbacks[key].append(callback)
+            return
+        self._callbacks[key] = [callback]
+        if not self._pending_jobs:
+            QTimer.singleShot(0, self._dispatch)
+        self._pending_jobs.append((key, paths, max_size))
+
+    def is_idle(self):
+        """Returns True when no decode is pending."""
+        return not self._callbacks
+
+    def _dispatch(self):
+        """Splits the queued jobs into one batch per worker thread."""
+        jobs, self._pending_jobs = self._pending_jobs, []
+        workers = self.pool.maxThreadCount()
+        for i in range(min(workers, len(jobs))):
+            self.pool.start(ImageDecodeTask(self, jobs[i::workers]))
+
+    def _on_image_decoded(self, key, image):
+        for callback in self._callbacks.pop(key, []):
+            callback(image)
+
+
+# --- Predictive Asset Prefetch ---
+class AssetPrefetchTask(QRunnable):
+    """
+    Warms the OS page cache for the files of a few game folders, in ranking order,
+    until the I/O budget is spent or the task is cancelled. Files larger than what
+    is left of the budget are skipped, not a reason to stop. Uses
+    posix_fadvise(WILLNEED) where available (the kernel reads ahead on its own),
+    and bounded sequential reads elsewhere.
+    """
+    CHUNK_SIZE = 1024 * 1024
+    SKIPPED_FOLDERS = ('__pycache__', '.git')
+
+    def __init__(self, prefetcher, games, budget, cancelled):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.games = games # [(game name, game folder)]
+        self.budget = budget
+        self.cancelled = cancelled # threading.Event set on launch
+
+    @classmethod
+    def asset_files(cls, game_path):
+        """Yields (path, size) for the files a game may read at startup: everything in its folder."""
+        for folder, subfolders, files in os.walk(game_path):
+            subfolders[:] = [name for name in subfolders if name not in cls.SKIPPED_FOLDERS]
+            for name in files:
+                path = os.path.join(folder, name)
+                try:
+                    yield path, os.path.getsize(path)
+                except OSError:
+                    continue
+
+    def warm_file(self, path, size):
+        with open(path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+                return
+            buffer = bytearray(self.CHUNK_SIZE)
+            while not self.cancelled.is_set() and f.readinto(buffer):
+                pass
+
+    def run(self):
+        budget = self.budget
+        for game_name, game_path in self.games:
+            warmed = 0
+            for path, size in self.asset_files(game_path):
+                if self.cancelled.is_set():
+                    return
+                if size > budget:
+                    continue # Smaller files, here or in lower-ranked games, may still fit
+                try:
+                    self.warm_file(path, size)
+                except OSError:
+                    continue
+                budget -= size
+                warmed += size
+                if not budget:
+                    break
+            if self.cancelled.is_set():
+                return
+            self.prefetcher.game_prefetched.emit(game_name, warmed)
+            if not budget:
+                return
+
+
+class AssetPrefetcher(QObject):
+    """
+    Predicts the games most likely to be launched next (CPGames.get_likely_next_games)
+    and warms the page cache for their folders on a background thread, so a cold
+    launch of an asset-heavy game finds its images, sounds and fonts in memory.
+    A pass is cancelled as soon as any game launches, leaving the disk to it.
+    Disabled with GAMEBOX_PREFETCH=0.
+    """
+    game_prefetched = pyqtSignal(str, int) # Game name, bytes warmed; emitted from the worker thread
+    MAX_GAMES = 3
+    BUDGET_BYTES = 64 * 1024 * 1024 # Per pass, across all predicted games
+    ENABLED = os.environ.get('GAMEBOX_PREFETCH', '1') != '0'
+
+    def __init__(self, cp_games, parent=None):
+        super().__init__(parent)
+        self.cp_games = cp_games
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1) # One sequential reader; parallel reads only add seeks
+        self._cancelled = None
+        self.prefetched = {} # game name -> bytes warmed by the last pass
+        self.game_prefetched.connect(self._on_game_prefetched, Qt.QueuedConnection)
+
+    def start(self):
+        """Cancels the running pass, if any, and prefetches the currently predicted games."""
+        if not self.ENABLED:
+            return
+        self.cancel()
+        games = [(game['name'], self.cp_games.get_game_path(game['name']))
+                 for game in self.cp_games.get_likely_next_games(self.MAX_GAMES)
+                 if game.get('type') != 'gui']
+        if not games:
+            return
+        self.prefetched = {}
+        self._cancelled = threading.Event()
+        self.pool.start(AssetPrefetchTask(self, games, self.BUDGET_BYTES, self._cancelled))
+
+    def cancel(self):
+        if self._cancelled is not None:
+            self._cancelled.set()
+
+    def was_prefetched(self, game_name):
+        return game_name in self.prefetched
+
+    def close(self):
+        self.cancel()
+        self.pool.waitForDone()
+
+    def _on_game_prefetched(self, game_name, warmed):
+        self.prefetched[game_name] = warmed
+        print(f"Prefetched {warmed / 1024 / 1024:.1f} MiB of assets for {game_name}.")
+
+
+# --- Shared Icon Cache ---
+class IconPixmapCache:
+    """
+    Process-wide cache of game icon pixmaps keyed by (game name, size, device pixel ratio).
+
+    Each icon file is decoded once; every card that needs the icon at a given size
+    gets the same pixmap, scaled once from the original image (never from an already
+    scaled copy). Hit/miss/decode counters are kept so the cache can be checked in use.
+
+    request() decodes icons on a worker pool: callers show a placeholder first and
+    receive the real pixmap through a callback once it is ready, so building the
+    window never waits on image I/O. get() is the synchronous equivalent.
+
+    When icons.py has packed the icons into atlases (icons/atlas_<size>.png, see
+    icons/atlas.json), an icon needed at an atlas size is sliced out of that size's
+    atlas with QPixmap.copy, so one file is opened and decoded per card size instead
+    of one per game. Icons whose file changed since the atlas was built are decoded
+    from the file as before.
+    """
+    ASYNC_DECODE = True
+    USE_ATLAS = True
+    ATLAS_MANIFEST = 'atlas.json'
+
+    def __init__(self, icons_dir='icons', default_icon='generic_game.png'):
+        self.icons_dir = icons_dir
+        self.default_icon_path = os.path.join(icons_dir, default_icon)
+        self._images = {} # game name -> decoded QImage (None if it could not be loaded)
+        self._pixmaps = {} # (game name, size, device pixel ratio) -> QPixmap (None if no icon)
+        self._placeholders = {} # (size, device pixel ratio) -> placeholder QPixmap
+        self._atlas_manifest = None # Contents of ATLAS_MANIFEST, read on first use ({} if there is none)
+        self._atlases = {} # atlas path -> QPixmap (None if it could not be loaded)
+        self._loader = None # Created on first use, it needs a running QApplication
+        self.hits = 0
+        self.misses = 0
+        self.decodes = 0
+        self.atlas_slices = 0
+
+    @staticmethod
+    def icon_filename(game_name):
+        """Normalizes a game name to its icon filename (lowercase, underscores, '&' -> 'and')."""
+        return f"{game_name.lower().replace(' ', '_').replace('&', 'and')}.png"
+
+    @property
+    def loader(self):
+        """The shared worker-pool image loader."""
+        if self._loader is None:
+            self._loader = AsyncImageLoader()
+        return self._loader
+
+    def _icon_paths(self, game_name):
+        """Candidate icon files for a game, most specific first."""
+        return [os.path.join(self.icons_dir, self.icon_filename(game_name)), self.default_icon_path]
+
+    def _store_image(self, game_name, image):
+        self._images[game_name] = None if image is None or image.isNull() else image
+        self.decodes += 1
+
+    def _load_image(self, game_name):
+        """Decodes a game's icon synchronously, once."""
+        if game_name not in self._images:
+            image = QImage()
+            for path in self._icon_paths(game_name):
+                if os.path.exists(path):
+                    image = QImage(path)
+                    if not image.isNull():
+                        break
+            self._store_image(game_name, image)
+        return self._images[game_name]
+
+    def _make_pixmap(self, key):
+        """Scales the decoded source image for `key` and caches the pixmap."""
+        game_name, size, device_pixel_ratio = key
+        image = self._images.get(game_name)
+        pixmap = None
+        if image is not None:
+            physical_size = int(round(size * device_pixel_ratio))
+            pixmap = QPixmap.fromImage(image.scaled(physical_size, physical_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def _load_atlas_manifest(self):
+        try:
+            with open(os.path.join(self.icons_dir, self.ATLAS_MANIFEST), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {} # No atlas (icons.py has not built one): decode single files
+        if not isinstance(manifest, dict) or not all(isinstance(manifest.get(part), dict) for part in ('sizes', 'icons')):
+            return {}
+        return manifest
+
+    def _atlas_slot(self, game_name, physical_size):
         """
-        Clears the 'last_played' timestamp for all games by modifying the in-memory
-        data directly and then saving it using an atomic write.
+        Returns (atlas path, QRect) of the game's icon in the atlas of `physical_size`,
+        or None if there is no such atlas or the icon file changed since it was packed.
         """
-        print("Clearing recently played data by modifying in-memory data and saving atomically...")
-        # Iterate directly over self.games_data and set last_played to None
-        for game in self.games_data:
-            if 'last_played' in game:
-                game['last_played'] = None
-        
-        # Save this modified data to the config file using the atomic save method
-        self.save_games_config()
-        print("Recently played data cleared and config file saved atomically.")
+        if not self.USE_ATLAS:
+            return None
+        if self._atlas_manifest is None:
+            self._atlas_manifest = self._load_atlas_manifest()
+        atlas_file = self._atlas_manifest.get('sizes', {}).get(str(physical_size))
+        if atlas_file is None:
+            return None
+        atlas_path = os.path.join(self.icons_dir, atlas_file)
+        if self._atlases.get(atlas_path, True) is None:
+            return None # The atlas itself could not be loaded
+        for path in self._icon_paths(game_name):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue # No icon of its own: the generic icon, as in _load_image()
+            entry = self._atlas_manifest['icons'].get(os.path.basename(path))
+            if entry is None or (entry['bytes'], entry['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+                return None # Added or changed since the atlas was built
+            return atlas_path, QRect(*entry['rects'][str(physical_size)])
+        return None
+
+    def _store_atlas(self, atlas_path, image):
+        """Keeps a decoded atlas as a pixmap (None if it could not be decoded) and returns it."""
+        if atlas_path not in self._atlases:
+            self._atlases[atlas_path] = None if image.isNull() else QPixmap.fromImage(image)
+            self.decodes += 1
+        return self._atlases[atlas_path]
+
+    def _slice_atlas(self, key, atlas, rect):
+        """Cuts the icon for `key` out of its atlas and caches the pixmap."""
+        pixmap = atlas.copy(rect)
+        pixmap.setDevicePixelRatio(key[2])
+        self._pixmaps[key] = pixmap
+        self.atlas_slices += 1
+        return pixmap
+
+    def get(self, game_name, size, device_pixel_ratio=1.0):
+        """
+        Returns the icon for a game scaled to `size` logical pixels, falling back to the
+        generic icon, or None if neither image is available. Decodes synchronously.
+        """
+        key = (game_name, size, device_pixel_ratio)
+        if key in self._pixmaps:
+            self.hits += 1
+            return self._pixmaps[key]
+        self.misses += 1
+        slot = self._atlas_slot(game_name, int(round(size * device_pixel_ratio)))
+        if slot is not None:
+            atlas_path, rect = slot
+            atlas = self._atlases[atlas_path] if atlas_path in self._atlases else self._store_atlas(atlas_path, QImage(atlas_path))
+            if atlas is not None:
+                return self._slice_atlas(key, atlas, rect)
+        self._load_image(game_name)
+        return self._make_pixmap(key)
+
+    def request(self, game_name, size, device_pixel_ratio, callback):
+        """
+        Returns (True, pixmap) if the icon is already available (pixmap may be None when
+        the game has no icon at all). Otherwise starts decoding it off the GUI thread,
+        returns (False, None) and later calls `callback(pixmap)` on the GUI thread.
+        """
+        key = (game_name, size, device_pixel_ratio)
+        if key in self._pixmaps:
+            self.hits += 1
+            return True, self._pixmaps[key]
+        slot = self._atlas_slot(game_name, int(round(size * device_pixel_ratio)))
+        decoded = slot[0] in self._atlases if slot is not None else game_name in self._images
+        if decoded or not self.ASYNC_DECODE:
+            return True, self.get(game_name, size, device_pixel_ratio)
+        self.misses += 1
+
+        if slot is not None:
+            atlas_path, rect = slot
+
+            def on_atlas_decoded(image):
+                atlas = self._store_atlas(atlas_path, image)
+                if key in self._pixmaps:
+                    callback(self._pixmaps[key])
+                elif atlas is not None:
+                    callback(self._slice_atlas(key, atlas, rect))
+                else:
+                    ready, pixmap = self.request(game_name, size, device_pixel_ratio, callback) # From the icon file
+                    if ready:
+                        callback(pixmap)
+
+            self.loader.load(f"atlas:{atlas_path}", [atlas_path], on_atlas_decoded)
+            return False, None
+
+        def on_decoded(image):
+            if game_name not in self._images:
+                self._store_image(game_name, image)
+            pixmap = self._pixmaps[key] if key in self._pixmaps else self._make_pixmap(key)
+            callback(pixmap)
+
+        self.loader.load(f"icon:{game_name}", self._icon_paths(game_name), on_decoded)
+        return False, None
+
+    def placeholder(self, size, device_pixel_ratio=1.0):
+        """Returns a neutral rounded-square pixmap shown while an icon is being decoded."""
+        key = (size, device_pixel_ratio)
+        if key not in self._placeholders:
+            physical_size = int(round(size * device_pixel_ratio))
+            pixmap = QPixmap(physical_size, physical_size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(255, 255, 255, 25))
+            painter.drawRoundedRect(QRectF(0, 0, physical_size, physical_size), physical_size / 8, physical_size / 8)
+            painter.end()
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            self._placeholders[key] = pixmap
+        return self._placeholders[key]
+
+    def stats(self):
+        """Returns the cache counters as a dictionary."""
+        return {'hits': self.hits, 'misses': self.misses, 'decodes': self.decodes, 'atlas_slices': self.atlas_slices,
+                'entries': len(self._pixmaps)}
+
+    def clear(self):
+        """Drops all cached images, e.g. after the icons were regenerated."""
+        self._images.clear()
+        self._pixmaps.clear()
+        self._atlases.clear()
+        self._atlas_manifest = None
+
+
+ICON_CACHE = IconPixmapCache()
+
+
+# --- Screenshot Thumbnails ---
+class ThumbnailCache:
+    """
+    Downscaled screenshots at a few fixed sizes, kept on disk so a screenshot is
+    decoded at full resolution only once. Thumbnails are generated on a worker pool
+    and stored as <content hash>-<size>.<format> (WebP where Qt can write it, PNG
+    otherwise), so renamed or duplicated screenshots share their thumbnails and an
+    edited one gets new ones. The directory is bounded to MAX_BYTES: the least
+    recently used thumbnails (oldest mtime, refreshed on every hit) are evicted first.
+    """
+    THUMBNAIL_SIZES = (160, 320, 640) # Longest side in pixels
+    MAX_BYTES = 32 * 1024 * 1024
+    CACHE_DIR = '.thumbnail_cache'
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = os.path.abspath(cache_dir or self.CACHE_DIR)
+        self._format = None
+        self._digests = {} # (path, mtime, size) -> content hash, so unchanged files are hashed once per run
+        self._lock = threading.Lock() # Guards _digests and eviction across workers
+        self._loader = None
+
+    @property
+    def format(self):
+        if self._format is None:
+            self._format = 'webp' if b'webp' in [bytes(f) for f in QImageWriter.supportedImageFormats()] else 'png'
+        return self._format
+
+    @property
+    def loader(self):
+        if self._loader is None:
+            self._loader = AsyncImageLoader(decode=lambda paths, size: self.thumbnail(paths[0], size))
+        return self._loader
+
+    @classmethod
+    def thumbnail_size(cls, size):
+        """The smallest fixed thumbnail size that covers `size` pixels."""
+        return next((fixed for fixed in cls.THUMBNAIL_SIZES if fixed >= size), cls.THUMBNAIL_SIZES[-1])
+
+    def request(self, path, size, callback):
+        """Calls `callback(QImage)` with the thumbnail of `path` covering `size`, generated off-thread if needed."""
+        size = self.thumbnail_size(size)
+        self.loader.load(f"thumbnail:{path}@{size}", [path], callback, max_size=size)
+
+    def _digest(self, path):
+        stat = os.stat(path)
+        memo_key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            with self._lock:
+                self._digests[memo_key] = digest
+        return digest
+
+    def cache_path(self, digest, size):
+        return os.path.join(self.cache_dir, f"{digest}-{size}.{self.format}")
+
+    def thumbnail(self, path, size):
+        """Returns the thumbnail of `path` at fixed `size`. Called on worker threads."""
+        try:
+            digest = self._digest(path)
+        except OSError:
+            return QImage()
+        cached_path = self.cache_path(digest, size)
+        image = QImage(cached_path)
+        if not image.isNull():
+            try:
+                os.utime(cached_path) # Most recently used
+            except OSError:
+                pass
+            return image
+
+        # Miss: decode the full image once and write every fixed size from it
+        full_image = QImage(path)
+        if full_image.isNull():
+            return full_image
+        os.makedirs(self.cache_dir, exist_ok=True)
+        for fixed_size in self.THUMBNAIL_SIZES:
+            thumbnail = full_image
+            if full_image.width() > fixed_size or full_image.height() > fixed_size:
+                thumbnail = full_image.scaled(fixed_size, fixed_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            target = self.cache_path(digest, fixed_size)
+            temp_path = f"{target}.{threading.get_ident()}.tmp"
+            if thumbnail.save(temp_path, self.format, 85):
+                os.replace(temp_path, target) # Other workers never see a partial file
+            if fixed_size == size:
+                image = thumbnail
+        self.evict()
+        return image
+
+    def evict(self):
+        """Deletes least recently used thumbnails until the cache is back under 90% of MAX_BYTES."""
+        with self._lock:
+            try:
+                entries = [(entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                           for entry in os.scandir(self.cache_dir) if entry.is_file()]
+            except OSError:
+                return
+            total = sum(size for _, size, _ in entries)
+            if total <= self.MAX_BYTES:
+                return
+            for _, size, path in sorted(entries):
+                if total <= self.MAX_BYTES * 0.9:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+
+
+THUMBNAIL_CACHE = ThumbnailCache()
+
+
+# --- Shared Card Backgrounds ---
+class CardBackgroundCache:
+    """
+    Pre-rendered card backgrounds (rounded card, border and soft shadow/glow) for the
+    normal, hover, selected and selected-hover states, keyed by card size and device
+    pixel ratio. Every card and the virtualized grid delegate blit the same pixmaps
+    instead of running a QGraphicsDropShadowEffect per card, which re-renders the card
+    offscreen on every repaint.
+    """
+    MARGIN = 5 # Space around the card for the glow, like GameCard's stylesheet margin
+    RADIUS = 15
+    # state -> (background, border, border width, glow color, glow offset)
+    STATE_STYLES = {
+        'normal': (QColor(0, 15, 30, 153), QColor('#004D99'), 2, QColor(0, 0, 0, 120), 3),
+        'hover': (QColor(0, 83, 156, 102), QColor('#0099FF'), 2, QColor(0, 255, 255, 220), 0),
+        'selected': (QColor('#0074D9'), QColor('#00EEFF'), 3, QColor(0, 200, 255, 180), 0),
+        'selected_hover': (QColor('#0088FF'), QColor('#00EEFF'), 3, QColor(0, 255, 255, 220), 0),
+    }
+
+    def __init__(self):
+        self._pixmaps = {} # (state, width, height, device pixel ratio) -> QPixmap
+
+    @staticmethod
+    def state_for(selected, hovered):
+        """Maps a card's selection/hover flags to a background state."""
+        if selected:
+            return 'selected_hover' if hovered else 'selected'
+        return 'hover' if hovered else 'normal'
+
+    def get(self, state, size, device_pixel_ratio=1.0):
+        """Returns the background pixmap for a card of `size` (QSize) in `state`."""
+        key = (state, size.width(), size.height(), device_pixel_ratio)
+        if key not in self._pixmaps:
+            self._pixmaps[key] = self._render(state, size, device_pixel_ratio)
+        return self._pixmaps[key]
+
+    def _render(self, state, size, device_pixel_ratio):
+        background, border, border_width, glow, glow_offset = self.STATE_STYLES[state]
+        width = int(round(size.width() * device_pixel_ratio))
+        height = int(round(size.height() * device_pixel_ratio))
+        margin = self.MARGIN * device_pixel_ratio
+        card_rect = QRectF(margin, margin, width - 2 * margin, height - 2 * margin)
+
+        # Glow: the card shape in the glow color, blurred by a smooth down/up scale
+        image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(glow)
+        offset = glow_offset * device_pixel_ratio
+        radius = self.RADIUS * device_pixel_ratio
+        painter.drawRoundedRect(card_rect.translated(offset, offset), radius, radius)
+        painter.end()
+        image = image.scaled(max(1, width // 6), max(1, height // 6), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+        image = image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+        # Card body and border on top
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setCompositionMode(QPainter.CompositionMode_Source) # The body replaces the glow under it
+        painter.setPen(QPen(border, border_width * device_pixel_ratio))
+        painter.setBrush(background)
+        inset = border_width * device_pixel_ratio / 2
+        painter.drawRoundedRect(card_rect.adjusted(inset, inset, -inset, -inset), radius, radius)
+        painter.end()
+
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+
+CARD_BACKGROUNDS = CardBackgroundCache()
 
 
 # --- Custom GameCard Widget ---
@@ -273,21 +1276,57 @@ class GameCard(QWidget):
     """
     A custom widget representing a single game, designed to look like an interactive card.
     It displays an icon and the game name, with visual feedback for hover and selection.
+
+    In cheap rendering mode (the default; GAMEBOX_RENDERING=effects restores the old
+    look) the card paints a shared pre-rendered background from CARD_BACKGROUNDS and
+    exposes its state as dynamic properties ("selected", "strip", and "favorite" on the
+    star button) styled by the window's CARD_STYLESHEET, instead of carrying its own
+    drop-shadow effect, hover animations and per-card stylesheets.
     """
     # Signal emitted when this card is clicked, carrying its game name.
     clicked = pyqtSignal(str)
     # Signal emitted when the favorite button is clicked, carrying game name
     favorite_toggled = pyqtSignal(str)
 
-    # Base directory for icons
-    ICONS_DIR = 'icons'
-    DEFAULT_ICON_PATH = os.path.join(ICONS_DIR, 'generic_game.png')
+    CHEAP_RENDERING = os.environ.get('GAMEBOX_RENDERING', 'cheap') != 'effects'
+    # Shared rules for every card in cheap rendering mode, installed once on the window.
+    # State changes flip a dynamic property and re-polish a single widget.
+    CARD_STYLESHEET = """
+        QLabel#cardName {
+            color: #FFFFFF; /* Changed to pure white for maximum visibility */
+            font-weight: bold;
+            font-size: 10pt; /* Slightly smaller to fit */
+            font-family: 'Segoe UI', sans-serif;
+        }
+        QLabel#cardName[strip="true"] {
+            color: #F0F0F0;
+            font-weight: normal;
+            font-size: 8pt;
+        }
+        QPushButton#favoriteButton {
+            background-color: rgba(0, 0, 0, 0.5);
+            border: none;
+            border-radius: 14px; /* Half of fixed size for perfect circle */
+            color: gray;
+            font-size: 16pt; /* Adjust emoji size */
+            padding: 0; /* Remove padding from button itself */
+        }
+        QPushButton#favoriteButton[favorite="true"] {
+            color: yellow;
+        }
+        QPushButton#favoriteButton:hover {
+            background-color: rgba(0, 0, 0, 0.7);
+        }
+    """
 
-    def __init__(self, game_data, parent=None):
+    def __init__(self, game_data, parent=None, icon_size=96):
         super().__init__(parent)
         self.game_data = game_data
         self.game_name = game_data['name']
+        self.icon_size = icon_size # Logical size of the icon in pixels
         self._is_selected = False # Internal state for selection
+        self._is_hovered = False
+        self.cheap_rendering = self.CHEAP_RENDERING
         self.setFixedSize(160, 160) # Slightly larger fixed size for icons
 
         self.main_layout = QGridLayout(self) # Use QGridLayout for the card itself
@@ -297,7 +1336,16 @@ class GameCard(QWidget):
         self.setup_ui()
         self.apply_base_style()
         self.setCursor(Qt.PointingHandCursor) # Change cursor on hover
-        
+
+        # Hover animations are created on the first hover, most cards are never hovered
+        self.size_animation = None
+        self.shadow_animation = None
+        self.blur_animation = None
+
+    def _ensure_animations(self):
+        """Creates the size and shadow glow animations on first use."""
+        if self.size_animation is not None:
+            return
         # Animations for size and shadow glow
         self.size_animation = QPropertyAnimation(self, b"size")
         self.size_animation.setDuration(150) # milliseconds
@@ -316,44 +1364,33 @@ class GameCard(QWidget):
         """
         Sets up the layout and widgets for the game card (icon, name, and favorite button).
         """
-        # Icon Label - now loads from the 'icons' folder
+        # Icon Label - pixmaps come from the shared icon cache (decoded once per process,
+        # off the GUI thread); a placeholder is shown until the icon is ready
         self.icon_label = QLabel()
         self.icon_label.setAlignment(Qt.AlignCenter)
 
-        # Normalize game name for filename (lowercase, replace spaces with underscores, handle '&')
-        filename_game_name = self.game_name.lower().replace(' ', '_').replace('&', 'and')
-        icon_filename = f"{filename_game_name}.png"
-        icon_path = os.path.join(self.ICONS_DIR, icon_filename)
-
-        if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            self.icon_label.setPixmap(pixmap.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        ready, pixmap = ICON_CACHE.request(self.game_name, self.icon_size, self.devicePixelRatioF(), self._on_icon_ready)
+        if ready:
+            self._show_icon(pixmap)
         else:
-            # Fallback to default icon if specific one not found
-            if os.path.exists(self.DEFAULT_ICON_PATH):
-                pixmap = QPixmap(self.DEFAULT_ICON_PATH)
-                self.icon_label.setPixmap(pixmap.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                # Ultimate fallback to generic emoji if no image icon is available
-                self.icon_label.setText('❓') # Use a question mark emoji
-                font = QFont()
-                font.setPointSize(40)
-                self.icon_label.setFont(font)
-                self.icon_label.setStyleSheet("color: white;")
+            self.icon_label.setPixmap(ICON_CACHE.placeholder(self.icon_size, self.devicePixelRatioF()))
 
         # Game Name Label
         self.name_label = QLabel(self.game_name.replace('_', ' ').title()) # Format name nicely
+        self.name_label.setObjectName("cardName")
         self.name_label.setAlignment(Qt.AlignCenter)
         self.name_label.setWordWrap(True)
-        self.name_label.setStyleSheet("""
-            color: #FFFFFF; /* Changed to pure white for maximum visibility */
-            font-weight: bold;
-            font-size: 10pt; /* Slightly smaller to fit */
-            font-family: 'Segoe UI', sans-serif;
-        """)
+        if not self.cheap_rendering: # Otherwise styled by CARD_STYLESHEET
+            self.name_label.setStyleSheet("""
+                color: #FFFFFF; /* Changed to pure white for maximum visibility */
+                font-weight: bold;
+                font-size: 10pt; /* Slightly smaller to fit */
+                font-family: 'Segoe UI', sans-serif;
+            """)
 
         # Favorite button
         self.favorite_button = QPushButton()
+        self.favorite_button.setObjectName("favoriteButton")
         self.favorite_button.setFixedSize(28, 28) # Slightly smaller button
         self.favorite_button.clicked.connect(self._on_favorite_clicked)
         self.favorite_button.setCursor(Qt.PointingHandCursor) # Indicate clickable
@@ -369,6 +1406,8 @@ class GameCard(QWidget):
         self.main_layout.setColumnStretch(0, 1) # Allow columns to stretch
         self.main_layout.setColumnStretch(1, 1)
 
+        if self.cheap_rendering:
+            return # The shadow is part of the pre-rendered background
 
         # Add a subtle drop shadow for a 3D effect
         shadow = QGraphicsDropShadowEffect(self)
@@ -378,6 +1417,26 @@ class GameCard(QWidget):
         shadow.setColor(QColor(0, 0, 0, 120)) # Darker, more prominent shadow
         self.setGraphicsEffect(shadow)
 
+    def _show_icon(self, pixmap):
+        """Shows the game icon, or a question mark emoji if no image icon is available."""
+        if pixmap is not None:
+            self.icon_label.setPixmap(pixmap)
+            return
+        # Ultimate fallback to generic emoji if no image icon is available
+        self.icon_label.clear()
+        self.icon_label.setText('❓') # Use a question mark emoji
+        font = QFont()
+        font.setPointSize(40 if self.icon_size >= 96 else 30) # Smaller emoji on strip cards
+        self.icon_label.setFont(font)
+        self.icon_label.setStyleSheet("color: white;")
+
+    def _on_icon_ready(self, pixmap):
+        """Swaps the placeholder for the decoded icon."""
+        try:
+            self._show_icon(pixmap)
+        except RuntimeError:
+            pass # The card was deleted while its icon was being decoded
+
     def _update_favorite_icon(self):
         """Updates the favorite button icon based on the game's favorite status."""
         if self.game_data.get('isFavorite', False):
@@ -386,7 +1445,11 @@ class GameCard(QWidget):
         else:
             self.favorite_button.setText("☆") # Outline star emoji
             self.favorite_button.setToolTip("Add to Favorites")
-        
+
+        if self.cheap_rendering:
+            self._set_state_property(self.favorite_button, "favorite", bool(self.game_data.get('isFavorite', False)))
+            return
+
         self.favorite_button.setStyleSheet(f"""
             QPushButton {{
                 background-color: rgba(0, 0, 0, 0.5);
@@ -402,6 +1465,41 @@ class GameCard(QWidget):
         """)
 
 
+    @staticmethod
+    def _set_state_property(widget, name, value):
+        """Sets a dynamic property used by CARD_STYLESHEET and re-polishes just that widget."""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+    def set_strip(self, strip):
+        """Marks the card as a small Favorites/Recently Played strip card."""
+        if self.cheap_rendering:
+            self._set_state_property(self, "strip", strip)
+            self._set_state_property(self.name_label, "strip", strip)
+        elif strip:
+            self.name_label.setStyleSheet("color: #F0F0F0; font-size: 8pt;")
+
+    def paintEvent(self, event):
+        """Paints the shared pre-rendered background for the card's current state."""
+        if self.cheap_rendering:
+            state = CARD_BACKGROUNDS.state_for(self._is_selected, self._is_hovered)
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, CARD_BACKGROUNDS.get(state, self.size(), self.devicePixelRatioF()))
+            painter.end()
+        super().paintEvent(event)
+
+    def set_game_data(self, game_data):
+        """
+        Rebinds the card to a (possibly refreshed) game data dictionary and
+        updates the favorite star in place, without rebuilding the card.
+        """
+        self.game_data = game_data
+        self._update_favorite_icon()
+
+
     def _on_favorite_clicked(self):
         """Emits the favorite_toggled signal."""
         self.favorite_toggled.emit(self.game_name)
@@ -412,6 +1510,10 @@ class GameCard(QWidget):
         Applies the default (unselected) style to the card.
         This gives a "hollow" appearance with a border.
         """
+        if self.cheap_rendering:
+            self._set_state_property(self, "selected", False)
+            self.update()
+            return
         self.setStyleSheet("""
             GameCard {
                 background-color: rgba(0, 15, 30, 0.6); /* Slightly transparent dark background */
@@ -433,6 +1535,10 @@ class GameCard(QWidget):
         """
         Applies the selected style to the card, making it more prominent.
         """
+        if self.cheap_rendering:
+            self._set_state_property(self, "selected", True)
+            self.update()
+            return
         self.setStyleSheet("""
             GameCard {
                 background-color: #0074D9; /* Solid primary blue when selected */
@@ -470,6 +1576,12 @@ class GameCard(QWidget):
 
     def enterEvent(self, event):
         """Animation on mouse hover enter with glow effect."""
+        self._is_hovered = True
+        if self.cheap_rendering:
+            self.update() # Swap to the hover background
+            super().enterEvent(event)
+            return
+        self._ensure_animations()
         self.size_animation.setStartValue(self.size())
         self.size_animation.setEndValue(QSize(170, 170)) # Slightly enlarge
         self.size_animation.setEasingCurve(QEasingCurve.OutQuad)
@@ -489,6 +1601,12 @@ class GameCard(QWidget):
 
     def leaveEvent(self, event):
         """Animation on mouse hover leave with glow effect reset."""
+        self._is_hovered = False
+        if self.cheap_rendering:
+            self.update()
+            super().leaveEvent(event)
+            return
+        self._ensure_animations()
         self.size_animation.setStartValue(self.size())
         self.size_animation.setEndValue(QSize(160, 160)) # Return to original size
         self.size_animation.setEasingCurve(QEasingCurve.InQuad)
@@ -524,27 +1642,258 @@ class GameCard(QWidget):
         super().mousePressEvent(event)
 
 
+# --- Virtualized Game Grid (model/view) ---
+class GameListModel(QAbstractListModel):
+    """
+    List model over the CPGames catalog. It references the catalog's game
+    dictionaries directly, so building it costs nothing per game; views only
+    ask for the rows they actually paint.
+    """
+    NameRole = Qt.UserRole + 1
+    GameDataRole = Qt.UserRole + 2
+
+    def __init__(self, cp_games, parent=None):
+        super().__init__(parent)
+        self.cp_games = cp_games
+        self._games = cp_games.get_all_games()
+        self._rows = {game['name']: row for row, game in enumerate(self._games)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._games)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        game = self._games[index.row()]
+        if role in (Qt.DisplayRole, self.NameRole):
+            return game['name']
+        if role == Qt.ToolTipRole:
+            return game.get('description', '')
+        if role == self.GameDataRole:
+            return game
+        return None
+
+    def game_at(self, row):
+        """Returns the game dictionary for a source row."""
+        return self._games[row]
+
+    def refresh_game(self, game_name):
+        """Notifies views and proxies that one game's data changed."""
+        row = self._rows.get(game_name)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+    def refresh_all(self):
+        """Notifies views and proxies that any game's data may have changed."""
+        if self._games:
+            self.dataChanged.emit(self.index(0), self.index(len(self._games) - 1))
+
+    def reset_games(self):
+        """Re-reads the list of games from the catalog, e.g. after games were added or removed."""
+        self.beginResetModel()
+        self._games = self.cp_games.get_all_games()
+        self._rows = {game['name']: row for row, game in enumerate(self._games)}
+        self.endResetModel()
+
+
+class GameSearchProxyModel(QSortFilterProxyModel):
+    """Filters and ranks the main grid by the results of a GameSearchIndex query."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ranks = None # game name -> rank, or None to show every game in catalog order
+
+    def set_search_results(self, names):
+        """Shows only `names`, in that order; None shows every game."""
+        self._ranks = None if names is None else {name: rank for rank, name in enumerate(names)}
+        self.invalidate()
+        self.sort(-1 if self._ranks is None else 0) # -1 restores the source (catalog) order
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._ranks is None or self.sourceModel().game_at(source_row)['name'] in self._ranks
+
+    def lessThan(self, left, right):
+        return self._ranks[left.data(GameListModel.NameRole)] < self._ranks[right.data(GameListModel.NameRole)]
+
+
+class FavoriteGamesProxyModel(QSortFilterProxyModel):
+    """Shows only favorite games, sorted alphabetically. Follows favorite toggles automatically."""
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().game_at(source_row).get('isFavorite', False)
+
+    def lessThan(self, left, right):
+        return left.data(GameListModel.NameRole).lower() < right.data(GameListModel.NameRole).lower()
+
+
+class RecentlyPlayedProxyModel(QSortFilterProxyModel):
+    """Shows the most recently played games, newest first."""
+    def __init__(self, count=3, parent=None):
+        super().__init__(parent)
+        self.count = count
+        self._ranks = {} # game name -> position in the recently played list
+
+    def refresh(self):
+        """Re-queries the catalog for the most recently played games and re-filters."""
+        recent_games = self.sourceModel().cp_games.get_recently_played_games(count=self.count)
+        self._ranks = {game['name']: rank for rank, game in enumerate(recent_games)}
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().game_at(source_row)['name'] in self._ranks
+
+    def lessThan(self, left, right):
+        return self._ranks[left.data(GameListModel.NameRole)] < self._ranks[right.data(GameListModel.NameRole)]
+
+
+class GameCardDelegate(QStyledItemDelegate):
+    """
+    Paints a game card (background, icon, name and favorite star) directly, with the
+    same look as GameCard but without a widget, graphics effect or animation per game.
+    Icons are fetched from the shared icon cache on first paint, so only visible
+    games are ever decoded.
+    """
+    favorite_toggled = pyqtSignal(str)
+
+    CARD_MARGIN = CardBackgroundCache.MARGIN
+    STAR_SIZE = 28
+
+    def __init__(self, card_size=160, icon_size=96, font_size=10, parent=None):
+        super().__init__(parent)
+        self.card_size = card_size
+        self.icon_size = icon_size
+        self.name_font = QFont('Segoe UI', font_size, QFont.Bold)
+        self.star_font = QFont()
+        self.star_font.setPixelSize(16)
+
+    def sizeHint(self, option, index):
+        return QSize(self.card_size, self.card_size)
+
+    def _card_rect(self, option):
+        return option.rect.adjusted(self.CARD_MARGIN, self.CARD_MARGIN, -self.CARD_MARGIN, -self.CARD_MARGIN)
+
+    def _star_rect(self, card_rect):
+        return QRect(card_rect.right() - self.STAR_SIZE - 4, card_rect.top() + 4, self.STAR_SIZE, self.STAR_SIZE)
+
+    def paint(self, painter, option, index):
+        game = index.data(GameListModel.GameDataRole)
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Card background, border and glow: the same pre-rendered pixmaps as GameCard
+        painter.drawPixmap(option.rect.topLeft(), CARD_BACKGROUNDS.get(CARD_BACKGROUNDS.state_for(selected, hovered),
+                                                                       option.rect.size(), painter.device().devicePixelRatioF()))
+        card_rect = self._card_rect(option)
+
+        # Name along the bottom, icon centered in the space above it
+        device_pixel_ratio = painter.device().devicePixelRatioF()
+        name_height = max(24, card_rect.height() // 4)
+        name_rect = QRect(card_rect.left() + 6, card_rect.bottom() - name_height - 4, card_rect.width() - 12, name_height)
+        ready, pixmap = ICON_CACHE.request(game['name'], self.icon_size, device_pixel_ratio,
+                                           lambda pixmap, view=option.widget: self._repaint_view(view))
+        if not ready:
+            pixmap = ICON_CACHE.placeholder(self.icon_size, device_pixel_ratio)
+        icon_area = QRect(card_rect.left(), card_rect.top() + 8, card_rect.width(), name_rect.top() - card_rect.top() - 8)
+        if pixmap is not None:
+            icon_rect = QRect(0, 0, self.icon_size, self.icon_size)
+            icon_rect.moveCenter(icon_area.center())
+            painter.drawPixmap(icon_rect, pixmap)
+        else:
+            painter.setPen(QColor('white'))
+            painter.drawText(icon_area, Qt.AlignCenter, '❓')
+
+        painter.setFont(self.name_font)
+        painter.setPen(QColor('#FFFFFF'))
+        painter.drawText(name_rect, Qt.AlignCenter | Qt.TextWordWrap, game['name'].replace('_', ' ').title())
+
+        # Favorite star in the top-right corner
+        star_rect = self._star_rect(card_rect)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 128))
+        painter.drawEllipse(star_rect)
+        is_favorite = game.get('isFavorite', False)
+        painter.setFont(self.star_font)
+        painter.setPen(QColor('yellow' if is_favorite else 'gray'))
+        painter.drawText(star_rect, Qt.AlignCenter, "⭐" if is_favorite else "☆")
+
+        painter.restore()
+
+    @staticmethod
+    def _repaint_view(view):
+        """Repaints a view once an icon it asked for has been decoded."""
+        try:
+            view.viewport().update()
+        except (RuntimeError, AttributeError):
+            pass # The view is gone
+
+    def editorEvent(self, event, model, option, index):
+        """Toggles the favorite state when the star is clicked."""
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton and \
+           self._star_rect(self._card_rect(option)).contains(event.pos()):
+            self.favorite_toggled.emit(index.data(GameListModel.NameRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class GameGridView(QListView):
+    """
+    Icon-mode list view for game cards. Only visible items are laid out and painted,
+    so startup and scrolling cost do not grow with the size of the library.
+    """
+    def __init__(self, delegate, wrapping=True, parent=None):
+        super().__init__(parent)
+        self.setViewMode(QListView.IconMode)
+        self.setFlow(QListView.LeftToRight)
+        self.setWrapping(wrapping)
+        self.setMovement(QListView.Static)
+        self.setResizeMode(QListView.Adjust)
+        self.setUniformItemSizes(True) # Lets the view compute the layout without asking every item
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(200)
+        self.setSpacing(10)
+        self.setSelectionMode(QListView.SingleSelection)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QListView.ScrollPerPixel)
+        self.setMouseTracking(True) # Needed for hover highlighting
+        self.setCursor(Qt.PointingHandCursor)
+        self.setItemDelegate(delegate)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+        if not wrapping:
+            # Single-row strip
+            self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+            self.setFixedHeight(delegate.card_size + 2 * self.spacing() + 16)
+
+
 # --- GameInfoDialog Class ---
 class GameInfoDialog(QDialog):
     """
     A custom dialog to display information about a selected game.
     Features a fade-in/fade-out effect and can be dismissed.
-    Now includes Play Game and Favorite buttons.
+    Now includes Play Game and Favorite buttons, and an Output panel with what
+    the game printed (from its GameOutputLog).
     """
     play_game_requested = pyqtSignal(str)
     favorite_toggled = pyqtSignal(str)
+    SCREENSHOT_SIZE = 160 # Longest side of screenshot thumbnails, in pixels
+    OUTPUT_PANEL_HEIGHT = 160
 
-    def __init__(self, game_data, parent=None):
+    def __init__(self, game_data, parent=None, output_log=None, play_summary=None, game_path=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint) # No title bar
         self.setModal(True) # Make it modal to block interaction with main window
 
         self.game_data = game_data
+        self.launch_latency = game_data.get('first_frame_latency') or {} # {'cold': seconds, 'warm': seconds}
         self.game_name = game_data['name']
         self.description = game_data['description']
         self.category = game_data.get('category', 'N/A')
         self.is_favorite = game_data.get('isFavorite', False)
         self.last_played = game_data.get('last_played')
+        self.output_log = output_log
+        self.play_summary = play_summary # Aggregates from PlaySessionStore.summary(), or None
+        self.game_path = game_path # Absolute game folder from CPGames.get_game_path(), where launches run
 
         self.old_pos = None # To store the mouse position for dragging
 
@@ -583,6 +1932,21 @@ class GameInfoDialog(QDialog):
         self.last_played_label.setStyleSheet("color: #BBBBBB; font-size: 12pt;")
         main_layout.addWidget(self.last_played_label)
 
+        # Time to first frame of the latest cold and pre-warmed launches
+        if self.launch_latency:
+            parts = [f"{self.launch_latency[mode]:.2f}s ({mode})" for mode in ('warm', 'cold') if mode in self.launch_latency]
+            self.launch_latency_label = QLabel(f"Time to First Frame: {' / '.join(parts)}")
+            self.launch_latency_label.setAlignment(Qt.AlignCenter)
+            self.launch_latency_label.setStyleSheet("color: #BBBBBB; font-size: 12pt;")
+            main_layout.addWidget(self.launch_latency_label)
+
+        # Recorded sessions: playtime, crash rate and how heavy the game is
+        if self.play_summary:
+            self.play_stats_label = QLabel(self._format_play_summary(self.play_summary))
+            self.play_stats_label.setAlignment(Qt.AlignCenter)
+            self.play_stats_label.setWordWrap(True)
+            self.play_stats_label.setStyleSheet("color: #BBBBBB; font-size: 12pt;")
+            main_layout.addWidget(self.play_stats_label)
 
         # Game Description
         self.description_label = QLabel(self.description)
@@ -590,6 +1954,28 @@ class GameInfoDialog(QDialog):
         self.description_label.setWordWrap(True)
         main_layout.addWidget(self.description_label)
 
+        # Screenshots - decoded off the GUI thread, placeholders until they arrive
+        self.screenshot_labels = []
+        screenshots = self.game_data.get('screenshots') or []
+        if screenshots:
+            screenshot_layout = QHBoxLayout()
+            screenshot_layout.setSpacing(10)
+            screenshot_layout.setAlignment(Qt.AlignCenter)
+            device_pixel_ratio = self.devicePixelRatioF()
+            for screenshot in screenshots:
+                path = self._screenshot_path(screenshot)
+                label = ScreenshotThumbnail(path)
+                label.setAlignment(Qt.AlignCenter)
+                label.setFixedSize(self.SCREENSHOT_SIZE, self.SCREENSHOT_SIZE * 3 // 4)
+                label.setPixmap(ICON_CACHE.placeholder(self.SCREENSHOT_SIZE * 3 // 4))
+                label.clicked.connect(self.show_screenshot)
+                screenshot_layout.addWidget(label)
+                self.screenshot_labels.append(label)
+                # Only a small cached thumbnail is decoded here; the full image is loaded when clicked
+                THUMBNAIL_CACHE.request(path, round(self.SCREENSHOT_SIZE * device_pixel_ratio),
+                                        lambda image, label=label: self._on_screenshot_ready(label, image))
+            main_layout.addLayout(screenshot_layout)
+
         # Action Buttons (Play Game, Favorite)
         action_button_layout = QHBoxLayout()
         action_button_layout.setSpacing(15)
@@ -604,13 +1990,89 @@ class GameInfoDialog(QDialog):
         action_button_layout.addWidget(self.favorite_button)
         self._update_favorite_button_style() # Set initial style
 
+        if self.output_log is not None:
+            self.output_button = QPushButton("Output")
+            self.output_button.clicked.connect(self.toggle_output)
+            action_button_layout.addWidget(self.output_button)
+
         main_layout.addLayout(action_button_layout)
 
+        # What the game printed, hidden until the Output button is clicked
+        self.output_view = QPlainTextEdit()
+        self.output_view.setObjectName("output_view")
+        self.output_view.setReadOnly(True)
+        self.output_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.output_view.setFixedHeight(self.OUTPUT_PANEL_HEIGHT)
+        self.output_view.hide()
+        main_layout.addWidget(self.output_view)
+
         # Close Button
         self.close_button = QPushButton("Got It!")
         self.close_button.clicked.connect(self.close_dialog)
         main_layout.addWidget(self.close_button, alignment=Qt.AlignCenter)
 
+    @staticmethod
+    def _format_duration(seconds):
+        minutes, seconds = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours}h {minutes:02d}m"
+        return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+
+    def _format_play_summary(self, summary):
+        sessions = summary['sessions']
+        parts = [f"{sessions} session{'s' if sessions != 1 else ''}",
+                 f"{self._format_duration(summary['total_playtime'])} played",
+                 f"avg {self._format_duration(summary['average_session'])}",
+                 f"{summary['crash_rate']:.0%} crashed"]
+        if summary['peak_rss_kb']:
+            parts.append(f"peak {summary['peak_rss_kb'] / 1024:.0f} MB")
+        if summary['average_cpu_time'] is not None:
+            parts.append(f"{summary['average_cpu_time']:.1f}s CPU per session")
+        return " · ".join(parts)
+
+    def toggle_output(self):
+        """Shows or hides the output panel, growing the dialog to make room for it."""
+        showing = not self.output_view.isVisible()
+        self.output_view.setVisible(showing)
+        height_change = self.OUTPUT_PANEL_HEIGHT + self.layout().spacing()
+        self.resize(self.width(), self.height() + (height_change if showing else -height_change))
+        self.refresh_output()
+
+    def refresh_output(self):
+        """Reloads the output panel (if shown) from the game's output log."""
+        if self.output_log is None or not self.output_view.isVisible():
+            return
+        self.output_view.setPlainText(self.output_log.text() or "No output captured yet.")
+        scroll_bar = self.output_view.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def _screenshot_path(self, screenshot):
+        """Resolves a screenshot entry relative to the game's folder."""
+        if os.path.isabs(screenshot) or self.game_path is None:
+            return screenshot
+        return os.path.join(self.game_path, screenshot)
+
+    def _on_screenshot_ready(self, label, image):
+        """Swaps a screenshot placeholder for the decoded thumbnail."""
+        try:
+            if image.isNull():
+                label.setText("No preview")
+                label.setStyleSheet("color: #888888; font-size: 10pt;")
+                return
+            # Thumbnails come in fixed sizes; fit the one we got to the label
+            device_pixel_ratio = label.devicePixelRatioF()
+            pixmap = QPixmap.fromImage(image).scaled(label.size() * device_pixel_ratio, Qt.KeepAspectRatio,
+                                                     Qt.SmoothTransformation)
+            pixmap.setDevicePixelRatio(device_pixel_ratio)
+            label.setPixmap(pixmap)
+        except RuntimeError:
+            pass # The dialog was closed before the screenshot was decoded
+
+    def show_screenshot(self, path):
+        """Opens a screenshot at full resolution."""
+        ScreenshotViewer(path, self).exec_()
+
     def _update_favorite_button_style(self):
         """Updates the favorite button's text and style based on is_favorite."""
         if self.is_favorite:
@@ -698,6 +2160,14 @@ class GameInfoDialog(QDialog):
             QPushButton:pressed {
                 background-color: #005A90;
             }
+            QPlainTextEdit#output_view {
+                background-color: #10181F;
+                color: #CCCCCC;
+                font-family: 'Consolas', monospace;
+                font-size: 10pt;
+                border: 1px solid #00A3CC;
+                border-radius: 8px;
+            }
         """)
         # Set object names for specific QLabel styling
         self.title_label.setObjectName("title_label")
@@ -779,6 +2249,63 @@ class GameInfoDialog(QDialog):
         super().mouseReleaseEvent(event)
 
 
+class ScreenshotThumbnail(QLabel):
+    """A screenshot thumbnail in GameInfoDialog; clicking it opens the full image."""
+    clicked = pyqtSignal(str) # Path of the full screenshot
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.setCursor(Qt.PointingHandCursor)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit(self.path)
+        super().mousePressEvent(event)
+
+
+class ScreenshotViewer(QDialog):
+    """
+    Shows one screenshot at full resolution (bounded by the screen), decoded on the
+    worker pool only when it is asked for. Click anywhere or press Escape to close.
+    """
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog)
+        self.setModal(True)
+        self.setStyleSheet("ScreenshotViewer { background-color: #000000; border: 2px solid #00FFFF; }"
+                           "QLabel { color: #BBBBBB; font-size: 12pt; }")
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.image_label = QLabel("Loading...")
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.image_label.setMinimumSize(320, 240)
+        layout.addWidget(self.image_label)
+
+        screen = (parent.screen() if parent is not None else QApplication.primaryScreen()).availableGeometry()
+        self.device_pixel_ratio = self.devicePixelRatioF()
+        max_size = round(min(screen.width(), screen.height()) * 0.9 * self.device_pixel_ratio)
+        ICON_CACHE.loader.load(f"screenshot:{path}@{max_size}", [path], self._on_image_ready, max_size=max_size)
+
+    def _on_image_ready(self, image):
+        try:
+            if image.isNull():
+                self.image_label.setText("Could not load the screenshot.")
+                return
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(self.device_pixel_ratio)
+            self.image_label.setPixmap(pixmap)
+            self.adjustSize()
+            if self.parentWidget() is not None:
+                # Keep the viewer centered over the info dialog
+                self.move(self.parentWidget().geometry().center() - self.rect().center())
+        except RuntimeError:
+            pass # Closed before the image was decoded
+
+    def mousePressEvent(self, event):
+        self.accept()
+
+
 # --- SettingsDialog Class ---
 class SettingsDialog(QDialog):
     """
@@ -895,11 +2422,9 @@ class SettingsDialog(QDialog):
             self.cp_games.clear_recently_played_data()
             # Signal to the main window to refresh recently played *before* showing the info box
             if isinstance(self.parent(), GameLauncherWindow):
-                # Reload config from disk before repopulating UI
-                self.parent().cp_games.reload_games_config() 
+                # The in-memory catalog is already up to date, no need to re-read the file
                 self.parent().populate_recently_played()
                 self.parent().populate_favorite_games() # Also refresh favorites
-                self.parent().populate_game_grid() # Refresh main grid too
                 QApplication.processEvents() # Force UI refresh immediately
             QMessageBox.information(self, "Cleared", "Recently played games have been cleared.")
 
@@ -999,12 +2524,75 @@ class CustomMessageBox(QDialog):
         return super().exec_()
 
 
+# --- Single Instance Server ---
+class LauncherInstanceServer(QObject):
+    """
+    Makes the launcher single-instance. Later invocations of launch.py connect to
+    game_cli.instance_address() and send one JSON line, {"argv": [...]}. The server
+    passes the arguments to `handler`, which returns an error message or None, and
+    replies {"ok": ..., "error": ...} so the other process can exit right away.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.address = game_cli.instance_address()
+        self.handler = None # Set once the launcher window exists
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def claim(self):
+        """Starts listening. Returns False if another launcher already owns the address."""
+        if self.server.listen(self.address):
+            return True
+        probe = QLocalSocket()
+        probe.connectToServer(self.address)
+        if probe.waitForConnected(int(game_cli.INSTANCE_TIMEOUT_SECONDS * 1000)):
+            probe.abort()
+            return False
+        QLocalServer.removeServer(self.address) # Left behind by a launcher that crashed
+        if not self.server.listen(self.address):
+            print(f"Single-instance server unavailable: {self.server.errorString()}")
+        return True
+
+    def close(self):
+        self.server.close() # Also removes the socket file
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(lambda connection=connection: self._read_request(connection))
+            connection.disconnected.connect(connection.deleteLater)
+
+    def _read_request(self, connection):
+        if not connection.canReadLine():
+            return # Wait for the rest of the line
+        try:
+            argv = json.loads(bytes(connection.readLine()).decode('utf-8'))['argv']
+        except (ValueError, KeyError, TypeError):
+            error = "Malformed request."
+        else:
+            error = self.handler(argv) if self.handler else "The launcher is still starting up."
+        connection.write((json.dumps({'ok': error is None, 'error': error}) + '\n').encode('utf-8'))
+        connection.flush()
+        connection.disconnectFromServer()
+
+
 # --- Main GameLauncherWindow updated ---
 class GameLauncherWindow(QMainWindow):
     """
     The main window for the game launcher, featuring a grid-based selection
     of game cards instead of a dropdown.
+
+    Libraries with at least VIRTUAL_GRID_THRESHOLD games are shown through a
+    virtualized model/view grid (GameListModel + GameCardDelegate) instead of one
+    GameCard widget per game; Favorites and Recently Played then become filter
+    proxies over the same model.
     """
+    VIRTUAL_GRID_THRESHOLD = 200
+    GRID_COLUMNS = 5 # Number of columns in the card grid
+    SEARCH_DEBOUNCE_MS = 150 # Keystrokes within this window trigger a single search
+    WARM_POOL_DELAY_MS = 1000 # Delay before starting the pre-warmed game runner
+    PREFETCH_DELAY_MS = 1500 # Delay before prefetching the assets of the likely next games
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Game Launcher")
@@ -1018,7 +2606,15 @@ class GameLauncherWindow(QMainWindow):
 
         self.setGeometry(100, 100, 950, 700) # Increased window size for 5x6 layout
         self.selected_game_card = None # To keep track of the currently selected GameCard widget
-        
+        self.selected_game_name = None # Name of the selected game, in both grid modes
+
+        # Card registries keyed by game name, one per section. They let the UI apply
+        # only the delta (flip a star, add/remove/reorder a strip card) instead of
+        # destroying and rebuilding every GameCard on each change.
+        self.grid_cards = {}
+        self.recent_cards = {}
+        self.favorite_cards = {}
+
         # Initialize CPGames and handle potential errors during config loading
         try:
             self.cp_games = CPGames()
@@ -1027,13 +2623,50 @@ class GameLauncherWindow(QMainWindow):
             self.cp_games = CPGames() # Initialize with empty data if error occurs
             self.cp_games.games_data = [] # Ensure games_data is empty
             self.cp_games.games_by_name = {} # Ensure games_by_name is empty
+        STARTUP_PROFILER.mark('config_load')
 
         self.game_info_dialog_instance = None # Keep track of the active dialog instance
+
+        # Launched game processes are owned and reaped by the supervisor
+        self.process_supervisor = GameProcessSupervisor(
+            log_dir=os.path.join(os.path.dirname(self.cp_games.full_config_path), GameOutputLog.LOG_DIR), parent=self)
+        self.game_launch_states = {} # game name -> 'queued' / 'launching' / 'running' / 'exited'
+        self.process_supervisor.game_started.connect(self.on_game_process_started)
+        self.process_supervisor.game_window_created.connect(self.on_game_window_created)
+        self.process_supervisor.game_first_frame.connect(self.on_game_first_frame)
+        self.process_supervisor.game_exited.connect(self.on_game_process_exited)
+        self.process_supervisor.launch_failed.connect(self.on_game_launch_failed)
+        self.process_supervisor.launch_queued.connect(self.on_game_launch_queued)
+        self.process_supervisor.game_output.connect(self.on_game_output)
+        # Every finished session is recorded with its resource usage
+        self.play_sessions = PlaySessionStore(
+            os.path.join(os.path.dirname(self.cp_games.full_config_path), PlaySessionStore.FILE_NAME))
+        self.process_supervisor.session_finished.connect(self.on_game_session_finished)
+        # Fork-server mode: pre-warm a runner once startup has settled
+        QTimer.singleShot(self.WARM_POOL_DELAY_MS, self.process_supervisor.start_warm_pool)
+        # Warm the page cache for the games most likely to be launched next
+        self.asset_prefetcher = AssetPrefetcher(self.cp_games, parent=self)
+        QTimer.singleShot(self.PREFETCH_DELAY_MS, self.asset_prefetcher.start)
+
+        self.use_virtual_grid = len(self.cp_games.get_all_games()) >= self.VIRTUAL_GRID_THRESHOLD
+        # The window style is set before any child widget exists, so it is applied as
+        # widgets are created instead of re-polishing the finished widget tree
+        self.apply_window_style()
         self.setup_ui()
+        STARTUP_PROFILER.mark('ui_setup')
         self.populate_game_grid() # Populate the grid with game cards
         self.populate_recently_played() # Initial populate for recently played
         self.populate_favorite_games() # Initial populate for favorites
-
+        STARTUP_PROFILER.mark('card_build')
+        self.setup_config_watcher() # Pick up edits made to games_config.json outside the launcher
+        QTimer.singleShot(0, self.cp_games.get_search_index) # Build the search index once the window is up
+        # Pending background saves must hit the disk before the process exits
+        QApplication.instance().aboutToQuit.connect(self.cp_games.close)
+        QApplication.instance().aboutToQuit.connect(self.process_supervisor.close)
+        QApplication.instance().aboutToQuit.connect(self.asset_prefetcher.close)
+
+    def apply_window_style(self):
+        """Applies the overall window stylesheet."""
         # Overall window style with a sophisticated gradient background.
         self.setStyleSheet("""
             QMainWindow {
@@ -1075,7 +2708,7 @@ class GameLauncherWindow(QMainWindow):
             QLineEdit:focus {
                 border: 2px solid #0099FF;
             }
-        """)
+        """ + (GameCard.CARD_STYLESHEET if GameCard.CHEAP_RENDERING else ""))
 
     def setup_ui(self):
         """
@@ -1140,6 +2773,10 @@ class GameLauncherWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search for games...")
         self.search_input.textChanged.connect(self.filter_game_cards)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_search_filter)
         main_layout.addWidget(self.search_input, alignment=Qt.AlignCenter)
         main_layout.addSpacing(20) # Space below search bar
 
@@ -1154,9 +2791,15 @@ class GameLauncherWindow(QMainWindow):
         """)
         main_layout.addWidget(self.favorites_label)
 
-        self.favorites_layout = QHBoxLayout()
-        self.favorites_layout.setAlignment(Qt.AlignLeft)
-        main_layout.addLayout(self.favorites_layout)
+        if self.use_virtual_grid:
+            self._setup_game_model()
+            self.favorites_view = self._create_game_view(self.favorites_proxy, strip=True)
+            main_layout.addWidget(self.favorites_view)
+        else:
+            self.favorites_layout = QHBoxLayout()
+            self.favorites_layout.setAlignment(Qt.AlignLeft)
+            self.favorites_layout.addStretch(1) # Cards are inserted before this stretch to stay left-aligned
+            main_layout.addLayout(self.favorites_layout)
         main_layout.addSpacing(30)
 
         # Recently Played Section
@@ -1170,22 +2813,32 @@ class GameLauncherWindow(QMainWindow):
         """)
         main_layout.addWidget(self.recently_played_label)
 
-        self.recently_played_layout = QHBoxLayout()
-        self.recently_played_layout.setAlignment(Qt.AlignLeft)
-        # Placeholder for recently played cards (will be populated dynamically)
-        main_layout.addLayout(self.recently_played_layout)
+        if self.use_virtual_grid:
+            self.recently_played_view = self._create_game_view(self.recent_proxy, strip=True)
+            main_layout.addWidget(self.recently_played_view)
+        else:
+            self.recently_played_layout = QHBoxLayout()
+            self.recently_played_layout.setAlignment(Qt.AlignLeft)
+            self.recently_played_layout.addStretch(1) # Cards are inserted before this stretch to stay left-aligned
+            # Placeholder for recently played cards (will be populated dynamically)
+            main_layout.addLayout(self.recently_played_layout)
         main_layout.addSpacing(30) # Space below recently played
 
-        # Scrollable area for all game cards
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff) # No horizontal scroll
-        self.scroll_area_content = QWidget()
-        self.game_grid_layout = QGridLayout(self.scroll_area_content)
-        self.game_grid_layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop) # Center items horizontally, align to top
-        self.game_grid_layout.setSpacing(25) # More spacing between cards
-        self.scroll_area.setWidget(self.scroll_area_content)
-        main_layout.addWidget(self.scroll_area)
+        if self.use_virtual_grid:
+            # Virtualized grid: only the visible cards are laid out and painted
+            self.game_grid_view = self._create_game_view(self.search_proxy, strip=False)
+            main_layout.addWidget(self.game_grid_view)
+        else:
+            # Scrollable area for all game cards
+            self.scroll_area = QScrollArea()
+            self.scroll_area.setWidgetResizable(True)
+            self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff) # No horizontal scroll
+            self.scroll_area_content = QWidget()
+            self.game_grid_layout = QGridLayout(self.scroll_area_content)
+            self.game_grid_layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop) # Center items horizontally, align to top
+            self.game_grid_layout.setSpacing(25) # More spacing between cards
+            self.scroll_area.setWidget(self.scroll_area_content)
+            main_layout.addWidget(self.scroll_area)
 
         # Launch button.
         self.launch_button = QPushButton("Launch Game")
@@ -1223,6 +2876,118 @@ class GameLauncherWindow(QMainWindow):
         self.launch_button.setEnabled(False) # Initially disabled until a game is selected
         main_layout.addWidget(self.launch_button, alignment=Qt.AlignCenter) # Center the button
 
+        # Launch status: launching / running / exited, as reported by the game process itself
+        self.launch_status_label = QLabel("")
+        self.launch_status_label.setAlignment(Qt.AlignCenter)
+        self.launch_status_label.setStyleSheet("color: #BBBBBB; font-size: 11pt;")
+        self.launch_status_label.hide() # Shown once there is something to report
+        main_layout.addWidget(self.launch_status_label)
+
+    def _setup_game_model(self):
+        """Creates the shared game model and the proxies used by the virtualized views."""
+        self.game_model = GameListModel(self.cp_games, self)
+
+        self.search_proxy = GameSearchProxyModel(self)
+        self.search_proxy.setSourceModel(self.game_model)
+
+        self.favorites_proxy = FavoriteGamesProxyModel(self)
+        self.favorites_proxy.setSourceModel(self.game_model)
+        self.favorites_proxy.sort(0)
+
+        self.recent_proxy = RecentlyPlayedProxyModel(count=3, parent=self)
+        self.recent_proxy.setSourceModel(self.game_model)
+        self.recent_proxy.sort(0)
+
+        self.game_views = []
+
+    def _create_game_view(self, model, strip):
+        """Creates a virtualized view (main grid or single-row strip) over `model`."""
+        if strip:
+            delegate = GameCardDelegate(card_size=120, icon_size=72, font_size=8)
+        else:
+            delegate = GameCardDelegate()
+        view = GameGridView(delegate, wrapping=not strip)
+        delegate.setParent(view)
+        view.setModel(model)
+        view.clicked.connect(lambda index, view=view: self._on_game_view_clicked(view, index))
+        delegate.favorite_toggled.connect(self.on_game_favorite_toggled)
+        self.game_views.append(view)
+        return view
+
+    def _on_game_view_clicked(self, clicked_view, index):
+        """Keeps a single selection across the virtualized views and forwards the click."""
+        for view in self.game_views:
+            if view is not clicked_view:
+                view.clearSelection()
+        self.on_game_card_clicked(index.data(GameListModel.NameRole))
+
+    def setup_config_watcher(self):
+        """
+        Watches games_config.json (and its directory, since an atomic replace drops
+        the file watch) so external edits are picked up without polling. Events are
+        coalesced with a short timer and only lead to a reload if the file's
+        mtime/inode actually changed, so the launcher's own saves are ignored.
+        The game directories are watched too, so game folders dropped in while the
+        launcher runs are added to the catalog.
+        """
+        self.config_reload_timer = QTimer(self)
+        self.config_reload_timer.setSingleShot(True)
+        self.config_reload_timer.setInterval(200)
+        self.config_reload_timer.timeout.connect(self.on_config_file_changed)
+
+        self.config_watcher = QFileSystemWatcher(self)
+        for path in self.cp_games.watched_paths():
+            if os.path.exists(path):
+                self.config_watcher.addPath(path)
+        self.config_watcher.addPath(os.path.dirname(self.cp_games.full_config_path))
+        self._watch_game_directories()
+        self.config_watcher.fileChanged.connect(lambda path: self.config_reload_timer.start())
+        self.config_watcher.directoryChanged.connect(lambda path: self.config_reload_timer.start())
+
+    def _watch_game_directories(self):
+        """Watches the directories where new game folders (or their main.py) may appear."""
+        watched = set(self.config_watcher.directories())
+        for path in self.cp_games.discovery.watch_paths():
+            if path not in watched:
+                self.config_watcher.addPath(path)
+
+    def on_config_file_changed(self):
+        """
+        Reloads the catalog if games_config.json changed on disk, adds newly discovered
+        game folders, and refreshes the views.
+        """
+        # Re-arm the file watches if a file was replaced or created
+        for path in self.cp_games.watched_paths():
+            if os.path.exists(path) and path not in self.config_watcher.files():
+                self.config_watcher.addPath(path)
+
+        old_names = [game['name'] for game in self.cp_games.get_all_games()]
+        reloaded = self.cp_games.reload_games_config()
+        discovered = self.cp_games.add_discovered_games()
+        self._watch_game_directories() # Folders created without a main.py yet
+        if not (reloaded or discovered):
+            return
+
+        if self.use_virtual_grid:
+            if [game['name'] for game in self.cp_games.get_all_games()] != old_names:
+                self.selected_game_name = None
+                self.update_launch_button()
+                self.game_model.reset_games()
+            else:
+                self.game_model.refresh_all()
+        elif [game['name'] for game in self.cp_games.get_all_games()] != old_names:
+            self.selected_game_card = None
+            self.selected_game_name = None
+            self.update_launch_button()
+            self.populate_game_grid() # The set of games changed, rebuild the grid
+        else:
+            for game_name, card in self.grid_cards.items():
+                card.set_game_data(self.cp_games.get_game_by_name(game_name))
+        self.populate_recently_played()
+        self.populate_favorite_games()
+        if self.search_input.text():
+            self.apply_search_filter() # The index was rebuilt from the new data
+
     def _clear_layout(self, layout):
         """Helper function to clear all widgets from a layout."""
         if layout is not None:
@@ -1242,13 +3007,20 @@ class GameLauncherWindow(QMainWindow):
     def populate_game_grid(self):
         """
         Populates the QGridLayout with GameCard widgets for all available games.
+        This is a full (re)build and is only needed when the set of games changes;
+        per-game changes such as favorite toggles are applied in place.
         """
+        if self.use_virtual_grid:
+            self.game_model.reset_games()
+            return
+
         self._clear_layout(self.game_grid_layout) # Clear existing cards first
+        self.grid_cards = {}
 
         game_data_list = self.cp_games.get_all_games()
         row = 0
         col = 0
-        max_cols = 5 # Number of columns in the grid
+        max_cols = self.GRID_COLUMNS
 
         if not game_data_list:
             # Display a message if no games are loaded
@@ -1263,6 +3035,7 @@ class GameLauncherWindow(QMainWindow):
             card.clicked.connect(self.on_game_card_clicked) # Connect card's click signal
             card.favorite_toggled.connect(self.on_game_favorite_toggled) # Connect favorite toggle signal
             self.game_grid_layout.addWidget(card, row, col)
+            self.grid_cards[game_data['name']] = card
             col += 1
             if col >= max_cols:
                 col = 0
@@ -1272,39 +3045,63 @@ class GameLauncherWindow(QMainWindow):
         if col > 0:
             for i in range(col, max_cols):
                 self.game_grid_layout.setColumnStretch(i, 1) # Stretch empty columns
-        
+
+    def _create_strip_card(self, game_data):
+        """Creates a smaller GameCard for the Favorites and Recently Played strips."""
+        card = GameCard(game_data, icon_size=72) # The icon cache hands out a 72px icon directly
+        card.setFixedSize(120, 120) # Smaller size for strip cards
+        card.set_strip(True) # Smaller, lighter name label
+        card.clicked.connect(self.on_game_card_clicked)
+        card.favorite_toggled.connect(self.on_game_favorite_toggled)
+        return card
+
+    def _sync_strip(self, layout, registry, games):
+        """
+        Brings a horizontal card strip in line with `games` by applying only the delta:
+        cards that are no longer listed are removed, missing ones are created, and
+        existing cards are rebound and moved into position. Untouched cards are reused.
+        """
+        wanted_names = [game['name'] for game in games]
+
+        for game_name in list(registry):
+            if game_name not in wanted_names:
+                card = registry.pop(game_name)
+                if card is self.selected_game_card:
+                    # Keep the selection alive on the main grid card for the same game
+                    self.selected_game_card = self.grid_cards.get(game_name)
+                    if self.selected_game_card:
+                        self.selected_game_card.set_selected(True)
+                layout.removeWidget(card)
+                card.setParent(None)
+                card.deleteLater()
+
+        for index, game_data in enumerate(games):
+            card = registry.get(game_data['name'])
+            if card is None:
+                card = self._create_strip_card(game_data)
+                registry[game_data['name']] = card
+            else:
+                card.set_game_data(game_data)
+                if layout.indexOf(card) == index:
+                    continue # Already in place
+                layout.removeWidget(card)
+            layout.insertWidget(index, card) # Inserted ahead of the trailing stretch
+
     def populate_recently_played(self):
         """Populates the recently played section."""
-        self._clear_layout(self.recently_played_layout) # Clear existing cards
-
-        self.cp_games.reload_games_config() # Ensure latest data
         recently_played_games = self.cp_games.get_recently_played_games(count=3) # Show top 3
 
         if not recently_played_games:
             self.recently_played_label.setText("No games played recently.")
         else:
             self.recently_played_label.setText("Recently Played:")
-            for game_data in recently_played_games:
-                card = GameCard(game_data)
-                card.setFixedSize(120, 120) # Smaller size for recently played
-                # Ensure icon scales correctly for smaller card
-                if card.icon_label.pixmap():
-                    card.icon_label.setPixmap(card.icon_label.pixmap().scaled(72, 72, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                else: # Fallback for generic emoji
-                    font = QFont()
-                    font.setPointSize(30) # Smaller font for emoji
-                    card.icon_label.setFont(font)
-                card.name_label.setStyleSheet("color: #F0F0F0; font-size: 8pt;")
-                card.clicked.connect(self.on_game_card_clicked)
-                card.favorite_toggled.connect(self.on_game_favorite_toggled) # Connect favorite toggle signal
-                self.recently_played_layout.addWidget(card)
-            self.recently_played_layout.addStretch(1) # Push cards to the left
+        if self.use_virtual_grid:
+            self.recent_proxy.refresh()
+            return
+        self._sync_strip(self.recently_played_layout, self.recent_cards, recently_played_games)
 
     def populate_favorite_games(self):
         """Populates the favorites section."""
-        self._clear_layout(self.favorites_layout) # Clear existing cards
-
-        self.cp_games.reload_games_config() # Ensure latest data
         favorite_games = self.cp_games.get_favorite_games()
 
         if not favorite_games:
@@ -1312,38 +3109,47 @@ class GameLauncherWindow(QMainWindow):
         else:
             self.favorites_label.setText("My Favorites:")
             # Sort favorites alphabetically for consistent display
-            favorite_games.sort(key=lambda x: x['name'].lower()) 
-            for game_data in favorite_games:
-                card = GameCard(game_data)
-                card.setFixedSize(120, 120) # Smaller size for favorites
-                if card.icon_label.pixmap():
-                    card.icon_label.setPixmap(card.icon_label.pixmap().scaled(72, 72, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                else:
-                    font = QFont()
-                    font.setPointSize(30)
-                    card.icon_label.setFont(font)
-                card.name_label.setStyleSheet("color: #F0F0F0; font-size: 8pt;")
-                card.clicked.connect(self.on_game_card_clicked)
-                card.favorite_toggled.connect(self.on_game_favorite_toggled)
-                self.favorites_layout.addWidget(card)
-            self.favorites_layout.addStretch(1) # Push cards to the left
+            favorite_games.sort(key=lambda x: x['name'].lower())
+        if self.use_virtual_grid:
+            return # The favorites proxy follows the model's dataChanged notifications
+        self._sync_strip(self.favorites_layout, self.favorite_cards, favorite_games)
+
+    def _find_card(self, game_name):
+        """Returns the card for a game, preferring the main grid, then Recently Played, then Favorites."""
+        for registry in (self.grid_cards, self.recent_cards, self.favorite_cards):
+            card = registry.get(game_name)
+            if card is not None:
+                return card
+        return None
 
 
     def filter_game_cards(self, text):
-        """Filters game cards based on search input."""
-        search_text = text.lower()
-        for i in range(self.game_grid_layout.count()):
-            item = self.game_grid_layout.itemAt(i)
-            if item and item.widget():
-                card_widget = item.widget()
-                if isinstance(card_widget, GameCard):
-                    game_name = card_widget.game_name.lower()
-                    game_description = card_widget.game_data.get('description', '').lower()
-                    game_category = card_widget.game_data.get('category', '').lower()
-                    if search_text in game_name or search_text in game_description or search_text in game_category:
-                        card_widget.show()
-                    else:
-                        card_widget.hide()
+        """
+        Filters game cards based on search input. The search itself runs once the
+        user pauses typing for SEARCH_DEBOUNCE_MS (see apply_search_filter).
+        """
+        self.search_timer.start()
+
+    def apply_search_filter(self):
+        """Queries the search index and applies the ranked result in one batched update."""
+        results = self.cp_games.get_search_index().search(self.search_input.text())
+        if self.use_virtual_grid:
+            self.search_proxy.set_search_results(results)
+            return
+
+        names = list(self.grid_cards) if results is None else [name for name in results if name in self.grid_cards]
+        visible = set(names)
+        # Re-place the matching cards in rank order with a single relayout
+        self.scroll_area_content.setUpdatesEnabled(False)
+        for game_name, card in self.grid_cards.items():
+            self.game_grid_layout.removeWidget(card)
+            if game_name not in visible:
+                card.hide()
+        for position, game_name in enumerate(names):
+            card = self.grid_cards[game_name]
+            self.game_grid_layout.addWidget(card, position // self.GRID_COLUMNS, position % self.GRID_COLUMNS)
+            card.show()
+        self.scroll_area_content.setUpdatesEnabled(True)
 
     def on_game_card_clicked(self, game_name):
         """
@@ -1354,46 +3160,22 @@ class GameLauncherWindow(QMainWindow):
         if self.selected_game_card:
             self.selected_game_card.set_selected(False)
 
-        # Find the new selected card widget across all layouts
-        found_card = None
-        # Search main grid
-        for i in range(self.game_grid_layout.count()):
-            item = self.game_grid_layout.itemAt(i)
-            if item and item.widget():
-                card_widget = item.widget()
-                if isinstance(card_widget, GameCard) and card_widget.game_name == game_name:
-                    found_card = card_widget
-                    break
-        # Search recently played
-        if not found_card:
-            for i in range(self.recently_played_layout.count()):
-                item = self.recently_played_layout.itemAt(i)
-                if item and item.widget():
-                    card_widget = item.widget()
-                    if isinstance(card_widget, GameCard) and card_widget.game_name == game_name:
-                        found_card = card_widget
-                        break
-        # Search favorites
-        if not found_card:
-            for i in range(self.favorites_layout.count()):
-                item = self.favorites_layout.itemAt(i)
-                if item and item.widget():
-                    card_widget = item.widget()
-                    if isinstance(card_widget, GameCard) and card_widget.game_name == game_name:
-                        found_card = card_widget
-                        break
-        
+        # Look the card up in the registries instead of scanning every layout
+        found_card = self._find_card(game_name)
+
         if found_card:
             self.selected_game_card = found_card
             self.selected_game_card.set_selected(True)
-        else:
+        elif not (self.use_virtual_grid and self.cp_games.get_game_by_name(game_name)):
+            # (The virtualized views track their own selection, there are no card widgets)
             print(f"Error: Clicked game card '{game_name}' not found in any layout.")
-            self.launch_button.setEnabled(False)
+            self.selected_game_name = None
+            self.update_launch_button()
             self.title_label.setText("Welcome to the Game Hub!")
             return
 
-
-        self.launch_button.setEnabled(True) # Enable launch button once a game is selected
+        self.selected_game_name = game_name
+        self.update_launch_button() # Enable launch button once a game is selected (unless it is already running)
         self.title_label.setText(f"Selected: {game_name.replace('_', ' ').title()} - Ready to Play!") # Update title to show selection
 
         # --- Game Info Dialog Logic ---
@@ -1418,10 +3200,15 @@ class GameLauncherWindow(QMainWindow):
     def on_game_favorite_toggled(self, game_name):
         """Handles the favorite toggle signal from a GameCard or GameInfoDialog."""
         self.cp_games.toggle_game_favorite(game_name)
-        # Reload all UI sections that display game cards to reflect the change
-        self.cp_games.reload_games_config() # Ensure in-memory data is fresh
-        self.populate_game_grid()
-        self.populate_recently_played()
+        game_data = self.cp_games.get_game_by_name(game_name)
+        if self.use_virtual_grid:
+            self.game_model.refresh_game(game_name) # Repaints the star, proxies re-filter
+        # Flip the star on the cards showing this game; everything else stays untouched
+        for registry in (self.grid_cards, self.recent_cards):
+            card = registry.get(game_name)
+            if card is not None:
+                card.set_game_data(game_data)
+        # Move the card into or out of the Favorites strip
         self.populate_favorite_games()
 
         # If the info dialog is open for this game, update its favorite status
@@ -1434,7 +3221,10 @@ class GameLauncherWindow(QMainWindow):
 
     def _show_new_info_dialog(self, game_data):
         """Helper to create and show a new game info dialog."""
-        self.game_info_dialog_instance = GameInfoDialog(game_data, self)
+        self.game_info_dialog_instance = GameInfoDialog(
+            game_data, self, output_log=self.process_supervisor.output_log(game_data['name']),
+            play_summary=self.play_sessions.summary(game_data['name']),
+            game_path=self.cp_games.get_game_path(game_data['name']))
         
         # Connect signals from the dialog to methods in the main window
         self.game_info_dialog_instance.play_game_requested.connect(self.launch_game_from_dialog)
@@ -1452,18 +3242,14 @@ class GameLauncherWindow(QMainWindow):
 
     def launch_game_from_dialog(self, game_name):
         """Launches a game when requested from the info dialog."""
-        # Find the game card for the given name and simulate a click
-        # This ensures the main launch logic (setting selected_game_card, etc.) is followed
-        for i in range(self.game_grid_layout.count()):
-            item = self.game_grid_layout.itemAt(i)
-            if item and item.widget():
-                card_widget = item.widget()
-                if isinstance(card_widget, GameCard) and card_widget.game_name == game_name:
-                    self.on_game_card_clicked(game_name) # Select the card
-                    self.launch_game() # Then launch it
-                    if self.game_info_dialog_instance:
-                        self.game_info_dialog_instance.close_dialog() # Close dialog after launch
-                    return
+        # Select the game's card and launch it, so the main launch logic
+        # (setting selected_game_card, etc.) is followed
+        if game_name in self.grid_cards or (self.use_virtual_grid and self.cp_games.get_game_by_name(game_name)):
+            self.on_game_card_clicked(game_name) # Select the card
+            self.launch_game() # Then launch it
+            if self.game_info_dialog_instance:
+                self.game_info_dialog_instance.close_dialog() # Close dialog after launch
+            return
         QMessageBox.warning(self, "Launch Error", f"Could not find game '{game_name}' to launch.")
 
 
@@ -1471,11 +3257,15 @@ class GameLauncherWindow(QMainWindow):
         """
         Launches the currently selected game.
         """
-        if not self.selected_game_card:
+        if not self.selected_game_name:
             QMessageBox.warning(self, "No Selection", "Please select a game before launching.")
             return
+        self.start_game(self.selected_game_name)
 
-        selected_game_name = self.selected_game_card.game_name
+    def start_game(self, selected_game_name):
+        """
+        Launches a game by name, whether or not its card is selected.
+        """
         game_data = self.cp_games.get_game_by_name(selected_game_name)
 
         if not game_data:
@@ -1488,18 +3278,40 @@ class GameLauncherWindow(QMainWindow):
         # No need to populate_favorite_games here unless playing affects favorite status (which it doesn't)
 
         game_type = game_data.get('type', 'non_gui') # Default to non_gui if type is missing
+        self._actual_launch_game(selected_game_name, game_type)
 
-        # Show "Launching..." state
-        original_button_text = self.launch_button.text()
-        self.launch_button.setText("Launching...")
-        self.launch_button.setEnabled(False) # Disable button during launch
-
-        # Simulate a small delay for the "Launching..." text to be visible
-        QApplication.processEvents() # Process UI events to update button text immediately
-        QTimer.singleShot(500, lambda: self._actual_launch_game(selected_game_name, game_type, original_button_text))
-
-    def _actual_launch_game(self, selected_game_name, game_type, original_button_text):
-        """Performs the actual game launch after a short delay."""
+    def handle_instance_request(self, argv):
+        """
+        Acts on the arguments of a second launch.py invocation: `--launch GAME` starts
+        the game here, anything else brings the launcher to the front. Returns an error
+        message for the other process, or None once the request is accepted.
+        """
+        if not game_cli.wants_cli(argv):
+            QTimer.singleShot(0, self.bring_to_front)
+            return None
+        try:
+            args = game_cli.build_parser().parse_args(argv)
+        except SystemExit:
+            return f"Invalid arguments: {' '.join(argv)}"
+        game = game_cli.find_game(self.cp_games, args.launch)
+        if game is None:
+            return f"Unknown game '{args.launch}'."
+        # Reply first: launching may show a message box, the other process shouldn't wait on it
+        QTimer.singleShot(0, lambda: self.start_game(game['name']))
+        return None
+
+    def bring_to_front(self):
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def _actual_launch_game(self, selected_game_name, game_type):
+        """
+        Performs the actual game launch. Non-GUI games report their own progress
+        (window created, first frame, exit) through the process supervisor.
+        """
         if game_type == 'gui' and selected_game_name in GAME_CLASS_MAP and issubclass(GAME_CLASS_MAP[selected_game_name], QWidget):
             game_window = GAME_CLASS_MAP[selected_game_name]()
             game_window.setWindowTitle(f"{selected_game_name.replace('_', ' ').title()} - Game")
@@ -1507,11 +3319,11 @@ class GameLauncherWindow(QMainWindow):
             # Store a reference to the game window to prevent it from being garbage collected
             self.game_window_instance = game_window
         else:
-            # For non-GUI games (like Pygame ones or console apps), use a thread to keep the launcher responsive.
+            # For non-GUI games (like Pygame ones or console apps), start a supervised child process.
             try:
-                # Replace spaces with underscores or adjust as per your actual folder names
-                game_folder = selected_game_name.replace(' ', '_')
-                game_path = os.path.join(os.getcwd(), game_folder)
+                # The game's folder, by default its name with spaces replaced by underscores
+                game_path = self.cp_games.get_game_path(selected_game_name)
+                game_folder = os.path.basename(game_path)
                 main_py_path = os.path.join(game_path, "main.py")
 
                 if not os.path.isdir(game_path):
@@ -1525,29 +3337,79 @@ class GameLauncherWindow(QMainWindow):
                                         "Please ensure each game folder contains a 'main.py' file.")
                     return
 
-                def run_non_gui_game():
-                    """Helper function to run the non-GUI game in a separate process."""
-                    original_cwd = os.getcwd()
-                    try:
-                        os.chdir(game_path) # Change to game's directory
-                        # Use subprocess.Popen without .wait() to keep the launcher responsive.
-                        # The console window for the launched game might appear.
-                        subprocess.Popen([sys.executable, "main.py"])
-                        print(f"--- Launched {selected_game_name}. Check your console/new window for game output. ---")
-                    except Exception as e:
-                        print(f"Error launching non-GUI game '{selected_game_name}': {e}")
-                    finally:
-                        os.chdir(original_cwd) # Change back to launcher's directory
-
-                threading.Thread(target=run_non_gui_game, daemon=True).start()
-                QMessageBox.information(self, "Game Launched",
-                                        f"{selected_game_name.replace('_', ' ').title()} is attempting to launch.")
+                # The game runs in its own folder (cwd=) so the launcher's working directory never changes.
+                # Progress, failures and queued launches are reported through the supervisor's signals.
+                self.asset_prefetcher.cancel() # Leave the disk to the game that is starting
+                self.process_supervisor.launch(selected_game_name, game_path)
             except Exception as e:
                 QMessageBox.critical(self, "Launch Error", f"Could not launch non-GUI game '{selected_game_name}': {e}")
-        
-        # Reset button state after launch attempt
-        self.launch_button.setText(original_button_text)
-        self.launch_button.setEnabled(True) # Re-enable after launch attempt
+
+    def update_launch_button(self):
+        """Reflects the selected game's launch state on the launch button."""
+        state = self.game_launch_states.get(self.selected_game_name)
+        if not self.selected_game_name:
+            self.launch_button.setText("Launch Game")
+            self.launch_button.setEnabled(False)
+        elif state in ('queued', 'launching'):
+            self.launch_button.setText("Launching...")
+            self.launch_button.setEnabled(False) # Disable button during launch
+        elif state == 'running':
+            self.launch_button.setText("Running")
+            self.launch_button.setEnabled(False)
+        else:
+            self.launch_button.setText("Launch Game")
+            self.launch_button.setEnabled(True)
+
+    def _set_launch_state(self, game_name, state, status):
+        self.game_launch_states[game_name] = state
+        self.launch_status_label.setText(status)
+        self.launch_status_label.show()
+        self.update_launch_button()
+
+    def on_game_process_started(self, game_name, pid):
+        session = self.process_supervisor.session(pid)
+        if session is not None and not session.reports_readiness:
+            # No readiness handshake available for this process; treat it as running
+            self._set_launch_state(game_name, 'running', f"{game_name} is running.")
+        else:
+            self._set_launch_state(game_name, 'launching', f"Launching {game_name}...")
+
+    def on_game_window_created(self, game_name, latency):
+        if self.game_launch_states.get(game_name) == 'launching':
+            self.launch_status_label.setText(f"Launching {game_name}... window opened after {latency:.2f}s")
+
+    def on_game_first_frame(self, game_name, latency, warm):
+        """Marks the game as running and stores its spawn-to-first-frame latency."""
+        self.cp_games.record_first_frame_latency(game_name, latency, warm)
+        mode = "pre-warmed" if warm else "cold start"
+        if self.asset_prefetcher.was_prefetched(game_name):
+            mode += ", assets prefetched"
+        self._set_launch_state(game_name, 'running', f"{game_name} is running (first frame after {latency:.2f}s, {mode}).")
+
+    def on_game_process_exited(self, game_name, exit_code, runtime):
+        """Marks the game as exited; the status line shows its exit code."""
+        self._set_launch_state(game_name, 'exited', f"{game_name} exited with code {exit_code} after {runtime:.1f}s.")
+        if not self.process_supervisor.running_sessions():
+            self.asset_prefetcher.start() # The ranking changed with this game's last_played
+
+    def on_game_launch_failed(self, game_name, error):
+        self._set_launch_state(game_name, 'exited', f"{game_name} failed to launch.")
+        QMessageBox.critical(self, "Launch Error", f"Could not launch non-GUI game '{game_name}': {error}")
+
+    def on_game_session_finished(self, session):
+        self.play_sessions.record(session.game_name, session.start_time, session.start_time + session.runtime,
+                                  session.exit_code, session.peak_rss_kb, session.cpu_time, session.warm)
+
+    def on_game_output(self, game_name):
+        """Refreshes the output panel of an open info dialog for this game."""
+        if self.game_info_dialog_instance and self.game_info_dialog_instance.isVisible() and \
+           self.game_info_dialog_instance.game_name == game_name:
+            self.game_info_dialog_instance.refresh_output()
+
+    def on_game_launch_queued(self, game_name):
+        self._set_launch_state(game_name, 'queued',
+                               f"{self.process_supervisor.max_concurrent} games are already running. "
+                               f"{game_name} will start when one of them exits.")
 
     def show_settings_dialog(self):
         """Shows the settings dialog."""
@@ -1558,7 +3420,6 @@ class GameLauncherWindow(QMainWindow):
             # This is a fallback in case direct refresh in settings dialog fails or is missed
             self.populate_recently_played()
             self.populate_favorite_games()
-            self.populate_game_grid()
 
 
 if __name__ == '__main__':
@@ -1570,7 +3431,35 @@ if __name__ == '__main__':
         except Exception:
             pass
 
+    # --profile-startup[=report.json] writes the startup phase timings to a report file
+    profile_args = [arg for arg in sys.argv[1:] if arg.split('=', 1)[0] == '--profile-startup']
+    if profile_args:
+        STARTUP_PROFILER.enabled = True
+        sys.argv = [arg for arg in sys.argv if arg not in profile_args]
+        report_path = profile_args[-1].partition('=')[2] or None
+
     app = QApplication(sys.argv)
+    STARTUP_PROFILER.mark('app_created')
+    instance_server = LauncherInstanceServer()
+    if not instance_server.claim():
+        # Another launcher started at the same moment and won the socket: defer to it
+        sys.exit(game_cli.forward_to_running_instance(sys.argv[1:]) or 0)
+    app.aboutToQuit.connect(instance_server.close)
     launcher = GameLauncherWindow()
+    instance_server.handler = launcher.handle_instance_request
+    if STARTUP_PROFILER.enabled:
+        class FirstPaintWatcher(QObject):
+            """Marks the first paint of the launcher, then the first idle turn of the event loop."""
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    launcher.removeEventFilter(self)
+                    STARTUP_PROFILER.mark('first_paint')
+                    QTimer.singleShot(0, lambda: (STARTUP_PROFILER.mark('interactive'),
+                                                  STARTUP_PROFILER.write_report(report_path)))
+                return False
+        first_paint_watcher = FirstPaintWatcher()
+        launcher.installEventFilter(first_paint_watcher)
+        app.aboutToQuit.connect(lambda: print(f"Icon cache stats: {ICON_CACHE.stats()}"))
     launcher.show()
+    STARTUP_PROFILER.mark('window_shown')
     sys.exit(app.exec_())
@@ -0,0 +1,80 @@
+"""
+Per-session play telemetry.
+
+Every finished game session is appended as one JSON line to play_sessions.jsonl
+next to games_config.json:
+    {"game": "Asteroids", "start": 1760684063.2, "end": 1760684400.9, "exit": 0,
+     "rss_kb": 84120, "cpu": 41.7, "warm": true}
+The file is only ever appended to, so recording a session costs one small write.
+PlaySessionStore keeps per-game aggregates (total playtime, average session,
+crash rate, peak memory) that are built from the file once and then updated with
+each new session. Nothing here imports PyQt5.
+"""
+import json
+
+
+class PlaySessionStore:
+    """Append-only store of finished play sessions, with per-game aggregates."""
+    FILE_NAME = 'play_sessions.jsonl'
+
+    def __init__(self, path):
+        self.path = path
+        self._totals = None # game name -> running aggregates, loaded on first use
+
+    def _load(self):
+        self._totals = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        self._add_to_totals(json.loads(line))
+                    except (ValueError, KeyError, TypeError):
+                        continue # A torn last line from a crash; the rest is still valid
+        except OSError:
+            pass # No sessions recorded yet
+
+    def _add_to_totals(self, record):
+        totals = self._totals.setdefault(record['game'], {
+            'sessions': 0, 'playtime': 0.0, 'crashes': 0, 'peak_rss_kb': None, 'cpu_time': 0.0, 'cpu_samples': 0,
+        })
+        totals['sessions'] += 1
+        totals['playtime'] += max(0.0, record['end'] - record['start'])
+        if record.get('exit'):
+            totals['crashes'] += 1
+        if record.get('rss_kb') is not None:
+            totals['peak_rss_kb'] = max(totals['peak_rss_kb'] or 0, record['rss_kb'])
+        if record.get('cpu') is not None:
+            totals['cpu_time'] += record['cpu']
+            totals['cpu_samples'] += 1
+
+    def record(self, game_name, start, end, exit_code, peak_rss_kb=None, cpu_time=None, warm=False):
+        """Appends one finished session. `start` and `end` are Unix timestamps."""
+        record = {'game': game_name, 'start': round(start, 1), 'end': round(end, 1), 'exit': exit_code,
+                  'rss_kb': peak_rss_kb, 'cpu': None if cpu_time is None else round(cpu_time, 2), 'warm': warm}
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        except OSError as e:
+            print(f"Could not record the play session in '{self.path}': {e}")
+        if self._totals is not None:
+            self._add_to_totals(record)
+
+    def summary(self, game_name):
+        """
+        Returns the aggregates of a game's recorded sessions, or None if it has none:
+        sessions, total_playtime and average_session (seconds), crash_rate (0..1),
+        peak_rss_kb (None if never measured) and average_cpu_time (seconds or None).
+        """
+        if self._totals is None:
+            self._load()
+        totals = self._totals.get(game_name)
+        if not totals:
+            return None
+        return {
+            'sessions': totals['sessions'],
+            'total_playtime': totals['playtime'],
+            'average_session': totals['playtime'] / totals['sessions'],
+            'crash_rate': totals['crashes'] / totals['sessions'],
+            'peak_rss_kb': totals['peak_rss_kb'],
+            'average_cpu_time': totals['cpu_time'] / totals['cpu_samples'] if totals['cpu_samples'] else None,
+        }
@@ -0,0 +1,123 @@
+import importlib.util
+import os
+import sys
+
+import pygame
+import pytest
+
+from gamebox_engine import animation
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def save_frames(folder, names, size=(4, 4)):
+    """Writes one solid-colored image per name and returns their paths."""
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for shade, name in enumerate(names):
+        surface = pygame.Surface(size)
+        surface.fill((shade * 8 % 256, 0, 0))
+        path = folder / name
+        pygame.image.save(surface, str(path))
+        paths.append(str(path))
+    return paths
+
+
+def test_clip_is_immutable():
+    clip = animation.AnimationClip(['a', 'b'], frame_ticks=3, loop=False)
+    assert (len(clip), clip.frame(1), clip.frame_ticks, clip.loop) == (2, 'b', 3, False)
+    with pytest.raises(AttributeError):
+        clip.loop = True
+    assert isinstance(clip.frames, tuple)
+
+
+def test_looping_clip_wraps_around():
+    playhead = animation.Playhead(animation.AnimationClip(['a', 'b', 'c']))
+    images = []
+    for _ in range(5):
+        playhead.update()
+        images.append(playhead.image)
+    assert images == ['b', 'c', 'a', 'b', 'c']
+    assert not playhead.finished
+
+
+def test_frame_ticks_hold_each_frame():
+    playhead = animation.Playhead(animation.AnimationClip(['a', 'b'], frame_ticks=3))
+    images = []
+    for _ in range(6):
+        playhead.update()
+        images.append(playhead.image)
+    assert images == ['a', 'a', 'b', 'b', 'b', 'a']
+
+
+def test_non_looping_clip_finishes_on_its_last_frame():
+    playhead = animation.Playhead(animation.AnimationClip(['a', 'b'], frame_ticks=2, loop=False))
+    states = []
+    for _ in range(6):
+        playhead.update()
+        states.append((playhead.image, playhead.finished))
+    # Like the sprites' own counters: the last frame is shown for its ticks, then the clip is done
+    assert states == [('a', False), ('b', False), ('b', False), ('b', True), ('b', True), ('b', True)]
+    assert playhead.index == 1
+
+
+def test_step_moves_one_frame_regardless_of_ticks():
+    playhead = animation.Playhead(animation.AnimationClip(['a', 'b'], frame_ticks=100, loop=False))
+    playhead.step()
+    assert (playhead.image, playhead.finished) == ('b', False)
+    playhead.step()
+    assert (playhead.image, playhead.finished) == ('b', True)
+
+
+def test_play_switches_clip_with_or_without_restarting():
+    right = animation.AnimationClip(['r0', 'r1', 'r2'])
+    left = animation.AnimationClip(['l0', 'l1', 'l2'])
+    playhead = animation.Playhead(right)
+    playhead.step()
+
+    playhead.play(left, restart=False) # Turning around mid-walk keeps the step
+    assert playhead.image == 'l1'
+    playhead.play(right)
+    assert (playhead.image, playhead.ticks, playhead.finished) == ('r0', 0, False)
+
+
+def test_load_clip_is_shared_per_paths_and_options(tmp_path):
+    paths = save_frames(tmp_path, ['1.png', '2.png'])
+    clip = animation.load_clip(paths, frame_ticks=5)
+
+    assert animation.load_clip(paths, frame_ticks=5) is clip
+    assert animation.load_clip(paths, frame_ticks=5, flip_x=True) is not clip
+    assert animation.load_clip(paths, frame_ticks=5, loop=False) is not clip
+    scaled = animation.load_clip(paths, frame_ticks=5, scale=(8, 8))
+    assert scaled.frame(0).get_size() == (8, 8)
+
+
+@pytest.fixture
+def bounce_world(tmp_path, monkeypatch):
+    """Bounce's world module, imported from a folder holding the images it loads."""
+    save_frames(tmp_path / 'Tiles', [f'{index}.png' for index in range(1, 29)])
+    save_frames(tmp_path / 'Assets' / 'Exit', [f'tile{index}.png' for index in range(12)])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(os.path.join(REPO_DIR, 'Bounce'))
+    spec = importlib.util.spec_from_file_location('bounce_world', os.path.join(REPO_DIR, 'Bounce', 'world.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    sys.modules.pop('enemies', None) # Bounce's sibling module, not to be confused with other games'
+
+
+def test_bounce_exit_opens_to_index_11_and_stays(bounce_world):
+    exit_door = bounce_world.Exit(0, 0)
+    for _ in range(20):
+        exit_door.update(0)
+    assert exit_door.index == 0 # Closed doors don't animate
+
+    exit_door.open = True
+    indexes = []
+    for _ in range(70):
+        exit_door.update(0)
+        indexes.append(exit_door.index)
+    assert indexes[4] == 1 and indexes[3] == 0 # A frame every 5 updates, as before
+    assert indexes.index(11) == 54
+    assert indexes[-1] == 11
+    assert exit_door.image is exit_door.animation.clip.frame(11)
@@ -0,0 +1,74 @@
+import pygame
+import pytest
+
+from gamebox_engine.assets import SurfaceCache
+
+RED = (255, 0, 0, 255)
+BLUE = (0, 0, 255, 255)
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    """A 4x2 image: red on the left half, blue on the right."""
+    surface = pygame.Surface((4, 2), pygame.SRCALPHA)
+    surface.fill(RED, pygame.Rect(0, 0, 2, 2))
+    surface.fill(BLUE, pygame.Rect(2, 0, 2, 2))
+    path = tmp_path / 'sprite.png'
+    pygame.image.save(surface, str(path))
+    return str(path)
+
+
+@pytest.fixture
+def cache():
+    return SurfaceCache()
+
+
+def test_same_parameters_share_one_surface(cache, image_path, tmp_path, monkeypatch):
+    first = cache.load(image_path, scale=[8, 4])
+    monkeypatch.chdir(tmp_path)
+    assert cache.load('sprite.png', scale=(8, 4)) is first # Relative path and list scale, same key
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_variants_are_derived_from_one_decode(cache, image_path):
+    plain = cache.load(image_path)
+    scaled = cache.load(image_path, scale=(8, 4))
+    flipped = cache.load(image_path, flip_x=True)
+
+    assert cache.stats()['decodes'] == 1
+    assert scaled.get_size() == (8, 4)
+    assert tuple(plain.get_at((0, 0))) == RED
+    assert tuple(flipped.get_at((0, 0))) == BLUE
+    assert len({id(plain), id(scaled), id(flipped)}) == 3
+
+
+def test_flip_is_applied_before_scaling(cache, image_path):
+    surface = cache.load(image_path, scale=(8, 4), flip_x=True)
+    assert tuple(surface.get_at((0, 0))) == BLUE
+    assert tuple(surface.get_at((7, 3))) == RED
+
+
+def test_colorkey_variant_does_not_leak_into_the_shared_surface(cache, image_path):
+    plain = cache.load(image_path, alpha=False)
+    keyed = cache.load(image_path, alpha=False, colorkey=(255, 0, 0))
+
+    assert keyed is not plain
+    assert keyed.get_colorkey()[:3] == (255, 0, 0)
+    assert plain.get_colorkey() is None
+    assert cache.load(image_path, alpha=False) is plain
+
+
+def test_alpha_and_opaque_variants_are_separate(cache, image_path):
+    with_alpha = cache.load(image_path)
+    opaque = cache.load(image_path, alpha=False)
+    assert with_alpha is not opaque
+    assert cache.stats()['decodes'] == 2
+
+
+def test_clear_drops_every_surface(cache, image_path):
+    first = cache.load(image_path)
+    cache.clear()
+    assert cache.stats()['entries'] == 0
+    assert cache.stats()['bytes'] == 0
+    assert cache.load(image_path) is not first
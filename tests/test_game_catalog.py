@@ -0,0 +1,180 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from game_catalog import CPGames, DebouncedConfigWriter
+
+
+def write_config(games):
+    with open(CPGames.CONFIG_FILE, 'w', encoding='utf-8') as f:
+        json.dump(games, f, indent=4)
+
+
+def read_config():
+    with open(CPGames.CONFIG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def catalog_dir(tmp_path, monkeypatch):
+    """A launcher directory with two games in games_config.json and their folders."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('GAMEBOX_STORAGE', raising=False)
+    games = [
+        {"name": "Snake", "description": "Eat and grow.", "type": "non_gui", "category": "Arcade",
+         "last_played": None, "isFavorite": False},
+        {"name": "Tic Tac Toe", "description": "Three in a row.", "type": "non_gui", "category": "Board Game",
+         "last_played": None, "isFavorite": False},
+    ]
+    for game in games:
+        folder = tmp_path / game['name'].replace(' ', '_')
+        folder.mkdir()
+        (folder / 'main.py').write_text('')
+    write_config(games)
+    return tmp_path
+
+
+@pytest.fixture
+def catalog(catalog_dir):
+    cp_games = CPGames(use_sqlite=False)
+    yield cp_games
+    cp_games.close()
+
+
+def test_reload_is_skipped_while_the_file_is_unchanged(catalog):
+    assert not catalog.has_config_changed()
+    assert catalog.reload_games_config() is False
+
+
+def test_external_edit_is_reloaded_into_the_same_dictionaries(catalog):
+    snake = catalog.get_game_by_name('Snake')
+    games = read_config()
+    games[0]['category'] = 'Classic'
+    write_config(games)
+    os.utime(CPGames.CONFIG_FILE, ns=(0, 0)) # A different signature even on coarse mtime clocks
+
+    assert catalog.has_config_changed()
+    assert catalog.reload_games_config() is True
+    assert catalog.get_game_by_name('Snake') is snake # Views holding the dictionary stay current
+    assert snake['category'] == 'Classic'
+    assert not catalog.has_config_changed()
+
+
+def test_own_save_is_not_taken_for_an_external_change(catalog):
+    catalog.toggle_game_favorite('Snake')
+    catalog.flush()
+
+    assert read_config()[0]['isFavorite'] is True
+    assert not catalog.has_config_changed()
+    assert catalog.reload_games_config() is False
+
+
+def test_forced_reload_rereads_an_unchanged_file(catalog):
+    catalog.get_game_by_name('Snake')['description'] = 'Changed in memory only'
+    assert catalog.reload_games_config(force=True) is True
+    assert catalog.get_game_by_name('Snake')['description'] == 'Eat and grow.'
+
+
+class RecordingWrite:
+    """A write_func that records its snapshots and can be made to fail."""
+    def __init__(self, failures=0):
+        self.snapshots = []
+        self.failures = failures
+        self.written = threading.Event()
+
+    def __call__(self, snapshot):
+        if self.failures:
+            self.failures -= 1
+            self.written.set()
+            raise OSError("disk full")
+        self.snapshots.append(snapshot)
+        self.written.set()
+
+
+def test_writer_coalesces_a_burst_into_one_write_of_the_latest_snapshot():
+    write = RecordingWrite()
+    writer = DebouncedConfigWriter(write, delay=0.05)
+    for version in range(5):
+        writer.schedule([version])
+    assert writer.is_dirty()
+    assert write.written.wait(2)
+    time.sleep(0.1) # No second write follows
+    writer.close()
+
+    assert write.snapshots == [[4]]
+    assert not writer.is_dirty()
+
+
+def test_writer_flush_writes_the_pending_snapshot_right_away():
+    write = RecordingWrite()
+    writer = DebouncedConfigWriter(write, delay=60)
+    writer.schedule(['pending'])
+    writer.flush()
+
+    assert write.snapshots == [['pending']]
+    assert not writer.is_dirty()
+    writer.close()
+    assert write.snapshots == [['pending']] # Nothing left for close() to write
+
+
+def test_writer_close_writes_what_is_still_pending():
+    write = RecordingWrite()
+    writer = DebouncedConfigWriter(write, delay=60)
+    writer.schedule(['first'])
+    writer.schedule(['second'])
+    writer.close()
+
+    assert write.snapshots == [['second']]
+
+
+def test_writer_keeps_a_failed_background_write_for_the_next_flush():
+    write = RecordingWrite(failures=1)
+    writer = DebouncedConfigWriter(write, delay=0.01)
+    writer.schedule(['data'])
+    assert write.written.wait(2)
+    while writer._writing:
+        time.sleep(0.01)
+
+    assert writer.is_dirty()
+    writer.flush()
+    assert write.snapshots == [['data']]
+    writer.close()
+
+
+def test_catalog_changes_are_saved_in_the_background(catalog, monkeypatch):
+    writes = []
+    original_write = catalog._write_config_file
+    monkeypatch.setattr(catalog.config_writer, '_write_func', lambda data: (writes.append(data), original_write(data)))
+    catalog.toggle_game_favorite('Tic Tac Toe')
+    catalog.toggle_game_favorite('Snake')
+
+    deadline = time.monotonic() + 5
+    while catalog.config_writer.is_dirty() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert len(writes) == 1 # Both toggles in one write, without a flush
+    assert [game['isFavorite'] for game in read_config()] == [True, True]
+
+
+def test_discovered_games_are_shown_but_saved_only_once_used(catalog_dir):
+    (catalog_dir / 'New_Game').mkdir()
+    (catalog_dir / 'New_Game' / 'main.py').write_text('')
+    before = read_config()
+
+    cp_games = CPGames(use_sqlite=False)
+    try:
+        assert cp_games.get_game_by_name('New Game') is not None
+        cp_games.toggle_game_favorite('Snake')
+        cp_games.flush()
+        assert [game['name'] for game in read_config()] == [game['name'] for game in before]
+
+        cp_games.reload_games_config(force=True)
+        assert cp_games.get_game_by_name('New Game') is not None # Still shown after a reload
+
+        cp_games.update_game_last_played('New Game')
+        cp_games.flush()
+        assert read_config()[-1]['name'] == 'New Game'
+    finally:
+        cp_games.close()
@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+from game_discovery import GameDiscovery
+
+
+def make_game(root, folder):
+    path = root / folder
+    path.mkdir(parents=True, exist_ok=True)
+    (path / GameDiscovery.ENTRY_POINT).write_text('')
+    return path
+
+
+def touch_dir(path, offset):
+    """Gives a directory a new mtime, so the change is visible even on coarse clocks."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset * 1_000_000_000))
+
+
+def warm_manifest(root):
+    """Scans until the manifest is current: creating it is itself a change of the root directory."""
+    GameDiscovery(str(root)).scan()
+    GameDiscovery(str(root)).scan()
+
+
+@pytest.fixture
+def root(tmp_path):
+    make_game(tmp_path, 'Snake')
+    make_game(tmp_path, 'Tic_Tac_Toe')
+    (tmp_path / 'Work_In_Progress').mkdir()
+    make_game(tmp_path, 'gamebox_engine')
+    (tmp_path / 'gamebox_engine' / '__init__.py').write_text('')
+    make_game(tmp_path, 'logs')
+    make_game(tmp_path, '.hidden')
+    return tmp_path
+
+
+def test_scan_finds_folders_with_a_main_py(root):
+    games = GameDiscovery(str(root)).scan()
+    assert games == [{'name': 'Snake', 'path': 'Snake'}, {'name': 'Tic Tac Toe', 'path': 'Tic_Tac_Toe'}]
+
+
+def test_packages_and_launcher_folders_are_not_watched(root):
+    discovery = GameDiscovery(str(root))
+    discovery.scan()
+    assert sorted(discovery.watch_paths()) == [str(root), str(root / 'Work_In_Progress')]
+
+
+def test_unchanged_library_is_served_from_the_manifest(root):
+    warm_manifest(root)
+    discovery = GameDiscovery(str(root))
+    games = discovery.scan()
+
+    assert [game['name'] for game in games] == ['Snake', 'Tic Tac Toe']
+    assert discovery.stats == {'dirs_listed': 0, 'folders_checked': 0}
+
+
+def test_main_py_added_to_a_known_folder_rechecks_only_that_folder(root):
+    warm_manifest(root)
+    make_game(root, 'Work_In_Progress')
+    touch_dir(root / 'Work_In_Progress', 1)
+
+    discovery = GameDiscovery(str(root))
+    games = discovery.scan()
+    assert {'name': 'Work In Progress', 'path': 'Work_In_Progress'} in games
+    assert discovery.stats == {'dirs_listed': 0, 'folders_checked': 1}
+
+
+def test_new_and_removed_folders_relist_the_search_directory(root):
+    GameDiscovery(str(root)).scan()
+    make_game(root, 'Pong')
+    (root / 'Snake' / 'main.py').unlink()
+    (root / 'Snake').rmdir()
+    touch_dir(root, 1)
+
+    discovery = GameDiscovery(str(root))
+    names = [game['name'] for game in discovery.scan()]
+    assert names == ['Pong', 'Tic Tac Toe']
+    assert discovery.stats['dirs_listed'] == 1
+
+
+def test_manifest_of_another_version_is_ignored(root):
+    GameDiscovery(str(root)).scan()
+    manifest_path = root / GameDiscovery.MANIFEST_FILE
+    manifest = json.loads(manifest_path.read_text())
+    manifest['version'] = GameDiscovery.MANIFEST_VERSION - 1
+    manifest_path.write_text(json.dumps(manifest))
+
+    discovery = GameDiscovery(str(root))
+    discovery.scan()
+    assert discovery.stats['dirs_listed'] == 1
+
+
+def test_extra_search_directories(root):
+    make_game(root, 'games/console_game')
+    discovery = GameDiscovery(str(root), search_dirs=('.', 'games'))
+    assert {'name': 'console game', 'path': 'games/console_game'} in discovery.scan()
@@ -0,0 +1,40 @@
+import json
+import os
+
+import pytest
+
+import icons
+
+
+@pytest.fixture
+def icon_dir(tmp_path, monkeypatch):
+    """An empty launcher directory to build the icons in; the atlases are left out."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(icons.ICONS_DIR)
+    monkeypatch.setattr(icons, 'atlas_is_current', lambda: True)
+    return tmp_path
+
+
+def built_hashes():
+    with open(icons.ICONS_MANIFEST, 'r', encoding='utf-8') as f:
+        return json.load(f)['built']
+
+
+def test_changing_one_theme_rebuilds_only_that_icon(icon_dir, monkeypatch):
+    icons.build_icons(jobs=1)
+    before = built_hashes()
+    assert icons.build_icons(jobs=1) == 0
+
+    monkeypatch.setitem(icons.GAME_THEMES, 'Snake', dict(icons.GAME_THEMES['Snake'], shape_color=(0, 0, 255)))
+    assert icons.build_icons(jobs=1) == 1
+    after = built_hashes()
+    snake_icon = os.path.join(icons.ICONS_DIR, icons.icon_filename('Snake'))
+    assert {path for path in after if after[path] != before.get(path)} == {snake_icon}
+
+
+def test_a_different_font_changes_every_build_hash(monkeypatch):
+    before = [digest for _, digest, _, _ in icons.icon_build_targets()]
+    font_path = icons.get_font_path
+    monkeypatch.setattr(icons, 'get_font_path', lambda is_emoji=False: 'other.ttf' if is_emoji else font_path(False))
+    after = [digest for _, digest, _, _ in icons.icon_build_targets()]
+    assert all(old != new for old, new in zip(before, after))
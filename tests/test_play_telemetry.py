@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from play_telemetry import PlaySessionStore
+
+
+@pytest.fixture
+def sessions_path(tmp_path):
+    return tmp_path / PlaySessionStore.FILE_NAME
+
+
+def test_game_without_sessions_has_no_summary(sessions_path):
+    assert PlaySessionStore(str(sessions_path)).summary('Snake') is None
+
+
+def test_sessions_are_appended_as_json_lines(sessions_path):
+    store = PlaySessionStore(str(sessions_path))
+    store.record('Snake', 1000.0, 1060.0, 0, peak_rss_kb=50000, cpu_time=12.345, warm=True)
+    store.record('Pong', 2000.0, 2030.0, 1)
+
+    records = [json.loads(line) for line in sessions_path.read_text().splitlines()]
+    assert records == [
+        {'game': 'Snake', 'start': 1000.0, 'end': 1060.0, 'exit': 0, 'rss_kb': 50000, 'cpu': 12.35, 'warm': True},
+        {'game': 'Pong', 'start': 2000.0, 'end': 2030.0, 'exit': 1, 'rss_kb': None, 'cpu': None, 'warm': False},
+    ]
+
+
+def test_summary_aggregates_playtime_crashes_and_resources(sessions_path):
+    store = PlaySessionStore(str(sessions_path))
+    store.record('Snake', 0.0, 60.0, 0, peak_rss_kb=40000, cpu_time=10.0)
+    store.record('Snake', 100.0, 130.0, -9, peak_rss_kb=90000)
+    store.record('Snake', 200.0, 230.0, 0, cpu_time=20.0)
+    store.record('Pong', 0.0, 5.0, 0)
+
+    assert store.summary('Snake') == {
+        'sessions': 3, 'total_playtime': 120.0, 'average_session': 40.0, 'crash_rate': pytest.approx(1 / 3),
+        'peak_rss_kb': 90000, 'average_cpu_time': 15.0,
+    }
+    assert store.summary('Pong')['peak_rss_kb'] is None
+    assert store.summary('Pong')['average_cpu_time'] is None
+
+
+def test_summary_is_updated_by_sessions_recorded_after_loading(sessions_path):
+    store = PlaySessionStore(str(sessions_path))
+    store.record('Snake', 0.0, 10.0, 0)
+    assert store.summary('Snake')['sessions'] == 1 # Loads the file
+
+    store.record('Snake', 20.0, 40.0, 0)
+    assert store.summary('Snake')['total_playtime'] == 30.0
+    assert PlaySessionStore(str(sessions_path)).summary('Snake') == store.summary('Snake')
+
+
+def test_torn_last_line_is_skipped(sessions_path):
+    PlaySessionStore(str(sessions_path)).record('Snake', 0.0, 10.0, 0)
+    with open(sessions_path, 'a', encoding='utf-8') as f:
+        f.write('{"game": "Snake", "start": 20.0, "e')
+
+    assert PlaySessionStore(str(sessions_path)).summary('Snake')['sessions'] == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from game_catalog import GameSearchIndex
+
+GAMES = [
+    {'name': 'Snake', 'category': 'Arcade', 'description': 'Eat apples and grow longer.'},
+    {'name': 'Snakes and Ladders', 'category': 'Board Game', 'description': 'Roll the dice.'},
+    {'name': 'Tetris', 'category': 'Puzzle', 'description': 'Falling blocks.'},
+    {'name': 'Pong', 'category': 'Arcade', 'description': 'Two paddles and a ball, like a snake charmer.'},
+    {'name': 'Asteroids', 'category': 'Arcade', 'description': None},
+]
+
+
+@pytest.fixture
+def index():
+    return GameSearchIndex(GAMES)
+
+
+def test_query_without_tokens_returns_none(index):
+    assert index.search('') is None
+    assert index.search('  -- ') is None
+
+
+def test_exact_name_beats_prefix_beats_description(index):
+    assert index.search('snake') == ['Snake', 'Snakes and Ladders', 'Pong']
+
+
+def test_category_matches_keep_catalog_order_on_ties(index):
+    assert index.search('puzzle') == ['Tetris']
+    assert index.search('arcade') == ['Snake', 'Pong', 'Asteroids'] # Equal scores keep catalog order
+
+
+def test_substring_matches_inside_tokens(index):
+    assert index.search('adder') == ['Snakes and Ladders']
+    assert index.search('addle') == ['Pong']
+
+
+def test_every_query_token_must_match(index):
+    assert index.search('snake board') == ['Snakes and Ladders']
+    assert index.search('snake puzzle') == []
+
+
+def test_search_is_case_and_punctuation_insensitive(index):
+    assert index.search('TETRIS!') == ['Tetris']
+
+
+def test_short_tokens_match_without_trigrams(index):
+    assert index.search('po') == ['Pong']
+
+
+def test_misspelling_falls_back_to_fuzzy_matches(index):
+    assert index.search('tetirs') == ['Tetris']
+    assert index.search('tetirs', fuzzy=False) == []
+
+
+def test_fuzzy_fallback_only_applies_to_tokens_without_real_matches(index):
+    # 'snake' matches for real, so it doesn't also pull in names spelled like it
+    assert 'Tetris' not in index.search('snake')
+    assert index.search('asterods arcade') == ['Asteroids']